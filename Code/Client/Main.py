@@ -2,8 +2,11 @@
 import sys
 import os
 import math
+import operator
+import struct
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Callable
 import cv2
 import numpy as np
@@ -39,12 +42,37 @@ Z_MIN: int = -20
 Z_MAX: int = 20
 Z_INIT: int = 0
 
-TIMER_REFRESH_MS: int = 10
 TIMER_POWER_MS: int = 3000
 TIMER_SONIC_MS: int = 100
 TIMER_PHOTO_MS: int = 100
+# Face detection runs on a downscaled grayscale frame
+FACE_DETECT_SCALE: float = 0.5
+FACE_MIN_SIZE: tuple = (40, 40)
+FACE_MAX_SIZE: tuple = (200, 200)
+# Mouse drags collapse into at most one pad command per window
+TIMER_COALESCE_MS: int = 20
+# Commands queued within this window go out in one send
+TIMER_TX_MS: int = 5
+# Mouse moves closer than this in time or distance to the last one are dropped
+MOUSE_MIN_MS: int = 8
+MOUSE_MIN_PX: int = 2
+# LED colour changes within this window collapse into one CMD_LED
+LED_DEBOUNCE_MS: int = 30
+
+# Steering-wheel geometry (radius 100 px): half-chord by offset from the
+# centre, and the rim point by whole degree
+SQRT_TABLE = np.round(np.sqrt(10000 - np.arange(-100, 101) ** 2)).astype(np.int16).tolist()
+COS_TABLE = np.round(100 * np.cos(np.radians(np.arange(360)))).astype(np.int16).tolist()
+SIN_TABLE = np.round(100 * np.sin(np.radians(np.arange(360)))).astype(np.int16).tolist()
+
+# Linear pad-to-command scales (the source ranges are symmetric about zero)
+MOVE_SCALE: float = 35 / 100        # 0..100 px  -> 0..35
+ATTITUDE_SCALE: float = 15 / 100    # +-100 px   -> +-15
+POSITION_SCALE: float = 40 / 100    # +-100 px   -> +-40
 
 from enum import Enum, auto
+import collections
+import selectors
 import socket
 import time
 import threading
@@ -57,8 +85,8 @@ from src.utils.exceptions import (
     TimeoutError,
     InvalidStateError
 )
-from src.core.thread_safe import ThreadSafeValue, ThreadSafeCounter
-from src.utils.logging_config import get_logger
+from src.utils.logging_config import configure_logging, get_logger
+from src.utils.jpeg import decode_jpeg, encode_jpeg
 from src.utils.utils import retry, handle_errors, log_duration
 
 logger = get_logger(__name__)
@@ -72,7 +100,48 @@ class ConnectionState(Enum):
     ERROR = auto()
 
 
-class NetworkManager:
+class PadRegion(Enum):
+    """Which part of the control pads a mouse position falls on."""
+    ATTITUDE = auto()
+    POSITION = auto()
+    STEERING_INNER = auto()
+    STEERING_OUTER = auto()
+    OUTSIDE = auto()    # away from every pad; a wheel drag follows the rim
+    NONE = auto()       # between the attitude and position boxes; ignored
+
+
+class SocketBufPool:
+    """Bounded free-list of reusable receive buffers for the network threads."""
+
+    def __init__(self, count: int, size: int) -> None:
+        """Preallocate the pool.
+
+        Args:
+            count: Maximum number of idle buffers kept in the pool
+            size: Size in bytes of each buffer
+        """
+        self._size = size
+        self._cap = count
+        self._q = collections.deque(bytearray(size) for _ in range(count))
+
+    def acquire(self) -> bytearray:
+        """Take a buffer from the pool, allocating a new one if it is empty."""
+        try:
+            return self._q.pop()
+        except IndexError:
+            return bytearray(self._size)
+
+    def release(self, buf: bytearray) -> None:
+        """Return a buffer to the pool; surplus buffers are dropped."""
+        if len(self._q) < self._cap:
+            self._q.append(buf)
+
+
+# Shared by the video and instruction threads (~2x the active stream count)
+POOL = SocketBufPool(4, 65536)  # buffers must hold NetworkManager.RECV_CHUNK
+
+
+class NetworkManager(QObject):
     """
     Manages network connections and background threads for the Hexapod Robot client.
     
@@ -80,11 +149,25 @@ class NetworkManager:
     command sending/receiving, and automatic reconnection with exponential backoff.
     """
     
+    # Emitted on the network thread once a decoded frame is staged on the client
+    frameReady = pyqtSignal()
+    # (bgr, gray, seq) for each new frame while face_frames is set
+    faceFrame = pyqtSignal(object, object, int)
+    
     # Network timeouts in seconds
     CONNECT_TIMEOUT = 5.0
     SOCKET_TIMEOUT = 1.0
     RECONNECT_DELAY = 2.0
     MAX_RECONNECT_ATTEMPTS = 3
+
+    # Bytes requested per recv call (one TCP window-sized read)
+    RECV_CHUNK = 65536
+    # Kernel receive buffer for the video socket, sized for bursts of JPEG frames
+    VIDEO_RCVBUF = 1 << 20
+    # Each video frame is a JPEG preceded by its little-endian 32-bit length
+    FRAME_HEADER = struct.Struct('<L')
+    # Largest frame accepted from the robot, as in src.core.video
+    MAX_FRAME_SIZE = 10 * 1024 * 1024
     
     def __init__(self, client: 'Client') -> None:
         """Initialize the NetworkManager with a client instance.
@@ -92,27 +175,38 @@ class NetworkManager:
         Args:
             client: The Client instance to manage network connections for.
         """
+        super().__init__()
         self.client = client
-        self._state = ThreadSafeValue(ConnectionState.DISCONNECTED, name="connection_state")
+        # Resolved once; the client may not implement the hook
+        self._client_state_cb = getattr(client, 'on_connection_state_changed', None)
+        # Plain int so the thread loops can read the state without a lock
+        self._state_int = ConnectionState.DISCONNECTED.value
         self._lock = threading.RLock()
         self._stop_event = threading.Event()
-        self._reconnect_attempts = ThreadSafeCounter(name="reconnect_attempts")
+        # Set while CONNECTED so the network thread can block instead of polling
+        self._connected_event = threading.Event()
+        # Only touched on connect/error paths; guarded by _lock
+        self._reconnect_attempts = 0
         
         # Network components
-        self.video_thread: Optional[threading.Thread] = None
-        self.instruction_thread: Optional[threading.Thread] = None
+        self.network_thread: Optional[threading.Thread] = None
         self.video_socket: Optional[socket.socket] = None
         self.instruction_socket: Optional[socket.socket] = None
         self.video_label: Optional[Any] = None
+        # Called on the network thread with each decoded BGR frame
+        self.frame_handler: Optional[Callable[[np.ndarray], None]] = None
+        # Set while the face window listens to faceFrame
+        self.face_frames = False
+        self._frame_seq = 0
         
         # Connection details
         self.ip: Optional[str] = None
         self.port: Optional[int] = None
         self.video_port: Optional[int] = None
         
-        # Thread control flags
-        self._video_thread_running = False
-        self._instruction_thread_running = False
+        # Thread control flag and partial-frame buffer for the video socket
+        self._threads_running = False
+        self._video_buffer = bytearray()
 
     @property
     def is_connected(self) -> bool:
@@ -123,7 +217,7 @@ class NetworkManager:
     @property
     def state(self) -> ConnectionState:
         """Get the current connection state."""
-        return self._state.value
+        return ConnectionState(self._state_int)
     
     def _set_state(self, new_state: ConnectionState) -> None:
         """Safely update the connection state.
@@ -131,10 +225,15 @@ class NetworkManager:
         Args:
             new_state: The new connection state
         """
-        old_state = self._state.value
-        if old_state != new_state:
-            self._state.value = new_state
-            self._on_state_changed(old_state, new_state)
+        with self._lock:
+            old_state = ConnectionState(self._state_int)
+            if old_state != new_state:
+                self._state_int = new_state.value
+                if new_state == ConnectionState.CONNECTED:
+                    self._connected_event.set()
+                else:
+                    self._connected_event.clear()
+                self._on_state_changed(old_state, new_state)
     
     def _on_state_changed(self, old_state: ConnectionState, new_state: ConnectionState) -> None:
         """Handle connection state changes.
@@ -146,9 +245,10 @@ class NetworkManager:
         logger.info(f"Connection state changed: {old_state.name} -> {new_state.name}")
         
         # Notify client of state changes if needed
-        if hasattr(self.client, 'on_connection_state_changed'):
+        state_cb = self._client_state_cb
+        if state_cb is not None:
             try:
-                self.client.on_connection_state_changed(old_state, new_state)
+                state_cb(old_state, new_state)
             except Exception as e:
                 logger.error(f"Error in connection state change handler: {e}", exc_info=True)
     
@@ -188,7 +288,7 @@ class NetworkManager:
             
             # Connect to video port
             try:
-                self.video_socket = self._create_socket()
+                self.video_socket = self._create_socket(rcvbuf=self.VIDEO_RCVBUF)
                 self.video_socket.connect((self.ip, self.video_port))
                 logger.info(f"Connected to video port {self.video_port}")
             except (socket.error, OSError) as e:
@@ -206,7 +306,8 @@ class NetworkManager:
                 # Start communication threads
                 self.start_threads()
                 self._set_state(ConnectionState.CONNECTED)
-                self._reconnect_attempts.value = 0
+                with self._lock:
+                    self._reconnect_attempts = 0
                 return True
                 
             except Exception as e:
@@ -217,9 +318,12 @@ class NetworkManager:
             self._handle_connection_error(f"Connection failed: {e}")
             raise
 
-    def _create_socket(self) -> socket.socket:
+    def _create_socket(self, rcvbuf: Optional[int] = None) -> socket.socket:
         """Create and configure a new socket.
         
+        Args:
+            rcvbuf: Optional SO_RCVBUF size in bytes
+            
         Returns:
             socket.socket: Configured socket
             
@@ -230,6 +334,10 @@ class NetworkManager:
             sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             sock.settimeout(self.SOCKET_TIMEOUT)
             sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            # Commands are tiny; don't let Nagle hold them back
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            if rcvbuf is not None:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, rcvbuf)
             return sock
         except socket.error as e:
             raise NetworkError(f"Failed to create socket: {e}") from e
@@ -243,14 +351,12 @@ class NetworkManager:
         self._stop_event.set()
         
         # Stop and clean up threads
-        self._stop_threads()
+        self.stop_threads()
         
-        # Close sockets
+        # Close sockets (the client's socket attributes alias these two)
         sockets_to_close = [
             (self.instruction_socket, 'instruction'),
             (self.video_socket, 'video'),
-            (getattr(self.client, 'client_socket', None), 'client_socket'),
-            (getattr(self.client, 'client_socket1', None), 'client_socket1')
         ]
         
         for sock, name in sockets_to_close:
@@ -265,44 +371,36 @@ class NetworkManager:
         # Reset socket references
         self.instruction_socket = None
         self.video_socket = None
-        
-        if hasattr(self.client, 'client_socket'):
-            self.client.client_socket = None
-        if hasattr(self.client, 'client_socket1'):
-            self.client.client_socket1 = None
+        self.client.client_socket = None
+        self.client.client_socket1 = None
             
         self._stop_event.clear()
         logger.info("Disconnected from robot")
 
     def stop_threads(self) -> None:
-        """Safely stop all background threads with proper cleanup."""
+        """Safely stop the network thread with proper cleanup."""
         with self._lock:
-            if not self._video_thread_running and not self._instruction_thread_running:
+            if not self._threads_running:
                 return
             
             self._stop_event.set()
+            # Wake a thread parked waiting for a connection so it sees the stop
+            self._connected_event.set()
             
-            threads = []
-            if self.video_thread and self.video_thread.is_alive():
-                threads.append((self.video_thread, "video"))
-            if self.instruction_thread and self.instruction_thread.is_alive():
-                threads.append((self.instruction_thread, "instruction"))
-            
-            for thread, name in threads:
+            thread = self.network_thread
+            if thread and thread.is_alive() and thread is not threading.current_thread():
                 try:
                     thread.join(timeout=2.0)
                     if thread.is_alive():
-                        logger.warning(f"{name} thread did not terminate gracefully")
+                        logger.warning("network thread did not terminate gracefully")
                 except Exception as e:
-                    logger.error(f"Error stopping {name} thread: {e}")
+                    logger.error(f"Error stopping network thread: {e}")
             
-            self.video_thread = None
-            self.instruction_thread = None
-            self._video_thread_running = False
-            self._instruction_thread_running = False
+            self.network_thread = None
+            self._threads_running = False
 
     def start_threads(self) -> None:
-        """Start the video and instruction processing threads.
+        """Start the network thread serving the video and instruction sockets.
         
         Raises:
             InvalidStateError: If not connected or threads are already running
@@ -311,112 +409,152 @@ class NetworkManager:
             raise InvalidStateError("Cannot start threads: Not connected to robot")
             
         with self._lock:
-            if self._video_thread_running or self._instruction_thread_running:
+            if self._threads_running:
                 raise InvalidStateError("Threads are already running")
             
-            # Start video thread
-            self._stop_event.clear()
-            self._video_thread_running = True
-            self.video_thread = threading.Thread(
-                target=self._video_thread_func,
-                name="VideoThread"
-            )
-            self.video_thread.daemon = True
-            self.video_thread.start()
+            # One selector demultiplexes both sockets on a single thread; the
+            # sockets are non-blocking so an idle socket never raises a timeout
+            self.video_socket.setblocking(False)
+            self.instruction_socket.setblocking(False)
+            selector = selectors.DefaultSelector()
+            selector.register(self.video_socket, selectors.EVENT_READ, self._on_video_ready)
+            selector.register(self.instruction_socket, selectors.EVENT_READ, self._on_instruction_ready)
+            self._video_buffer = bytearray()
             
-            # Start instruction thread
-            self._instruction_thread_running = True
-            self.instruction_thread = threading.Thread(
-                target=self._instruction_thread_func,
-                name="InstructionThread"
+            self._stop_event.clear()
+            self._threads_running = True
+            self.network_thread = threading.Thread(
+                target=self._network_thread_func,
+                args=(selector,),
+                name="NetworkThread"
             )
-            self.instruction_thread.daemon = True
-            self.instruction_thread.start()
+            self.network_thread.daemon = True
+            self.network_thread.start()
             
-            logger.info("Started network threads")
+            logger.info("Started network thread")
 
-    def _video_thread_func(self) -> None:
-        """Thread function for receiving and processing video frames."""
-        if not self.video_socket:
-            logger.error("Video socket not initialized")
-            return
-            
-        buffer = b''
-        while self._video_thread_running and not self._stop_event.is_set():
-            try:
-                # Check connection state
-                if self.state != ConnectionState.CONNECTED:
-                    time.sleep(0.1)
-                    continue
-                    
-                # Receive data from socket
+    def _network_thread_func(self, selector: selectors.BaseSelector) -> None:
+        """Thread function dispatching readiness events for both sockets.
+        
+        Args:
+            selector: Selector with the video and instruction sockets registered
+        """
+        # Bind hot-loop lookups to locals once per connection
+        select = selector.select
+        stopped = self._stop_event.is_set
+        wait_connected = self._connected_event.wait
+        try:
+            while self._threads_running and not stopped():
                 try:
-                    data = self.video_socket.recv(4096)
-                    if not data:
-                        raise ConnectionError("Connection closed by remote host")
-                    buffer += data
+                    # Block while disconnected; _set_state and stop_threads wake us
+                    if not wait_connected(timeout=0.5) or stopped():
+                        continue
                     
-                    # Process complete frames (implementation depends on protocol)
-                    # This is a simplified example - adjust based on actual protocol
-                    while b'\n' in buffer:
-                        frame_data, buffer = buffer.split(b'\n', 1)
-                        self._process_video_frame(frame_data)
+                    try:
+                        for key, _ in select(timeout=0.5):
+                            key.data()
+                    except BlockingIOError:
+                        # Spurious readiness; nothing to read after all
+                        continue
+                    except (socket.error, ConnectionError) as e:
+                        if not stopped():
+                            self._handle_connection_error(f"Network thread error: {e}")
+                        break
                         
-                except socket.timeout:
-                    continue
-                except (socket.error, ConnectionError) as e:
-                    if not self._stop_event.is_set():
-                        self._handle_connection_error(f"Video thread error: {e}")
+                except Exception as e:
+                    logger.error(f"Unexpected error in network thread: {e}", exc_info=True)
+                    if not stopped():
+                        time.sleep(0.1)  # Prevent tight loop on errors
+        finally:
+            selector.close()
+
+    def _on_video_ready(self) -> None:
+        """Receive one chunk from the video socket and dispatch complete frames.
+        
+        Raises:
+            ConnectionError: If the remote host closed the connection or sent
+                an invalid frame length
+        """
+        # Accumulate into a growable bytearray and let the kernel write
+        # straight into a pooled buffer, so each recv costs O(len(data))
+        # instead of re-copying the whole accumulator.
+        buffer = self._video_buffer
+        buf = POOL.acquire()
+        try:
+            n = self.video_socket.recv_into(buf, self.RECV_CHUNK)
+            if not n:
+                raise ConnectionError("Connection closed by remote host")
+            buffer.extend(memoryview(buf)[:n])
+        finally:
+            POOL.release(buf)
+        
+        # Walk every complete length-prefixed frame, then drop the consumed
+        # prefix in one go so only the partial tail is kept
+        header = self.FRAME_HEADER
+        view = memoryview(buffer)
+        pos = 0
+        try:
+            while len(buffer) - pos >= header.size:
+                length = header.unpack_from(buffer, pos)[0]
+                if length > self.MAX_FRAME_SIZE:
+                    # The stream can't be resynchronised after a bad header
+                    raise ConnectionError(f"Invalid video frame length: {length}")
+                end = pos + header.size + length
+                if end > len(buffer):
                     break
-                    
-            except Exception as e:
-                logger.error(f"Unexpected error in video thread: {e}", exc_info=True)
-                if not self._stop_event.is_set():
-                    time.sleep(0.1)  # Prevent tight loop on errors
-
-    def _instruction_thread_func(self) -> None:
-        """Thread function for sending and receiving instructions."""
-        if not self.instruction_socket:
-            logger.error("Instruction socket not initialized")
-            return
+                if length:
+                    self._process_video_frame(bytes(view[pos + header.size:end]))
+                pos = end
+        finally:
+            view.release()
+            del buffer[:pos]
+
+    def _on_instruction_ready(self) -> None:
+        """Receive one chunk from the instruction socket and dispatch it.
+        
+        Raises:
+            ConnectionError: If the remote host closed the connection
+        """
+        buf = POOL.acquire()
+        try:
+            n = self.instruction_socket.recv_into(buf, self.RECV_CHUNK)
+            if not n:
+                raise ConnectionError("Connection closed by remote host")
             
-        while self._instruction_thread_running and not self._stop_event.is_set():
-            try:
-                # Check connection state
-                if self.state != ConnectionState.CONNECTED:
-                    time.sleep(0.1)
-                    continue
-                    
-                # Receive data from socket
-                try:
-                    data = self.instruction_socket.recv(4096)
-                    if not data:
-                        raise ConnectionError("Connection closed by remote host")
-                    
-                    # Process received data (implementation depends on protocol)
-                    # This is a simplified example - adjust based on actual protocol
-                    self._process_instruction(data)
-                    
-                except socket.timeout:
-                    continue
-                except (socket.error, ConnectionError) as e:
-                    if not self._stop_event.is_set():
-                        self._handle_connection_error(f"Instruction thread error: {e}")
-                    break
-                    
-            except Exception as e:
-                logging.error(f"Unexpected error in instruction thread: {e}", exc_info=True)
-                if not self._stop_event.is_set():
-                    time.sleep(0.1)  # Prevent tight loop on errors
+            # Process received data (implementation depends on protocol)
+            # This is a simplified example - adjust based on actual protocol
+            self._process_instruction(bytes(memoryview(buf)[:n]))
+        finally:
+            POOL.release(buf)
 
     def _process_video_frame(self, frame_data: bytes) -> None:
-        """Process a received video frame.
+        """Decode a received video frame and stage it on the client.
+        
+        Runs on the network thread so JPEG decoding stays off the GUI thread.
+        Emits frameReady once the frame is staged.
         
         Args:
-            frame_data: Raw video frame data
+            frame_data: Raw JPEG frame data
         """
-        # TO DO: Implement video frame processing
-        pass
+        # Each frame is a fresh array rather than a slot in a reused ring:
+        # FrameDecoder and the faceFrame slots hold it across threads past
+        # the next decode, and cv2.imdecode can't write into a given buffer
+        image = decode_jpeg(frame_data)
+        if image is None:
+            logger.debug("Dropped undecodable video frame")
+            return
+        handler = self.frame_handler
+        if handler is not None:
+            handler(image)
+        self.client.image = image
+        # video_flag False means "new frame available"; the consumer sets it back
+        self.client.video_flag = False
+        self._frame_seq += 1
+        self.frameReady.emit()
+        if self.face_frames:
+            # Converted once here so the face window doesn't redo it per slot
+            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+            self.faceFrame.emit(image, gray, self._frame_seq)
 
     def _process_instruction(self, data: bytes) -> None:
         """Process received instruction data.
@@ -433,41 +571,86 @@ class NetworkManager:
         Args:
             error: Error message
         """
-        logging.error(error)
+        logger.error(error)
         self._set_state(ConnectionState.ERROR)
         self.stop_threads()
 
-    def _create_socket(self) -> socket.socket:
-        """Create a new socket with default settings."""
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(self.SOCKET_TIMEOUT)
-        return sock
+class FrameDecoder(QObject):
+    """Wraps BGR frames as QImages on a worker thread."""
+    frameReady = pyqtSignal(QImage)
+
+    def __init__(self) -> None:
+        super().__init__()
+        # Frame the last emitted QImage reads from; Qt doesn't copy it
+        self._frame: Optional[np.ndarray] = None
 
-class VideoHandler:
+    @pyqtSlot(object)
+    def decode(self, bgr: np.ndarray) -> None:
+        try:
+            # Format_BGR888 takes OpenCV's byte order as is: no cvtColor pass.
+            # Frames are never reused and VideoHandler keeps one in flight,
+            # so the array stays untouched until the GUI has painted it
+            frame = self._frame = np.ascontiguousarray(bgr)
+            height, width = frame.shape[:2]
+            self.frameReady.emit(QImage(frame.data, width, height, frame.strides[0], QImage.Format_BGR888))
+        except Exception:
+            logger.exception("Error in FrameDecoder.decode")
+            # A null image still releases VideoHandler's in-flight gate
+            self.frameReady.emit(QImage())
+
+
+class VideoHandler(QObject):
     """Manages video refresh and photo capture for the main video label."""
+    # Hands a raw frame to the decoder thread
+    decodeRequested = pyqtSignal(object)
+
     def __init__(self, client: 'Client', video_label: QLabel) -> None:
+        super().__init__()
         self.client = client
         self.video_label = video_label
         self.camera_recorder = CameraRecorder(output_dir='Captures', video_label=video_label)
+        self._pix = QPixmap()
+        # At most one frame is in flight so the decoder never overwrites
+        # the QImage the GUI thread is still painting
+        self._decoding = False
+        self._decoder = FrameDecoder()
+        self._decoder_thread = QThread()
+        self._decoder.moveToThread(self._decoder_thread)
+        self.decodeRequested.connect(self._decoder.decode)
+        self._decoder.frameReady.connect(self._show_frame)
+        self._decoder_thread.start()
+
+    def stop(self) -> None:
+        """Stop the decoder thread."""
+        self._decoder_thread.quit()
+        self._decoder_thread.wait()
+
+    def _show_frame(self, image: QImage) -> None:
+        # Null when the frame couldn't be decoded; keep the last one shown
+        if not image.isNull():
+            self._pix.convertFromImage(image)
+            self.video_label.setPixmap(self._pix)
+        self._decoding = False
+        # A newer frame arrived while this one was being decoded
+        if self.client.video_flag == False:
+            self.refresh_image()
 
     def refresh_image(self) -> None:
-        if self.client.video_flag == False:
-            height, width, bytesPerComponent = self.client.image.shape
-            cv2.cvtColor(self.client.image, cv2.COLOR_BGR2RGB, self.client.image)
-            QImg = QImage(self.client.image.data.tobytes(), width, height, 3 * width, QImage.Format_RGB888)
-            self.video_label.setPixmap(QPixmap.fromImage(QImg))
+        if self.client.video_flag == False and not self._decoding:
+            self._decoding = True
             self.client.video_flag = True
+            self.decodeRequested.emit(self.client.image)
 
     def take_photo(self) -> None:
         try:
             try:
                 self.client.send_data(cmd.CMD_BUZZER + '#1' + '\n') 
                 self.client.send_data(cmd.CMD_LED + '#1' + '\n')
-            except Exception as e:
-                print(e)
+            except Exception:
+                logger.exception("Error in VideoHandler.take_photo")
             QtCore.QTimer.singleShot(120, self._capture_photo_and_buzz_off)
-        except Exception as e:
-            print(e)
+        except Exception:
+            logger.exception("Error in VideoHandler.take_photo")
 
     def _capture_photo_and_buzz_off(self) -> None:
         try:
@@ -476,136 +659,151 @@ class VideoHandler:
             else:
                 pix = None
             saved_path = self.camera_recorder.capture(pixmap=pix if pix is not None else None)
-            print('Photo saved to:', saved_path)
-        except Exception as e:
-            print(e)
+            logger.info("Photo saved to: %s", saved_path)
+        except Exception:
+            logger.exception("Error in VideoHandler._capture_photo_and_buzz_off")
         finally:
             try:
                 self.client.send_data(cmd.CMD_BUZZER + '# 0' + '\n') 
                 self.client.send_data(cmd.CMD_LED + '#0' + '\n')
-            except Exception as e:
-                print(e)
+            except Exception:
+                logger.exception("Error in VideoHandler._capture_photo_and_buzz_off")
 
 class UIManager:
     """Opens auxiliary windows bound to the same client (LED, Face, Calibration)."""
-    def __init__(self, client: 'Client', parent_window: QMainWindow) -> None:
+    def __init__(self, client: 'Client', parent_window: QMainWindow,
+                 network: Optional[NetworkManager] = None) -> None:
         self.client = client
         self.parent = parent_window
+        self.network = network
         self.calibration_window = None
         self.led_window = None
         self.face_window = None
 
     def show_calibration_window(self) -> None:
         command = cmd.CMD_CALIBRATION + '\n'
-        self.client.send_data(command)
+        self.parent.send_now(command)
         self.calibration_window = CalibrationWindow(self.client)
         self.calibration_window.setWindowModality(Qt.ApplicationModal)
         self.calibration_window.show()
 
     def show_led_window(self) -> None:
         try:
-            self.led_window = LedWindow(self.client)
+            # Built once: the embedded colour dialog is costly to set up
+            if self.led_window is None:
+                self.led_window = LedWindow(self.client)
             self.led_window.setWindowModality(Qt.ApplicationModal)
             self.led_window.show()
-        except Exception as e:
-            print(e)
+        except Exception:
+            logger.exception("Error in UIManager.show_led_window")
 
     def show_face_window(self) -> None:
         try:
-            self.face_window = FaceWindow(self.client)
+            self.face_window = FaceWindow(self.client, self.network)
             self.face_window.setWindowModality(Qt.ApplicationModal)
             self.face_window.show()
             self.client.fece_id = True
-        except Exception as e:
-            print(e)
+        except Exception:
+            logger.exception("Error in UIManager.show_face_window")
 
 class RobotController:
     """Maps UI state to robot commands (no UI ownership)."""
+    # Pre-encoded command templates; % formatting against ints yields bytes directly
+    _MOVE_FMT = (cmd.CMD_MOVE + "#%d#%d#%d#%d#%d\n").encode()
+    _ATT_FMT = (cmd.CMD_ATTITUDE + "#%d#%d#%d\n").encode()
+    _POS_FMT = (cmd.CMD_POSITION + "#%d#%d#%d\n").encode()
+    _HEAD_FMT = (cmd.CMD_HEAD + "#%d#%d\n").encode()
+
     def __init__(self, client: 'Client', ui: QMainWindow) -> None:
         self.client = client
         self.ui = ui
         self.action_flag = 1
         self.gait_flag = 1
 
-    def map(self, value: float, fromLow: float, fromHigh: float, toLow: float, toHigh: float) -> float:
-        return (toHigh - toLow) * (value - fromLow) / (fromHigh - fromLow) + toLow
+    @staticmethod
+    def turn_angle(x: float, y: float) -> float:
+        """Fold the pad direction into a -10..10 turn value.
+
+        0 straight ahead, +-10 at +-90 degrees, back to 0 straight behind.
+        """
+        a = math.degrees(math.atan2(x, y))
+        # Fold into [-90, 90]; round() ties to even keep exactly +-90 at +-10
+        return (a - 180.0 * round(a / 180.0)) / 9.0
 
     def move(self) -> None:
         try:
-            x = self.map((self.ui.move_point[0]-325),0,100,0,35)
-            y = self.map((635 - self.ui.move_point[1]),0,100,0,35)
+            move_point = self.ui.move_point
+            x = (move_point[0] - 325) * MOVE_SCALE
+            y = (635 - move_point[1]) * MOVE_SCALE
             if self.action_flag == 1:
                 angle = 0
             else:
-                if x!=0 or y!=0:
-                    angle=math.degrees(math.atan2(x,y))
-                    if angle < -90 and angle >= -180:
-                        angle=angle+360
-                    if angle >= -90 and angle <=90:
-                        angle = self.map(angle, -90, 90, -10, 10)
-                    else:
-                        angle = self.map(angle, 270, 90, 10, -10)
-                else:
-                    angle=0
+                angle = self.turn_angle(x, y)
             speed=self.client.move_speed
-            command = cmd.CMD_MOVE+ "#"+str(self.gait_flag)+"#"+str(round(x))+"#"+str(round(y))\
-                      +"#"+str(speed)+"#"+str(round(angle)) +'\n'
-            print(command)
-            self.client.send_data(command)
-        except Exception as e:
-            print(e)
+            command = self._MOVE_FMT % (self.gait_flag, round(x), round(y), int(speed), round(angle))
+            logger.debug("%s", command)
+            self.ui.send_now(command)
+        except Exception:
+            logger.exception("Failed to send move command")
 
     def relax(self) -> None:
         try:
-            if self.ui.Button_Relax.text() == "Relax":
-                self.ui.Button_Relax.setText("Relaxed")
+            ui = self.ui
+            ui.relaxed = not ui.relaxed
+            if ui.relaxed:
+                ui.Button_Relax.setText("Relaxed")
                 command = cmd.CMD_SERVOPOWER + "#" + "0" + '\n'
             else:
-                self.ui.Button_Relax.setText("Relax")
+                ui.Button_Relax.setText("Relax")
                 command = cmd.CMD_SERVOPOWER + "#" + "1" + '\n'
-            print(command)
-            self.client.send_data(command)
-        except Exception as e:
-            print(e)
+            logger.debug("%s", command)
+            self.ui.send_now(command)
+        except Exception:
+            logger.exception("Failed to send relax command")
 
     def attitude(self) -> None:
-        r = self.map((self.ui.drawpoint[0][0]-800), -100, 100, -15, 15)
-        p = self.map((180-self.ui.drawpoint[0][1]), -100, 100, -15, 15)
+        point = self.ui.drawpoint[0]
+        r = (point[0] - 800) * ATTITUDE_SCALE
+        p = (180 - point[1]) * ATTITUDE_SCALE
         y=self.ui.slider_roll.value()
-        command = cmd.CMD_ATTITUDE+ "#" + str(round(r)) + "#" + str(round(p)) + "#" + str(round(y)) + '\n'
-        print(command)
-        self.client.send_data(command)
+        command = self._ATT_FMT % (round(r), round(p), round(y))
+        logger.debug("%s", command)
+        self.ui.send_now(command)
 
     def position(self) -> None:
-        x = self.map((self.ui.drawpoint[1][0]-800), -100, 100, -40, 40)
-        y = self.map((650-self.ui.drawpoint[1][1]), -100, 100, -40, 40)
+        point = self.ui.drawpoint[1]
+        x = (point[0] - 800) * POSITION_SCALE
+        y = (650 - point[1]) * POSITION_SCALE
         z=self.ui.slider_Z.value()
-        command = cmd.CMD_POSITION+ "#" + str(round(x)) + "#" + str(round(y)) + "#" + str(round(z)) + '\n'
-        print(command)
-        self.client.send_data(command)
+        command = self._POS_FMT % (round(x), round(y), round(z))
+        logger.debug("%s", command)
+        self.ui.send_now(command)
 
     def buzzer(self) -> None:
-        if self.ui.Button_Buzzer.text() == 'Buzzer':
+        self.ui.buzzer_on = not self.ui.buzzer_on
+        if self.ui.buzzer_on:
             command=cmd.CMD_BUZZER+'#1'+'\n'
-            self.client.send_data(command)
+            self.ui.send_now(command)
             self.ui.Button_Buzzer.setText('Noise')
         else:
             command=cmd.CMD_BUZZER+'#0'+'\n'
-            self.client.send_data(command)
+            self.ui.send_now(command)
             self.ui.Button_Buzzer.setText('Buzzer')
 
     def imu(self) -> None:
-        if self.ui.Button_IMU.text()=='Balance':
+        self.ui.imu_on = not self.ui.imu_on
+        if self.ui.imu_on:
             command=cmd.CMD_BALANCE+'#1'+'\n'
-            self.client.send_data(command)
+            self.ui.send_now(command)
             self.ui.Button_IMU.setText("Close")
         else:
             command=cmd.CMD_BALANCE+'#0'+'\n'
-            self.client.send_data(command)
+            self.ui.send_now(command)
             self.ui.Button_IMU.setText('Balance')
 
     def sonic(self) -> None:
-        if self.ui.Button_Sonic.text() == 'Sonic':
+        self.ui.sonic_on = not self.ui.sonic_on
+        if self.ui.sonic_on:
             self.ui.timer_sonic.start(TIMER_SONIC_MS)
             self.ui.Button_Sonic.setText('Close')
         else:
@@ -614,19 +812,59 @@ class RobotController:
 
     def get_sonic_data(self) -> None:
         command=cmd.CMD_SONIC+'\n'
-        self.client.send_data(command)
+        self.ui.send_now(command)
 
     def power(self) -> None:
         try:
             command = cmd.CMD_POWER + '\n'
-            self.client.send_data(command)
+            self.ui.send_now(command)
             self.ui.progress_Power1.setFormat(str(self.ui.power_value[0])+"V")
             self.ui.progress_Power2.setFormat(str(self.ui.power_value[1]) + "V")
             self.ui.progress_Power1.setValue(self.ui.restriction(round((float(self.ui.power_value[0]) - 5.00) / 3.40 * 100), 0, 100))
             self.ui.progress_Power2.setValue(self.ui.restriction(round((float(self.ui.power_value[1]) - 7.00) / 1.40 * 100), 0, 100))
-        except Exception as e:
-            print(e)
+        except Exception:
+            logger.exception("Failed to update power readout")
+
+# (widget, signal, handler path on MyWindow) wired once by MyWindow._setup_buttons
+BUTTON_BINDINGS: Tuple[Tuple[str, str, str], ...] = (
+    # Control buttons
+    ('Button_Connect', 'clicked', 'connect'),
+    ('Button_Video', 'clicked', 'video'),
+    ('Button_IMU', 'clicked', 'controller.imu'),
+    ('Button_Sonic', 'clicked', 'controller.sonic'),
+    ('Button_Relax', 'clicked', 'controller.relax'),
+    ('Button_Take_Photo', 'clicked', 'video_handler.take_photo'),
+    ('Button_Face_Recognition', 'clicked', 'face_recognition'),
+    # Buzzer button has press/release events
+    ('Button_Buzzer', 'pressed', 'controller.buzzer'),
+    ('Button_Buzzer', 'released', 'controller.buzzer'),
+    # Window control buttons
+    ('Button_Calibration', 'clicked', 'ui_manager.show_calibration_window'),
+    ('Button_LED', 'clicked', 'ui_manager.show_led_window'),
+    ('Button_Face_ID', 'clicked', 'ui_manager.show_face_window'),
+)
+
+# Shortcut key -> MyWindow method, resolved once by MyWindow._setup_key_table
+KEY_BINDINGS: Dict[int, str] = {
+    Qt.Key_C: 'connect',
+    Qt.Key_V: 'video',
+    Qt.Key_R: 'relax',
+    Qt.Key_L: 'show_led_window',
+    Qt.Key_B: 'imu',
+    Qt.Key_F: 'face_recognition',
+    Qt.Key_U: 'sonic',
+    Qt.Key_I: 'show_face_window',
+    Qt.Key_T: 'show_calibration_window',
+    Qt.Key_Y: 'buzzer',
+}
+
 class MyWindow(QMainWindow,Ui_client):
+    # Command templates shared with RobotController
+    _MOVE_FMT = RobotController._MOVE_FMT
+    _ATT_FMT = RobotController._ATT_FMT
+    _POS_FMT = RobotController._POS_FMT
+    _HEAD_FMT = RobotController._HEAD_FMT
+
     def __init__(self):
         super(MyWindow, self).__init__()
         self.setupUi(self)
@@ -642,94 +880,96 @@ class MyWindow(QMainWindow,Ui_client):
         self.setWindowIcon(QIcon('Picture/logo_Mini.png'))
         self.Video.setScaledContents(True)
         self.Video.setPixmap(QPixmap('Picture/Spider_client.png'))
+        
+        # Pens and brushes reused by every paintEvent
+        self._pen_white = QPen(Qt.white, 2, Qt.SolidLine)
+        self._pen_blue = QPen(QColor(0, 138, 255), 2, Qt.SolidLine)
+        self._brush_gray = QBrush(Qt.gray)
+        self._brush_blue = QBrush(QColor(0, 138, 255))
     
     def _setup_handlers(self):
         """Initialize and wire up all the handler classes."""
         # Initialize handlers
         self.video_handler = VideoHandler(client=None, video_label=self.Video)
         self.client = Client()
-        self.ui_manager = UIManager(self.client, self)
-        self.controller = RobotController(self.client, ui=self)
         self.network = NetworkManager(self.client)
+        self.ui_manager = UIManager(self.client, self, self.network)
+        self.controller = RobotController(self.client, ui=self)
         
         # Wire client into handlers
         self.video_handler.client = self.client
         
-        # Load IP address
+        # Load IP address; _save_ip skips the write while it is unchanged
+        self._last_ip_written = None
         try:
             with open('IP.txt', 'r') as file:
-                self.lineEdit_IP_Adress.setText(str(file.readline().strip()))
-        except Exception as e:
-            print(f"Error loading IP address: {e}")
+                self._last_ip_written = str(file.readline().strip())
+                self.lineEdit_IP_Adress.setText(self._last_ip_written)
+        except Exception:
+            logger.exception("Error loading IP address")
     
     def _setup_ui_components(self):
         """Set up all UI components including buttons, sliders, and their connections."""
         self._setup_buttons()
+        self._setup_key_table()
         self._setup_sliders()
         self._setup_radio_buttons()
     
     def _setup_buttons(self):
-        """Set up button connections."""
-        # Control buttons
-        self.Button_Connect.clicked.connect(self.connect)
-        self.Button_Video.clicked.connect(self.video)
-        self.Button_IMU.clicked.connect(self.controller.imu)
-        self.Button_Sonic.clicked.connect(self.controller.sonic)
-        self.Button_Relax.clicked.connect(self.controller.relax)
-        self.Button_Take_Photo.clicked.connect(self.video_handler.take_photo)
-        self.Button_Face_Recognition.clicked.connect(self.face_recognition)
-        
-        # Buzzer button has press/release events
-        self.Button_Buzzer.pressed.connect(self.controller.buzzer)
-        self.Button_Buzzer.released.connect(self.controller.buzzer)
-        
-        # Window control buttons
-        self.Button_Calibration.clicked.connect(self.ui_manager.show_calibration_window)
-        self.Button_LED.clicked.connect(self.ui_manager.show_led_window)
-        self.Button_Face_ID.clicked.connect(self.ui_manager.show_face_window)
+        """Set up button connections from BUTTON_BINDINGS."""
+        for widget, signal, handler in BUTTON_BINDINGS:
+            getattr(getattr(self, widget), signal).connect(operator.attrgetter(handler)(self))
+    
+    def _setup_key_table(self):
+        """Bind the KEY_BINDINGS shortcuts to their handlers."""
+        self._key_table = {key: getattr(self, name) for key, name in KEY_BINDINGS.items()}
     
     def _setup_sliders(self):
         """Set up slider controls with their ranges and connections."""
-        # Head control sliders
-        self._setup_slider(self.slider_head, HEAD_MIN, HEAD_MAX, HEAD_INIT, self.head_up_and_down)
+        # Head control sliders (label_head_1 shows 180 - value, so it updates on release)
+        self._setup_slider(self.slider_head, HEAD_MIN, HEAD_MAX, HEAD_INIT, self.head_up_and_down, self.label_head)
         self._setup_slider(self.slider_head_1, 0, 180, HEAD_INIT, self.head_left_and_right)
         
         # Movement control sliders
-        self._setup_slider(self.slider_speed, SPEED_MIN, SPEED_MAX, SPEED_INIT, self.speed)
-        self._setup_slider(self.slider_roll, ROLL_MIN, ROLL_MAX, ROLL_INIT, self.set_roll)
-        self._setup_slider(self.slider_Z, Z_MIN, Z_MAX, Z_INIT, self.set_z)
+        self._setup_slider(self.slider_speed, SPEED_MIN, SPEED_MAX, SPEED_INIT, self.speed, self.label_speed)
+        self._setup_slider(self.slider_roll, ROLL_MIN, ROLL_MAX, ROLL_INIT, self.set_roll, self.label_roll)
+        self._setup_slider(self.slider_Z, Z_MIN, Z_MAX, Z_INIT, self.set_z, self.label_Z)
         
         # Set initial speed
         self.client.move_speed = str(self.slider_speed.value())
     
-    def _setup_slider(self, slider, min_val, max_val, init_val, callback):
-        """Helper method to configure a slider with common settings."""
+    def _setup_slider(self, slider, min_val, max_val, init_val, callback, label=None):
+        """Helper method to configure a slider with common settings.
+        
+        Tracking is off, so callback (which sends a command) runs once per drag
+        on release; label, if given, follows the handle live while dragging.
+        """
         slider.setMinimum(min_val)
         slider.setMaximum(max_val)
         slider.setSingleStep(1)
-        slider.setValue(init_val)
+        with QSignalBlocker(slider):
+            slider.setValue(init_val)
+        slider.setTracking(False)
         slider.valueChanged.connect(callback)
+        if label is not None:
+            slider.sliderMoved.connect(label.setNum)
     
     def _setup_radio_buttons(self):
         """Set up radio button groups and their connections."""
         # Action mode radio buttons
         self.ButtonActionMode1.setChecked(True)
-        self.ButtonActionMode1.toggled.connect(lambda: self.action_mode(self.ButtonActionMode1))
+        self.ButtonActionMode1.toggled.connect(self._on_action_mode_toggled)
         self.ButtonActionMode2.setChecked(False)
-        self.ButtonActionMode2.toggled.connect(lambda: self.action_mode(self.ButtonActionMode2))
+        self.ButtonActionMode2.toggled.connect(self._on_action_mode_toggled)
         
         # Gait mode radio buttons
         self.ButtonGaitMode1.setChecked(True)
-        self.ButtonGaitMode1.toggled.connect(lambda: self.gait_mode(self.ButtonGaitMode1))
+        self.ButtonGaitMode1.toggled.connect(self._on_gait_mode_toggled)
         self.ButtonGaitMode2.setChecked(False)
-        self.ButtonGaitMode2.toggled.connect(lambda: self.gait_mode(self.ButtonGaitMode2))
+        self.ButtonGaitMode2.toggled.connect(self._on_gait_mode_toggled)
     
     def _setup_timers(self):
         """Initialize and set up all timers."""
-        # Video refresh timer
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.video_handler.refresh_image)
-        
         # Power monitoring timer
         self.timer_power = QTimer(self)
         self.timer_power.timeout.connect(self.controller.power)
@@ -737,14 +977,26 @@ class MyWindow(QMainWindow,Ui_client):
         # Sonic sensor timer
         self.timer_sonic = QTimer(self)
         self.timer_sonic.timeout.connect(self.controller.get_sonic_data)
+        
+        # Coalesces mouse-driven move/attitude/position commands
+        self.timer_pad = QTimer(self)
+        self.timer_pad.setSingleShot(True)
+        self.timer_pad.timeout.connect(self._flush_pad_commands)
+        
+        # Batches queued commands into a single send_data
+        self.timer_tx = QTimer(self)
+        self.timer_tx.setSingleShot(True)
+        self.timer_tx.timeout.connect(self._flush_tx)
+        
+        # Replays a mouse move dropped by the throttle once the cursor rests
+        self.timer_mouse = QTimer(self)
+        self.timer_mouse.setSingleShot(True)
+        self.timer_mouse.timeout.connect(self._flush_pending_mouse)
     
     def _setup_variables(self):
         """Initialize class variables and state."""
         # Keyboard state
-        self.key_w = False
-        self.key_a = False
-        self.key_s = False
-        self.key_d = False
+        self._wasd = dict.fromkeys(self._MOVE_VEC, False)
         self.key_space = False
         
         # Thread handles
@@ -758,6 +1010,29 @@ class MyWindow(QMainWindow,Ui_client):
         self.drawpoint = [[800, 180], [800, 650]]
         self.action_flag = 1
         self.gait_flag = 1
+        
+        # Toggle states mirrored by the button captions
+        self.imu_on = False
+        self.buzzer_on = False
+        self.relaxed = False
+        self.sonic_on = False
+        self.video_on = False
+        self.face_recog_on = False
+        
+        # Commands waiting for timer_tx
+        self._tx_buf = []
+        
+        # Pad commands waiting for timer_pad, and the points last sent
+        self._dirty_pads = set()
+        self._last_move_point = None
+        self._last_attitude_point = None
+        self._last_position_point = None
+        
+        # Last mouse move handled, and one dropped by the throttle
+        self._last_mouse_xy = (-1, -1)
+        self._pending_mouse_xy = None
+        self._mouse_clock = QElapsedTimer()
+        self._mouse_clock.start()
     
     def _setup_focus_handling(self):
         """Set up focus handling for keyboard input."""
@@ -776,415 +1051,358 @@ class MyWindow(QMainWindow,Ui_client):
             self.Video.setFocus(Qt.OtherFocusReason)
             
             # When user presses Enter in IP box, move focus to Video (so keys control robot)
-            self.lineEdit_IP_Adress.returnPressed.connect(
-                lambda: self.Video.setFocus(Qt.TabFocusReason))
-        except Exception as e:
-            print(f"Error setting up focus handling: {e}")
-        self.slider_head_1.setSingleStep(1)
-        self.slider_head_1.setValue(HEAD_INIT)
-        self.slider_head_1.valueChanged.connect(self.head_left_and_right)
-
-        self.slider_speed.setMinimum(SPEED_MIN)
-        self.slider_speed.setMaximum(SPEED_MAX)
-        self.slider_speed.setSingleStep(1)
-        self.slider_speed.setValue(SPEED_INIT)
-        self.slider_speed.valueChanged.connect(self.speed)
-        self.client.move_speed = str(self.slider_speed.value())
+            self.lineEdit_IP_Adress.returnPressed.connect(self._focus_video)
+        except Exception:
+            logger.exception("Error setting up focus handling")
 
-        self.slider_roll.setMinimum(ROLL_MIN)
-        self.slider_roll.setMaximum(ROLL_MAX)
-        self.slider_roll.setSingleStep(1)
-        self.slider_roll.setValue(ROLL_INIT)
-        self.slider_roll.valueChanged.connect(self.set_roll)
-
-        self.slider_Z.setMinimum(Z_MIN)
-        self.slider_Z.setMaximum(Z_MAX)
-        self.slider_Z.setSingleStep(1)
-        self.slider_Z.setValue(Z_INIT)
-        self.slider_Z.valueChanged.connect(self.set_z)
-
-        #checkbox
-        self.ButtonActionMode1.setChecked(True)
-        self.ButtonActionMode1.toggled.connect(lambda: self.action_mode(self.ButtonActionMode1))
-        self.ButtonActionMode2.setChecked(False)
-        self.ButtonActionMode2.toggled.connect(lambda: self.action_mode(self.ButtonActionMode2))
-        self.ButtonGaitMode1.setChecked(True)
-        self.ButtonGaitMode1.toggled.connect(lambda: self.gait_mode(self.ButtonGaitMode1))
-        self.ButtonGaitMode2.setChecked(False)
-        self.ButtonGaitMode2.toggled.connect(lambda: self.gait_mode(self.ButtonGaitMode2))
-
-        #Timer
-        self.timer=QTimer(self)
-        self.timer.timeout.connect(self.video_handler.refresh_image)
-
-        self.timer_power = QTimer(self)
-        self.timer_power.timeout.connect(self.controller.power)
-
-        self.timer_sonic = QTimer(self)
-        self.timer_sonic.timeout.connect(self.controller.get_sonic_data)
-
-        #Variable
-        self.power_value= [100,100]
-        self.move_point = [325, 635]
-        self.move_flag = False
-        self.drawpoint = [[800, 180], [800, 650]]
-        self.action_flag = 1
-        self.gait_flag = 1
-
-        # Focus handling: don't trap keys in the IP input by default
-        try:
-            # Main window should accept key focus
-            self.setFocusPolicy(Qt.StrongFocus)
-            # Allow the video label to take focus for keyboard handling
-            self.Video.setFocusPolicy(Qt.StrongFocus)
-            # Only focus the IP box when the user clicks it
-            self.lineEdit_IP_Adress.setFocusPolicy(Qt.ClickFocus)
-            # Start with focus outside the IP box
-            self.lineEdit_IP_Adress.clearFocus()
-            self.Video.setFocus(Qt.OtherFocusReason)
-            # When user presses Enter in IP box, move focus to Video (so keys control robot)
-            self.lineEdit_IP_Adress.returnPressed.connect(lambda: self.Video.setFocus(Qt.TabFocusReason))
-        except Exception as e:
-            print(e)
+    def _focus_video(self):
+        self.Video.setFocus(Qt.TabFocusReason)
 
     # keyboard
     def keyPressEvent(self, event):
-        if (event.key() == Qt.Key_C):
-            print("C")
-            self.connect()
-        if (event.key() == Qt.Key_V):
+        key = event.key()
+        handler = self._key_table.get(key)
+        if handler is not None:
             try:
-                print("V")
-                self.video()
-            except Exception as e:
-                print(e)
-
-        if (event.key() == Qt.Key_R):
-            print("R")
-            self.relax()
-        if (event.key() == Qt.Key_L):
-            print("L")
-            self.show_led_window()
-        if (event.key() == Qt.Key_B):
-            print("B")
-            self.imu()
-        if (event.key() == Qt.Key_F):
-            print("F")
-            self.face_recognition()
-        if (event.key() == Qt.Key_U):
-            print("U")
-            self.sonic()
-        if (event.key() == Qt.Key_I):
-            print("I")
-            self.show_face_window()
-        if (event.key() == Qt.Key_T):
-            print("T")
-            self.show_calibration_window()
-        if (event.key() == Qt.Key_Y):
-            print("Y")
-            self.buzzer()
-
-        if event.isAutoRepeat():
-            pass
-        else:
-            if event.key() == Qt.Key_W:
-                self.key_w = True
-                print("W")
-                self.move_point = [325, 535]
-                self.move()
-            elif event.key() == Qt.Key_S:
-                self.key_s = True
-                print("S")
-                self.move_point = [325, 735]
-                self.move()
-            elif event.key() == Qt.Key_A:
-                self.key_a = True
-                print("A")
-                self.move_point = [225, 635]
-                self.move()
-            elif event.key() == Qt.Key_D:
-                self.key_d = True
-                print("D")
-                self.move_point = [425, 635]
-                self.move()
+                handler()
+            except Exception:
+                logger.exception("Error in MyWindow.keyPressEvent")
+            return
+
+        if key in self._wasd and not event.isAutoRepeat():
+            self._wasd[key] = True
+            self._recompute_move_point()
 
     def keyReleaseEvent(self, event):
-        if (event.key() == Qt.Key_W):
-            if not (event.isAutoRepeat()) and self.key_w == True:
-                print("release W")
-                self.key_w = False
-                self.move_point = [325, 635]
-                self.move()
-        elif (event.key() == Qt.Key_A):
-            if not (event.isAutoRepeat()) and self.key_a == True:
-                print("release A")
-                self.key_a = False
-                self.move_point = [325, 635]
-                self.move()
-        elif (event.key() == Qt.Key_S):
-            if not (event.isAutoRepeat()) and self.key_s == True:
-                print("release S")
-                self.key_s = False
-                self.move_point = [325, 635]
-                self.move()
-        elif (event.key() == Qt.Key_D):
-            if not (event.isAutoRepeat()) and self.key_d == True:
-                print("release D")
-                self.key_d = False
-                self.move_point = [325, 635]
-                self.move()
+        key = event.key()
+        if self._wasd.get(key) and not event.isAutoRepeat():
+            self._wasd[key] = False
+            self._recompute_move_point()
+
+    # Wheel offset per held WASD key; held keys add up, so W+A is a diagonal
+    _MOVE_VEC = {
+        Qt.Key_W: (0, -100),
+        Qt.Key_S: (0, 100),
+        Qt.Key_A: (-100, 0),
+        Qt.Key_D: (100, 0),
+    }
+
+    def _recompute_move_point(self):
+        """Point the wheel along the sum of the held WASD keys, clamped to its rim."""
+        before = self._pad_state()
+        dx = dy = 0
+        for key, held in self._wasd.items():
+            if held:
+                vx, vy = self._MOVE_VEC[key]
+                dx += vx
+                dy += vy
+        length = math.hypot(dx, dy)
+        if length > 100:
+            dx = dx * 100 / length
+            dy = dy * 100 / length
+        self.move_point = [325 + round(dx), 635 + round(dy)]
+        self._schedule_pad_command('move')
+        self._update_pads(before)
+
+    # Repaint areas of the three pads, padded for the 2 px pens and the 15 px knob
+    _WHEEL_RECT = QRect(208, 518, 234, 234)
+    _ATTITUDE_RECT = QRect(698, 78, 205, 205)
+    _POSITION_RECT = QRect(698, 548, 205, 205)
+
+    def _pad_state(self):
+        """Snapshot the pad positions so _update_pads can tell what moved."""
+        return [p[:] for p in self.drawpoint], self.move_point[:]
+
+    def _update_pads(self, before):
+        """Schedule a repaint of only the pads whose position changed."""
+        drawpoint, move_point = before
+        if self.move_point != move_point:
+            self.update(self._WHEEL_RECT)
+        if self.drawpoint[0] != drawpoint[0]:
+            self.update(self._ATTITUDE_RECT)
+        if self.drawpoint[1] != drawpoint[1]:
+            self.update(self._POSITION_RECT)
+
     def paintEvent(self,e):
         try:
+            region = e.region()
+            draw_attitude = region.intersects(self._ATTITUDE_RECT)
+            draw_position = region.intersects(self._POSITION_RECT)
+            draw_wheel = region.intersects(self._WHEEL_RECT)
             qp=QPainter()
             qp.begin(self)
-            qp.setPen(QPen(Qt.white,2,Qt.SolidLine))
-            qp.drawRect(700,80,200,200)
-            qp.drawRect(700, 550, 200, 200)
             qp.setRenderHint(QPainter.Antialiasing)
+            qp.setPen(self._pen_white)
+            if draw_attitude:
+                qp.drawRect(700,80,200,200)
+            if draw_position:
+                qp.drawRect(700, 550, 200, 200)
 
             #steering wheel
-            qp.setPen(Qt.NoPen)
-            qp.setBrush(QBrush(Qt.gray))# QColor(0,138,255) Qt.white
-            qp.drawEllipse(QPoint(325, 635), 100, 100)
-            qp.setBrush(QBrush(QColor(0, 138, 255)))
-            qp.drawEllipse(QPoint(self.move_point[0], self.move_point[1]), 15, 15)
-            qp.setPen(QPen(QColor(0, 138, 255), 2, Qt.SolidLine))
-            x1 = round(math.sqrt(100**2-(self.move_point[1]-635)**2)+325)
-            y1 = round(math.sqrt(100 ** 2 - (self.move_point[0] - 325) ** 2) + 635)
-            qp.drawLine(x1, self.move_point[1], 650-x1, self.move_point[1])
-            qp.drawLine(self.move_point[0], 1270-y1, self.move_point[0], y1)
+            if draw_wheel:
+                qp.setPen(Qt.NoPen)
+                qp.setBrush(self._brush_gray)
+                qp.drawEllipse(QPoint(325, 635), 100, 100)
+                qp.setBrush(self._brush_blue)
+                qp.drawEllipse(QPoint(self.move_point[0], self.move_point[1]), 15, 15)
+            # Every remaining line uses the blue pen
+            qp.setPen(self._pen_blue)
+            if draw_wheel:
+                x1 = SQRT_TABLE[self.move_point[1] - 635 + 100] + 325
+                y1 = SQRT_TABLE[self.move_point[0] - 325 + 100] + 635
+                qp.drawLine(x1, self.move_point[1], 650-x1, self.move_point[1])
+                qp.drawLine(self.move_point[0], 1270-y1, self.move_point[0], y1)
 
             #attitude
-            qp.drawLine(self.drawpoint[0][0], 80, self.drawpoint[0][0], 280)
-            qp.drawLine(700, self.drawpoint[0][1], 900, self.drawpoint[0][1])
-            self.label_attitude.move(self.drawpoint[0][0] + 10, self.drawpoint[0][1] + 10)
-            pitch = round((180-self.drawpoint[0][1]) / 100.0 * 15)
-            yaw = round((self.drawpoint[0][0] - 800) / 100.0 * 15)
-            self.label_attitude.setText(str((yaw, pitch)))
+            if draw_attitude:
+                qp.drawLine(self.drawpoint[0][0], 80, self.drawpoint[0][0], 280)
+                qp.drawLine(700, self.drawpoint[0][1], 900, self.drawpoint[0][1])
+                self.label_attitude.move(self.drawpoint[0][0] + 10, self.drawpoint[0][1] + 10)
+                pitch = round((180-self.drawpoint[0][1]) / 100.0 * 15)
+                yaw = round((self.drawpoint[0][0] - 800) / 100.0 * 15)
+                self.label_attitude.setText(str((yaw, pitch)))
 
             #position
-            qp.drawLine(self.drawpoint[1][0], 550, self.drawpoint[1][0],750)
-            qp.drawLine(700, self.drawpoint[1][1], 900, self.drawpoint[1][1])
-            self.label_position.move(self.drawpoint[1][0] + 10, self.drawpoint[1][1] + 10)
-            y = round((650-self.drawpoint[1][1] ) / 100.0 * 40)
-            x = round((self.drawpoint[1][0] - 800) / 100.0 * 40)
-            self.label_position.setText(str((x, y)))
+            if draw_position:
+                qp.drawLine(self.drawpoint[1][0], 550, self.drawpoint[1][0],750)
+                qp.drawLine(700, self.drawpoint[1][1], 900, self.drawpoint[1][1])
+                self.label_position.move(self.drawpoint[1][0] + 10, self.drawpoint[1][1] + 10)
+                y = round((650-self.drawpoint[1][1] ) / 100.0 * 40)
+                x = round((self.drawpoint[1][0] - 800) / 100.0 * 40)
+                self.label_position.setText(str((x, y)))
             qp.end()
-        except Exception as e:
-            print(e)
+        except Exception:
+            logger.exception("Error in MyWindow.paintEvent")
+
+    # Hit-test areas for the pads (inclusive of the far edge, as before)
+    _PAD_COLUMN = QRect(700, 0, 201, 10000)
+    _ATTITUDE_HIT = QRect(700, 80, 201, 201)
+    _POSITION_HIT = QRect(700, 550, 201, 201)
+    _STEERING_HIT = QRect(225, 550, 201, 201)
+
+    def _hit_region(self, x, y):
+        """Classify a mouse position into the pad it falls on."""
+        point = QPoint(x, y)
+        if self._PAD_COLUMN.contains(point):
+            if self._ATTITUDE_HIT.contains(point):
+                return PadRegion.ATTITUDE
+            if self._POSITION_HIT.contains(point):
+                return PadRegion.POSITION
+            return PadRegion.NONE
+        if self._STEERING_HIT.contains(point):
+            if (x - 325) ** 2 + (635 - y) ** 2 < 10000:
+                return PadRegion.STEERING_INNER
+            return PadRegion.STEERING_OUTER
+        return PadRegion.OUTSIDE
+
+    def _reset_drawpoint(self):
+        """Recentre both pads in place, without building new lists."""
+        self.drawpoint[0][:] = (800, 180)
+        self.drawpoint[1][:] = (800, 650)
+
+    def _leave_wheel(self):
+        """Recentre the wheel and drop balance mode before using another pad."""
+        self._reset_drawpoint()
+        if self.move_flag:
+            self.move_point = [325, 635]
+            self.move_flag = False
+            self._schedule_pad_command('move')
+        if self.imu_on:
+            self.imu_on = False
+            self.Button_IMU.setText("Balance")
+
+    def _snap_to_rim(self, x, y):
+        """Put the wheel knob on the rim in the direction of (x, y)."""
+        x = x - 325
+        y = 635 - y
+        ang_deg = round(math.degrees(math.atan2(y, x))) % 360
+        self.move_point[0] = COS_TABLE[ang_deg] + 325
+        self.move_point[1] = 635 - SIN_TABLE[ang_deg]
+        self._schedule_pad_command('move')
+
+    def _on_attitude_pad(self, x, y):
+        try:
+            self._leave_wheel()
+            self.drawpoint[0][0] = x
+            self.drawpoint[0][1] = y
+            self._schedule_pad_command('attitude')
+        except Exception:
+            logger.exception("Error in MyWindow._on_attitude_pad")
+
+    def _on_position_pad(self, x, y):
+        try:
+            self._leave_wheel()
+            self.move_point = [325, 635]
+            self.drawpoint[1][0] = x
+            self.drawpoint[1][1] = y
+            self._schedule_pad_command('position')
+        except Exception:
+            logger.exception("Error in MyWindow._on_position_pad")
+
+    def _on_steering_inner(self, x, y):
+        self._reset_drawpoint()
+        if self.imu_on:
+            self.imu_on = False
+            self.Button_IMU.setText("Balance")
+        self.move_flag = True
+        self.move_point[0] = x
+        self.move_point[1] = y
+        self._schedule_pad_command('move')
+
+    def _on_steering_outer(self, x, y):
+        self._reset_drawpoint()
+        if self.imu_on:
+            self.imu_on = False
+            self.Button_IMU.setText("Balance")
+        self._snap_to_rim(x, y)
+
+    def _on_outside(self, x, y):
+        if self.move_flag:
+            self._snap_to_rim(x, y)
+
+    def _on_no_pad(self, x, y):
+        pass
+
+    _REGION_HANDLERS = {
+        PadRegion.ATTITUDE: _on_attitude_pad,
+        PadRegion.POSITION: _on_position_pad,
+        PadRegion.STEERING_INNER: _on_steering_inner,
+        PadRegion.STEERING_OUTER: _on_steering_outer,
+        PadRegion.OUTSIDE: _on_outside,
+        PadRegion.NONE: _on_no_pad,
+    }
 
     def mouseMoveEvent(self, event):
         x = event.pos().x()
         y = event.pos().y()
-        if x >= 700 and x <= 900:
-            if y >= 80 and y <= 280:
-                try:
-                    self.drawpoint = [[800, 180], [800, 650]]
-                    if  self.move_flag:
-                        self.move_point = [325, 635]
-                        self.move_flag = False
-                        self.move()
-                    if self.Button_IMU.text() == "Close":
-                        self.Button_IMU.setText("Balance")
-
-                    self.drawpoint[0][0] = x
-                    self.drawpoint[0][1] = y
-                    self.update()
-                    self.attitude()
-                except Exception as e:
-                    print(e)
-            elif y >= 550 and y <= 750:
-                try:
-                    self.drawpoint = [[800, 180], [800, 650]]
-                    if self.move_flag:
-                        self.move_point = [325, 635]
-                        self.move_flag = False
-                        self.move()
-                    if self.Button_IMU.text() == "Close":
-                        self.Button_IMU.setText("Balance")
-                    self.move_point = [325, 635]
-                    self.drawpoint[1][0] = x
-                    self.drawpoint[1][1] = y
-                    self.update()
-                    self.position()
-                except Exception as e:
-                    print(e)
-        elif x >= 225 and x <= 425 and y >= 550 and y <= 750:
-            r = (x - 325) ** 2 + (635-y) ** 2
-            self.drawpoint = [[800, 180], [800, 650]]
-            if self.Button_IMU.text() == "Close":
-                self.Button_IMU.setText("Balance")
-            if r < 10000:
-                self.move_flag = True
-                self.move_point[0] = x
-                self.move_point[1] = y
-                self.move()
-                self.update()
-            else:
-                x = x - 325
-                y = 635 - y
-                angle = math.atan2(y, x)
-                self.move_point[0] = 100*math.cos(angle)+325
-                self.move_point[1] = 635-100*math.sin(angle)
-                self.move()
-                self.update()
-        elif self.move_flag == True:
-            x = x - 325
-            y = 635 - y
-            angle = math.atan2(y, x)
-            self.move_point[0] = 100 * math.cos(angle) + 325
-            self.move_point[1] = 635 - 100 * math.sin(angle)
-            self.move()
-            self.update()
+        last_x, last_y = self._last_mouse_xy
+        # Drop sub-pixel and high-rate repeats; the last dropped point is
+        # replayed by timer_mouse so the pads still end where the cursor did
+        if self._mouse_clock.elapsed() < MOUSE_MIN_MS or abs(x - last_x) + abs(y - last_y) < MOUSE_MIN_PX:
+            self._pending_mouse_xy = (x, y)
+            if not self.timer_mouse.isActive():
+                self.timer_mouse.start(MOUSE_MIN_MS)
+            return
+        self._handle_mouse_move(x, y)
+
+    def _flush_pending_mouse(self):
+        """Handle the last mouse move the throttle dropped, if still pending."""
+        if self._pending_mouse_xy is not None:
+            self._handle_mouse_move(*self._pending_mouse_xy)
+
+    def _handle_mouse_move(self, x, y):
+        self._pending_mouse_xy = None
+        self._last_mouse_xy = (x, y)
+        self._mouse_clock.restart()
+        before = self._pad_state()
+        self._REGION_HANDLERS[self._hit_region(x, y)](self, x, y)
+        self._update_pads(before)
 
     def mousePressEvent(self, event):
-        x = event.pos().x()
-        y = event.pos().y()
-        if x >= 700 and x <= 900:
-            if y >= 80 and y <= 280:
-                try:
-                    self.drawpoint = [[800, 180], [800, 650]]
-                    if self.move_flag:
-                        self.move_point = [325, 635]
-                        self.move_flag = False
-                        self.move()
-                    if self.Button_IMU.text() == "Close":
-                        self.Button_IMU.setText("Balance")
-                    self.drawpoint[0][0] = x
-                    self.drawpoint[0][1] = y
-                    self.update()
-                    self.attitude()
-                except Exception as e:
-                    print(e)
-            elif y >= 550 and y <= 750:
-                try:
-                    self.drawpoint = [[800, 180], [800, 650]]
-                    if self.move_flag:
-                        self.move_point = [325, 635]
-                        self.move_flag = False
-                        self.move()
-                    if self.Button_IMU.text() == "Close":
-                        self.Button_IMU.setText("Balance")
-                    self.drawpoint[1][0] = x
-                    self.drawpoint[1][1] = y
-                    self.update()
-                    self.position()
-                except Exception as e:
-                    print(e)
-        elif x >= 225 and x <= 425 and y >= 550 and y <= 750:
-            r = (x - 325) ** 2 + (635 - y) ** 2
-            self.drawpoint = [[800, 180], [800, 650]]
-            if self.Button_IMU.text() == "Close":
-                self.Button_IMU.setText("Balance")
-            if r < 10000:
-                self.move_flag = True
-                self.move_point[0] = x
-                self.move_point[1] = y
-                self.move()
-                self.update()
-            else:
-                x = x - 325
-                y = 635 - y
-                angle = math.atan2(y, x)
-                self.move_point[0] = 100 * math.cos(angle) + 325
-                self.move_point[1] = 635 - 100 * math.sin(angle)
-                self.move()
-                self.update()
-        elif self.move_flag == True:
-            x = x - 325
-            y = 635 - y
-            angle = math.atan2(y, x)
-            self.move_point[0] = 100 * math.cos(angle) + 325
-            self.move_point[1] = 635 - 100 * math.sin(angle)
-            self.move()
-            self.update()
+        self._handle_mouse_move(event.pos().x(), event.pos().y())
 
     def mouseReleaseEvent(self, event):
+        self.timer_mouse.stop()
+        self._flush_pending_mouse()
+        before = self._pad_state()
         x = event.pos().x()
         y = event.pos().y()
         #print(x,y)
         if self.move_flag:
             self.move_point = [325, 635]
             self.move_flag = False
+            self._schedule_pad_command('move')
+        self._update_pads(before)
+
+    def _schedule_pad_command(self, name):
+        """Mark a pad command dirty and send it on the next timer_pad tick."""
+        self._dirty_pads.add(name)
+        if not self.timer_pad.isActive():
+            self.timer_pad.start(TIMER_COALESCE_MS)
+
+    def _flush_pad_commands(self):
+        """Send each dirty pad command once, skipping points already sent."""
+        dirty, self._dirty_pads = self._dirty_pads, set()
+        if 'move' in dirty and self.move_point != self._last_move_point:
             self.move()
-        self.update()
-
-    def map(self, value, fromLow, fromHigh, toLow, toHigh):
-        return (toHigh - toLow) * (value - fromLow) / (fromHigh - fromLow) + toLow
+        if 'attitude' in dirty and self.drawpoint[0] != self._last_attitude_point:
+            self.attitude()
+        if 'position' in dirty and self.drawpoint[1] != self._last_position_point:
+            self.position()
 
     def face_recognition(self):
         try:
-            if self.Button_Face_Recognition.text()=="Face Recog":
-                self.client.fece_recognition_flag = True
-                self.Button_Face_Recognition.setText("Close")
-            elif self.Button_Face_Recognition.text() == "Close":
-                self.client.fece_recognition_flag = False
-                self.Button_Face_Recognition.setText("Face Recog")
-        except Exception as e:
-            print(e)
+            self.face_recog_on = not self.face_recog_on
+            self.client.fece_recognition_flag = self.face_recog_on
+            self.Button_Face_Recognition.setText("Close" if self.face_recog_on else "Face Recog")
+        except Exception:
+            logger.exception("Error in MyWindow.face_recognition")
 
     def move(self):
+        self._last_move_point = self.move_point[:]
         try:
-            x = self.map((self.move_point[0]-325),0,100,0,35)
-            y = self.map((635 - self.move_point[1]),0,100,0,35)
+            x = self.restriction((self.move_point[0] - 325) * MOVE_SCALE, -35, 35)
+            y = self.restriction((635 - self.move_point[1]) * MOVE_SCALE, -35, 35)
             if self.action_flag == 1:
                 angle = 0
             else:
-                if x!=0 or y!=0:
-                    angle=math.degrees(math.atan2(x,y))
-
-                    if angle < -90 and angle >= -180:
-                        angle=angle+360
-                    if angle >= -90 and angle <=90:
-                        angle = self.map(angle, -90, 90, -10, 10)
-                    else:
-                        angle = self.map(angle, 270, 90, 10, -10)
-                else:
-                    angle=0
+                angle = RobotController.turn_angle(x, y)
             speed=self.client.move_speed
-            command = cmd.CMD_MOVE+ "#"+str(self.gait_flag)+"#"+str(round(x))+"#"+str(round(y))\
-                      +"#"+str(speed)+"#"+str(round(angle)) +'\n'
-            print(command)
-            self.client.send_data(command)
-        except Exception as e:
-            print(e)
+            command = self._MOVE_FMT % (self.gait_flag, round(x), round(y), int(speed), round(angle))
+            logger.debug("%s", command)
+            self._queue(command)
+        except Exception:
+            logger.exception("Error in MyWindow.move")
     def relax(self):
-        try:
-            if self.Button_Relax.text() == "Relax":
-                self.Button_Relax.setText("Relaxed")
-                command = cmd.CMD_SERVOPOWER + "#" + "0" + '\n'
-            else:
-                self.Button_Relax.setText("Relax")
-                command = cmd.CMD_SERVOPOWER + "#" + "1" + '\n'
-            print(command)
-            self.client.send_data(command)
-        except Exception as e:
-            print(e)
+        self.controller.relax()
     def attitude(self):
-        r = self.map((self.drawpoint[0][0]-800), -100, 100, -15, 15)
-        p = self.map((180-self.drawpoint[0][1]), -100, 100, -15, 15)
+        self._last_attitude_point = self.drawpoint[0][:]
+        r = self.restriction((self.drawpoint[0][0] - 800) * ATTITUDE_SCALE, -15, 15)
+        p = self.restriction((180 - self.drawpoint[0][1]) * ATTITUDE_SCALE, -15, 15)
         y=self.slider_roll.value()
-        command = cmd.CMD_ATTITUDE+ "#" + str(round(r)) + "#" + str(round(p)) + "#" + str(round(y)) + '\n'
-        print(command)
-        self.client.send_data(command)
+        command = self._ATT_FMT % (round(r), round(p), round(y))
+        logger.debug("%s", command)
+        self._queue(command)
     def position(self):
-        x = self.map((self.drawpoint[1][0]-800), -100, 100, -40, 40)
-        y = self.map((650-self.drawpoint[1][1]), -100, 100, -40, 40)
+        self._last_position_point = self.drawpoint[1][:]
+        x = self.restriction((self.drawpoint[1][0] - 800) * POSITION_SCALE, -40, 40)
+        y = self.restriction((650 - self.drawpoint[1][1]) * POSITION_SCALE, -40, 40)
         z=self.slider_Z.value()
-        command = cmd.CMD_POSITION+ "#" + str(round(x)) + "#" + str(round(y)) + "#" + str(round(z)) + '\n'
-        print(command)
+        command = self._POS_FMT % (round(x), round(y), round(z))
+        logger.debug("%s", command)
+        self._queue(command)
+    def _queue(self, command: bytes):
+        """Queue an encoded command; everything queued within TIMER_TX_MS goes out in one send."""
+        self._tx_buf.append(command)
+        if not self.timer_tx.isActive():
+            self.timer_tx.start(TIMER_TX_MS)
+
+    def _flush_tx(self):
+        buf, self._tx_buf = self._tx_buf, []
+        if buf:
+            self.client.send_data(b''.join(buf))
+
+    def send_now(self, command):
+        """Send a command immediately, after anything still waiting in _tx_buf.
+        
+        Commands that bypass the batch must not overtake queued ones (a relax
+        straight after a stop-move would otherwise reach the robot first).
+        """
+        self._flush_tx()
         self.client.send_data(command)
+
     def closeEvent(self,event):
         try:
-            self.timer.stop()
+            self._flush_tx()
             self.timer_power.stop()
-        except Exception as e:
-            print(e)
+        except Exception:
+            logger.exception("Error in MyWindow.closeEvent")
         # Delegate to NetworkManager
         try:
             self.network.disconnect()
-        except Exception as e:
-            print(e)
+        except Exception:
+            logger.exception("Error in MyWindow.closeEvent")
+        self.video_handler.stop()
         QCoreApplication.instance().quit()
         #os._exit(0)
 
@@ -1197,79 +1415,86 @@ class MyWindow(QMainWindow,Ui_client):
             return var
 
     def video(self):
-        if self.Button_Video.text() == 'Open Video':
-            self.timer.start(TIMER_REFRESH_MS)
+        self.video_on = not self.video_on
+        if self.video_on:
+            # Frames are staged on the network thread; paint them on the GUI thread
+            self.network.frameReady.connect(self.video_handler.refresh_image, Qt.QueuedConnection)
             self.Button_Video.setText('Close Video')
         else:
-            self.timer.stop()
+            self.network.frameReady.disconnect(self.video_handler.refresh_image)
             self.Button_Video.setText('Open Video')
 
     def power(self):
         try:
             command = cmd.CMD_POWER + '\n'
-            self.client.send_data(command)
+            self.send_now(command)
             self.progress_Power1.setFormat(str(self.power_value[0])+"V")
             self.progress_Power2.setFormat(str(self.power_value[1]) + "V")
             self.progress_Power1.setValue(self.restriction(round((float(self.power_value[0]) - 5.00) / 3.40 * 100), 0, 100))
             self.progress_Power2.setValue(self.restriction(round((float(self.power_value[1]) - 7.00) / 1.40 * 100), 0, 100))
             #print (command)
-        except Exception as e:
-            print(e)
+        except Exception:
+            logger.exception("Error in MyWindow.power")
 
     def receive_instruction(self,ip):
         try:
             self.client.client_socket1.connect((ip,5002))
             self.client.tcp_flag=True
-            print ("Connecttion Successful !")
-        except Exception as e:
-            print ("Connect to server Faild!: Server IP is right? Server is opend?")
-            self.client.tcp_flag=False 
+            logger.info("Connected to %s:5002", ip)
+        except Exception:
+            logger.warning("Connect to server %s:5002 failed; is the IP right and the server running?",
+                           ip, exc_info=True)
+            self.client.tcp_flag=False
+        handlers = {
+            cmd.CMD_SONIC: self._on_sonic_reply,
+            cmd.CMD_POWER: self._on_power_reply,
+        }
+        # Replies can straddle reads; keep the unterminated tail for the next one
+        residual = ''
         while True:
             try:
                 alldata=self.client.receive_data()
             except:
                 self.client.tcp_flag=False
                 break
-            #print(alldata)
-            if alldata=='':
+            if not alldata:
                 break
-            else:
-                cmdArray=alldata.split('\n')
-                #print(cmdArray)
-                if cmdArray[-1] !="":
-                    cmdArray==cmdArray[:-1]
-            for oneCmd in cmdArray:
-                data=oneCmd.split("#")
-                print(data)
-                if data=="":
-                    self.client.tcp_flag=False
-                    break
-                elif data[0]==cmd.CMD_SONIC:
-                    self.label_sonic.setText('Obstacle:'+data[1]+'cm')
-                    #print('Obstacle:',data[1])
-                elif data[0]==cmd.CMD_POWER:
-                    try:
-                        if len(data)==3:
-                            self.power_value[0] = data[1]
-                            self.power_value[1] = data[2]
-                            #self.power_value[0] = self.restriction(round((float(data[1]) - 5.00) / 3.40 * 100),0,100)
-                            #self.power_value[1] = self.restriction(round((float(data[2]) - 7.00) / 1.40 * 100),0,100)
-                            #print('Power：',power_value1,power_value2)
-                    except Exception as e:
-                        print(e)
+            lines = (residual + alldata).split('\n')
+            residual = lines.pop()
+            for line in lines:
+                head, _, rest = line.partition('#')
+                handler = handlers.get(head)
+                if handler is not None:
+                    handler(rest.split('#'))
+
+    def _on_sonic_reply(self, args):
+        self.label_sonic.setText('Obstacle:'+args[0]+'cm')
+
+    def _on_power_reply(self, args):
+        if len(args)==2:
+            self.power_value[0] = args[0]
+            self.power_value[1] = args[1]
 
     #CONNECT
+    def _save_ip(self, ip):
+        """Persist the IP box to IP.txt if it changed since the last write."""
+        if ip == self._last_ip_written:
+            return
+        # Write a temp file and swap it in so a crash never leaves IP.txt half written
+        with open('IP.txt.tmp', 'w') as file:
+            file.write(ip)
+        os.replace('IP.txt.tmp', 'IP.txt')
+        self._last_ip_written = ip
+
     def connect(self):
         try:
-            file=open('IP.txt','w')
-            file.write(self.lineEdit_IP_Adress.text())
-            file.close()
+            self._save_ip(self.lineEdit_IP_Adress.text())
             if self.Button_Connect.text()=='Connect':
                 self.IP = self.lineEdit_IP_Adress.text()
                 # Use NetworkManager to establish connection and spin up threads
                 # Basic input validation: non-empty IP string
                 if not isinstance(self.IP, str) or len(self.IP.strip()) == 0:
-                    print('Invalid IP address input')
+                    logger.warning("Invalid IP address input")
                     return
                 self.network.connect(self.IP, self.receive_instruction)
                 #self.face_thread = threading.Thread(target=self.client.face_recognition)
@@ -1294,8 +1519,8 @@ class MyWindow(QMainWindow,Ui_client):
                     self.Video.setFocus(Qt.OtherFocusReason)
                 except Exception as _:
                     pass
-        except Exception as e:
-            print(e)
+        except Exception:
+            logger.exception("Error in MyWindow.connect")
     #Mode
     #action_mode
     def action_mode(self,mode):
@@ -1311,6 +1536,9 @@ class MyWindow(QMainWindow,Ui_client):
                 self.ButtonActionMode1.setChecked(False)
                 self.ButtonActionMode2.setChecked(True)
                 self.action_flag = 2
+    def _on_action_mode_toggled(self, checked):
+        # Both action radio buttons share this slot; sender() tells them apart
+        self.action_mode(self.sender())
     # gait_mode
     def gait_mode(self,mode):
         if mode.text() == "Gait Mode 1":
@@ -1325,6 +1553,8 @@ class MyWindow(QMainWindow,Ui_client):
                 self.ButtonGaitMode1.setChecked(False)
                 self.ButtonGaitMode2.setChecked(True)
                 self.gait_flag = 2
+    def _on_gait_mode_toggled(self, checked):
+        self.gait_mode(self.sender())
     #Slider
     def speed(self):
         self.client.move_speed=str(self.slider_speed.value())
@@ -1337,119 +1567,83 @@ class MyWindow(QMainWindow,Ui_client):
         self.attitude()
     def head_up_and_down(self):
         try:
-            angle = str(self.slider_head.value())
-            self.label_head.setText(angle)
-            command = cmd.CMD_HEAD + "#" +"0" +"#"+angle + '\n'
-            self.client.send_data(command)
-            print(command)
-        except Exception as e:
-            print(e)
+            angle = self.slider_head.value()
+            self.label_head.setNum(angle)
+            command = self._HEAD_FMT % (0, angle)
+            self._queue(command)
+            logger.debug("%s", command)
+        except Exception:
+            logger.exception("Error in MyWindow.head_up_and_down")
     def head_left_and_right(self):
         try:
-            angle = str(180-self.slider_head_1.value())
-            self.label_head_1.setText(angle)
-            command = cmd.CMD_HEAD + "#" +"1" +"#"+angle + '\n'
-            self.client.send_data(command)
-            print(command)
-        except Exception as e:
-            print(e)
+            angle = 180 - self.slider_head_1.value()
+            self.label_head_1.setNum(angle)
+            command = self._HEAD_FMT % (1, angle)
+            self._queue(command)
+            logger.debug("%s", command)
+        except Exception:
+            logger.exception("Error in MyWindow.head_left_and_right")
     #BUZZER
     def buzzer(self):
-        if self.Button_Buzzer.text() == 'Buzzer':
-            command=cmd.CMD_BUZZER+'#1'+'\n'
-            self.client.send_data(command)
-            self.Button_Buzzer.setText('Noise')
-            #print (command)
-        else:
-            command=cmd.CMD_BUZZER+'#0'+'\n'
-            self.client.send_data(command)
-            self.Button_Buzzer.setText('Buzzer')
-            #print (command)
+        self.controller.buzzer()
     #BALANCE
     def imu(self):
-        if self.Button_IMU.text()=='Balance':
-            command=cmd.CMD_BALANCE+'#1'+'\n'
-            self.client.send_data(command)
-            self.Button_IMU.setText("Close")
-            #print (command)
-        else:
-            command=cmd.CMD_BALANCE+'#0'+'\n'
-            self.client.send_data(command)
-            self.Button_IMU.setText('Balance')
-            #print (command)
+        self.controller.imu()
     #SNOIC
     def sonic(self):
-        if self.Button_Sonic.text() == 'Sonic':
-            self.timer_sonic.start(100)
-            self.Button_Sonic.setText('Close')
-
-        else:
-            self.timer_sonic.stop()
-            self.Button_Sonic.setText('Sonic')
-            #
+        self.controller.sonic()
     def get_sonic_data(self):
         command=cmd.CMD_SONIC+'\n'
-        self.client.send_data(command)
+        self.send_now(command)
         #print (command)
 
     def show_calibration_window(self):
         command = cmd.CMD_CALIBRATION + '\n'
-        self.client.send_data(command)
+        self.send_now(command)
         self.calibration_window = CalibrationWindow(self.client)
         self.calibration_window.setWindowModality(Qt.ApplicationModal)
         self.calibration_window.show()
 
     #LED
     def show_led_window(self):
-        try:
-            self.led_window = LedWindow(self.client)
-            self.led_window.setWindowModality(Qt.ApplicationModal)
-            self.led_window.show()
-        except Exception as e:
-            print(e)
+        self.ui_manager.show_led_window()
 
     # Face
     def show_face_window(self):
         try:
-            self.face_window = FaceWindow(self.client)
+            self.face_window = FaceWindow(self.client, self.network)
             self.face_window.setWindowModality(Qt.ApplicationModal)
             self.face_window.show()
             self.client.fece_id = True
-        except Exception as e:
-            print(e)
+        except Exception:
+            logger.exception("Error in MyWindow.show_face_window")
 
     def refresh_image(self):
-        if self.client.video_flag == False:
-            height, width, bytesPerComponent=self.client.image.shape
-            #print (height, width, bytesPerComponent)
-            cv2.cvtColor(self.client.image, cv2.COLOR_BGR2RGB, self.client.image)
-            QImg = QImage(self.client.image.data.tobytes(), width, height, 3 * width, QImage.Format_RGB888)
-            self.Video.setPixmap(QPixmap.fromImage(QImg))
-            self.client.video_flag = True
+        self.video_handler.refresh_image()
 
     def take_photo(self):
         """Beep briefly, then save the current frame (or a blank image if none)."""
         try:
             # Turn buzzer ON for a short beep (non-blocking)
             try:
-                self.client.send_data(cmd.CMD_BUZZER + '#1' + '\n')
+                self.send_now(cmd.CMD_BUZZER + '#1' + '\n')
                 # Use a singleShot timer to turn off the buzzer after a delay
                 # This ensures the timer is properly parented and cleaned up
                 QtCore.QTimer.singleShot(200, lambda: self._turn_off_buzzer())
-            except Exception as e:
-                print(f"Error in take_photo: {e}")
+            except Exception:
+                logger.exception("Error in take_photo")
             # Delay slightly so the beep precedes the shutter
             QtCore.QTimer.singleShot(120, self._capture_photo_and_buzz_off)
-        except Exception as e:
-            print(f"Error in take_photo: {e}")
+        except Exception:
+            logger.exception("Error in take_photo")
             
     def _turn_off_buzzer(self):
         """Helper method to safely turn off the buzzer."""
         try:
             if hasattr(self, 'client') and self.client is not None:
-                self.client.send_data(cmd.CMD_BUZZER + '#0' + '\n')
-        except Exception as e:
-            print(f"Error turning off buzzer: {e}")
+                self.send_now(cmd.CMD_BUZZER + '#0' + '\n')
+        except Exception:
+            logger.exception("Error turning off buzzer")
 
     def _capture_photo_and_buzz_off(self):
         """Capture the current frame and save it as a photo."""
@@ -1461,32 +1655,46 @@ class MyWindow(QMainWindow,Ui_client):
                 pix = None
             # If pix is None or null, CameraRecorder will save a blank image
             saved_path = self.camera_recorder.capture(pixmap=pix if pix is not None else None)
-            print('Photo saved to:', saved_path)
-        except Exception as e:
-            print(f"Error capturing photo: {e}")
+            logger.info("Photo saved to: %s", saved_path)
+        except Exception:
+            logger.exception("Error capturing photo")
 
 class FaceWindow(QMainWindow,Ui_Face):
-    def __init__(self,client):
+    def __init__(self,client,network=None):
         super(FaceWindow,self).__init__()
         self.setupUi(self)
         self.setWindowIcon(QIcon('Picture/logo_Mini.png'))
         self.Button_Read_Face.clicked.connect(self.read_face)
         self.client = client
+        self.network = network
         self.face_image=''
         self.photoCount=0
         self.timeout=0
         self.name = ''
         self.readFaceFlag=False
-        # Timer
-        self.timer1 = QTimer(self)
-        self.timer1.timeout.connect(self.face_detection)
-        self.timer1.start(10)
-
-        self.timer2 = QTimer(self)
-        self.timer2.timeout.connect(self.face_photo)
+        # Frame the label's QImage was built on; Qt reads it without copying
+        self._last_frame = None
+        # Sequence number of the last frame face_photo looked at
+        self._last_seq = 0
+        # face_detection runs the classifier on every other frame and
+        # redraws the previous boxes in between
+        self._frame_parity = 0
+        self._last_faces = ()
+        # Captured faces are encoded and written here, off the GUI thread
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="face-io")
+        # Detection runs per received frame rather than on a timer
+        if network is not None:
+            network.faceFrame.connect(self.face_detection, Qt.QueuedConnection)
+            network.faceFrame.connect(self.face_photo, Qt.QueuedConnection)
+            network.face_frames = True
 
     def closeEvent(self, event):
-        self.timer1.stop()
+        if self.network is not None:
+            self.network.face_frames = False
+            self.network.faceFrame.disconnect(self.face_detection)
+            self.network.faceFrame.disconnect(self.face_photo)
+        # Queued writes still finish; just don't block the close on them
+        self._io_pool.shutdown(wait=False)
         self.client.fece_id = False
 
     def read_face(self):
@@ -1497,74 +1705,99 @@ class FaceWindow(QMainWindow,Ui_Face):
                 self.face_image = ''
                 self.photoCount = 0
                 self.timeout = time.time()
-                self.timer2.start(TIMER_PHOTO_MS)  # Use constant for timer interval
             elif self.Button_Read_Face.text() == "Reading":
                 self.Button_Read_Face.setText("Read Face")
                 self.readFaceFlag = False
-                self.timer2.stop()
-        except Exception as e:
-            print(e)
+        except Exception:
+            logger.exception("Error in FaceWindow.read_face")
 
-    def face_photo(self):
+    def face_photo(self, bgr, gray, seq):
         try:
+            if seq == self._last_seq or not self.readFaceFlag:
+                return
+            # Keep the old capture pace of one look per TIMER_PHOTO_MS
+            if (time.time() - self.timeout) * 1000 < TIMER_PHOTO_MS:
+                return
+            self._last_seq = seq
+            self.timeout = time.time()
             if self.photoCount == 30:
                 self.photoCount = 0
-                self.timer2.stop()
+                self.readFaceFlag = False
                 self.Button_Read_Face.setText("Read Face")
-            else:
-                if (len(self.client.image) > 0) and self.readFaceFlag:
-                    gray = cv2.cvtColor(self.client.image, cv2.COLOR_BGR2GRAY)
-                    faces = self.client.face.classifier.detectMultiScale(gray, 1.2, 5)
-                    if len(faces) > 0:
-                        x, y, w, h = faces[0]
-                        self.face_image = self.client.image[y - 20:y + h + 20, x - 20:x + w + 20].copy()
-                        self.save_face_photo()
-                        self.timeout = time.time()
-                        self.Button_Read_Face.setText("Reading " + str(1) + "S   " + str(self.photoCount) + "/30")
-                    else:
-                        self.Button_Read_Face.setText("Reading " + str(1) + "S   " + str(self.photoCount) + "/30")
-                else:
-                    second = int(time.time() - self.timeout)
-                    if second > 1:
-                        self.save_face_photo()
-                        self.timeout = time.time()
-                    else:
-                        self.Button_Read_Face.setText("Reading " + str(1 - second) + "S   " + str(self.photoCount) + "/30")
-        except Exception as e:
-            print(e)
+                return
+            faces = self._detect_faces(gray)
+            if len(faces) > 0:
+                x, y, w, h = faces[0]
+                self.face_image = bgr[y - 20:y + h + 20, x - 20:x + w + 20].copy()
+                self.save_face_photo()
+            self.Button_Read_Face.setText("Reading " + str(1) + "S   " + str(self.photoCount) + "/30")
+        except Exception:
+            logger.exception("Error in FaceWindow.face_photo")
 
     def save_face_photo(self):
         cv2.cvtColor(self.face_image, cv2.COLOR_BGR2RGB, self.face_image)
-        cv2.imwrite('Face/' + str(len(self.client.face.name)) + '.jpg', self.face_image)
+        # face_image is a fresh crop per capture, so the worker can own it
+        self._io_pool.submit(self._write_jpg, f"Face/{len(self.client.face.name)}.jpg", self.face_image)
         self.client.face.name.append([str(len(self.client.face.name)), str(self.name)])
         self.name = ''
         self.photoCount += 1
         self.Button_Read_Face.setText("Reading " + str(0) + " S " + str(self.photoCount) + "/30")
 
-    def face_detection(self):
+    def _write_jpg(self, filename, image):
         try:
-            if len(self.client.image) > 0:
-                gray = cv2.cvtColor(self.client.image, cv2.COLOR_BGR2GRAY)
-                faces = self.client.face.classifier.detectMultiScale(gray, 1.2, 5)
-                if len(faces) > 0:
-                    x, y, w, h = faces[0]
-                    cv2.rectangle(self.client.image, (x - 20, y - 20), (x + w + 20, y + h + 20), (0, 255, 0), 2)
-                if not self.client.video_flag:
-                    height, width, bytesPerComponent = self.client.image.shape
-                    cv2.cvtColor(self.client.image, cv2.COLOR_BGR2RGB, self.client.image)
-                    QImg = QImage(self.client.image.data.tobytes(), width, height, 3 * width, QImage.Format_RGB888)
-                    self.label_video.setPixmap(QPixmap.fromImage(QImg))
-                    self.client.video_flag = True
-        except Exception as e:
-            print(e)
+            with open(filename, 'wb') as f:
+                f.write(encode_jpeg(image))
+        except Exception:
+            logger.exception("Error in FaceWindow._write_jpg")
+
+    def _detect_faces(self, gray):
+        """Detect faces on a downscaled copy and return boxes in full-frame pixels."""
+        small = cv2.resize(gray, None, fx=FACE_DETECT_SCALE, fy=FACE_DETECT_SCALE,
+                           interpolation=cv2.INTER_AREA)
+        faces = self.client.face.detector.detectMultiScale(small, scaleFactor=1.2, minNeighbors=5,
+                                                          minSize=FACE_MIN_SIZE, maxSize=FACE_MAX_SIZE)
+        if len(faces) == 0:
+            return ()
+        return (np.asarray(faces) / FACE_DETECT_SCALE).astype(int)
+
+    def face_detection(self, bgr, gray, seq):
+        try:
+            self._frame_parity ^= 1
+            if self._frame_parity:
+                self._last_faces = self._detect_faces(gray)
+            faces = self._last_faces
+            if len(faces) > 0:
+                x, y, w, h = faces[0]
+                # The frame is shared with FrameDecoder's zero-copy QImage;
+                # draw on our own copy
+                bgr = bgr.copy()
+                cv2.rectangle(bgr, (x - 20, y - 20), (x + w + 20, y + h + 20), (0, 255, 0), 2)
+            if not self.client.video_flag:
+                # Qt reads the BGR pixels directly, so no colour conversion or copy
+                frame = self._last_frame = np.ascontiguousarray(bgr)
+                height, width, bytesPerComponent = frame.shape
+                QImg = QImage(frame.data, width, height, frame.strides[0], QImage.Format_BGR888)
+                self.label_video.setPixmap(QPixmap.fromImage(QImg))
+                self.client.video_flag = True
+        except Exception:
+            logger.exception("Error in FaceWindow.face_detection")
 
 class CalibrationWindow(QMainWindow, Ui_calibration):
+    # Encoded once: per-leg nudge templates and the save command
+    _CAL_FMTS = {leg: f"{cmd.CMD_CALIBRATION}#{leg}#%d#%d#%d\n".encode()
+                 for leg in ("one", "two", "three", "four", "five", "six")}
+    _CAL_SAVE = f"{cmd.CMD_CALIBRATION}#save\n".encode()
+
     def __init__(self, client):
         super(CalibrationWindow, self).__init__()
         self.setupUi(self)
         self.setWindowIcon(QIcon('Picture/logo_Mini.png'))
         self.label_picture.setScaledContents(True)
         self.label_picture.setPixmap(QPixmap('Picture/Spider_calibration.png'))
+        # Leg name -> row in self.point, and that leg's x/y/z line edits
+        self._legs = {"one": 0, "two": 1, "three": 2, "four": 3, "five": 4, "six": 5}
+        self._widgets = {leg: (getattr(self, f"{leg}_x"), getattr(self, f"{leg}_y"), getattr(self, f"{leg}_z"))
+                         for leg in self._legs}
         self.point = self.read_from_txt('point')
         self.set_point(self.point)
         self.client = client
@@ -1592,165 +1825,64 @@ class CalibrationWindow(QMainWindow, Ui_calibration):
         self.Button_Z1.clicked.connect(self.z1)
         self.Button_Z2.clicked.connect(self.z2)
 
+    def _send_cal(self):
+        self.client.send_data(self._CAL_FMTS[self.leg] % (self.x, self.y, self.z))
+
     def x1(self):
         self.get_point()
         self.x += 1
-        command = cmd.CMD_CALIBRATION + '#' + self.leg + '#' + str(self.x) + '#' + str(self.y) + '#' + str(self.z) + '\n'
-        self.client.send_data(command)
+        self._send_cal()
         self.set_point()
 
     def x2(self):
         self.get_point()
         self.x -= 1
-        command = cmd.CMD_CALIBRATION + '#' + self.leg + '#' + str(self.x) + '#' + str(self.y) + '#' + str(self.z) + '\n'
-        self.client.send_data(command)
+        self._send_cal()
         self.set_point()
 
     def y1(self):
         self.get_point()
         self.y += 1
-        command = cmd.CMD_CALIBRATION + '#' + self.leg + '#' + str(self.x) + '#' + str(self.y) + '#' + str(self.z) + '\n'
-        self.client.send_data(command)
+        self._send_cal()
         self.set_point()
 
     def y2(self):
         self.get_point()
         self.y -= 1
-        command = cmd.CMD_CALIBRATION + '#' + self.leg + '#' + str(self.x) + '#' + str(self.y) + '#' + str(self.z) + '\n'
-        self.client.send_data(command)
+        self._send_cal()
         self.set_point()
 
     def z1(self):
         self.get_point()
         self.z += 1
-        command = cmd.CMD_CALIBRATION + '#' + self.leg + '#' + str(self.x) + '#' + str(self.y) + '#' + str(self.z) + '\n'
-        self.client.send_data(command)
+        self._send_cal()
         self.set_point()
 
     def z2(self):
         self.get_point()
         self.z -= 1
-        command = cmd.CMD_CALIBRATION + '#' + self.leg + '#' + str(self.x) + '#' + str(self.y) + '#' + str(self.z) + '\n'
-        self.client.send_data(command)
+        self._send_cal()
         self.set_point()
 
     def set_point(self, data=None):
         if data is None:
-            if self.leg == "one":
-                self.one_x.setText(str(self.x))
-                self.one_y.setText(str(self.y))
-                self.one_z.setText(str(self.z))
-                self.point[0][0] = self.x
-                self.point[0][1] = self.y
-                self.point[0][2] = self.z
-            elif self.leg == "two":
-                self.two_x.setText(str(self.x))
-                self.two_y.setText(str(self.y))
-                self.two_z.setText(str(self.z))
-                self.point[1][0] = self.x
-                self.point[1][1] = self.y
-                self.point[1][2] = self.z
-            elif self.leg == "three":
-                self.three_x.setText(str(self.x))
-                self.three_y.setText(str(self.y))
-                self.three_z.setText(str(self.z))
-                self.point[2][0] = self.x
-                self.point[2][1] = self.y
-                self.point[2][2] = self.z
-            elif self.leg == "four":
-                self.four_x.setText(str(self.x))
-                self.four_y.setText(str(self.y))
-                self.four_z.setText(str(self.z))
-                self.point[3][0] = self.x
-                self.point[3][1] = self.y
-                self.point[3][2] = self.z
-            elif self.leg == "five":
-                self.five_x.setText(str(self.x))
-                self.five_y.setText(str(self.y))
-                self.five_z.setText(str(self.z))
-                self.point[4][0] = self.x
-                self.point[4][1] = self.y
-                self.point[4][2] = self.z
-            elif self.leg == "six":
-                self.six_x.setText(str(self.x))
-                self.six_y.setText(str(self.y))
-                self.six_z.setText(str(self.z))
-                self.point[5][0] = self.x
-                self.point[5][1] = self.y
-                self.point[5][2] = self.z
+            for widget, value in zip(self._widgets[self.leg], (self.x, self.y, self.z)):
+                widget.setText(str(value))
+            self.point[self._legs[self.leg]][:3] = [self.x, self.y, self.z]
         else:
-            self.one_x.setText(str(data[0][0]))
-            self.one_y.setText(str(data[0][1]))
-            self.one_z.setText(str(data[0][2]))
-            self.two_x.setText(str(data[1][0]))
-            self.two_y.setText(str(data[1][1]))
-            self.two_z.setText(str(data[1][2]))
-            self.three_x.setText(str(data[2][0]))
-            self.three_y.setText(str(data[2][1]))
-            self.three_z.setText(str(data[2][2]))
-            self.four_x.setText(str(data[3][0]))
-            self.four_y.setText(str(data[3][1]))
-            self.four_z.setText(str(data[3][2]))
-            self.five_x.setText(str(data[4][0]))
-            self.five_y.setText(str(data[4][1]))
-            self.five_z.setText(str(data[4][2]))
-            self.six_x.setText(str(data[5][0]))
-            self.six_y.setText(str(data[5][1]))
-            self.six_z.setText(str(data[5][2]))
+            for leg, row in self._legs.items():
+                for widget, value in zip(self._widgets[leg], data[row]):
+                    widget.setText(str(value))
 
     def get_point(self):
-        if self.leg == "one":
-            self.x = int(self.one_x.text())
-            self.y = int(self.one_y.text())
-            self.z = int(self.one_z.text())
-        elif self.leg == "two":
-            self.x = int(self.two_x.text())
-            self.y = int(self.two_y.text())
-            self.z = int(self.two_z.text())
-        elif self.leg == "three":
-            self.x = int(self.three_x.text())
-            self.y = int(self.three_y.text())
-            self.z = int(self.three_z.text())
-        elif self.leg == "four":
-            self.x = int(self.four_x.text())
-            self.y = int(self.four_y.text())
-            self.z = int(self.four_z.text())
-        elif self.leg == "five":
-            self.x = int(self.five_x.text())
-            self.y = int(self.five_y.text())
-            self.z = int(self.five_z.text())
-        elif self.leg == "six":
-            self.x = int(self.six_x.text())
-            self.y = int(self.six_y.text())
-            self.z = int(self.six_z.text())
+        wx, wy, wz = self._widgets[self.leg]
+        self.x, self.y, self.z = int(wx.text()), int(wy.text()), int(wz.text())
 
     def save(self):
-        command = cmd.CMD_CALIBRATION + '#' + 'save' + '\n'
-        self.client.send_data(command)
-
-        self.point[0][0] = self.one_x.text()
-        self.point[0][1] = self.one_y.text()
-        self.point[0][2] = self.one_z.text()
-
-        self.point[1][0] = self.two_x.text()
-        self.point[1][1] = self.two_y.text()
-        self.point[1][2] = self.two_z.text()
-
-        self.point[2][0] = self.three_x.text()
-        self.point[2][1] = self.three_y.text()
-        self.point[2][2] = self.three_z.text()
-
-        self.point[3][0] = self.four_x.text()
-        self.point[3][1] = self.four_y.text()
-        self.point[3][2] = self.four_z.text()
-
-        self.point[4][0] = self.five_x.text()
-        self.point[4][1] = self.five_y.text()
-        self.point[4][2] = self.five_z.text()
+        self.client.send_data(self._CAL_SAVE)
 
-        self.point[5][0] = self.six_x.text()
-        self.point[5][1] = self.six_y.text()
-        self.point[5][2] = self.six_z.text()
+        for leg, row in self._legs.items():
+            self.point[row][:3] = [widget.text() for widget in self._widgets[leg]]
 
         self.save_to_txt(self.point, 'point')
         reply = QMessageBox.information(self,
@@ -1759,54 +1891,32 @@ class CalibrationWindow(QMainWindow, Ui_calibration):
                                         QMessageBox.Yes)
 
     def read_from_txt(self, filename):
-        file1 = open(filename + ".txt", "r")
-        list_row = file1.readlines()
-        list_source = []
-        for i in range(len(list_row)):
-            list_source.append(list_row[i].split())
-        file1.close()
-        return list_source
+        # tolist() keeps self.point a nested list for the per-cell updates
+        return np.loadtxt(filename + ".txt", dtype=int, ndmin=2).tolist()
 
     def save_to_txt(self, list, filename):
-        file2 = open(filename + '.txt', 'w')
-        for i in range(len(list)):
-            for j in range(len(list[i])):
-                if j == len(list[i]) - 1:
-                    file2.write(str(list[i][j]) + "\n")
-                else:
-                    file2.write(str(list[i][j]) + '\t')
-        file2.close()
+        np.savetxt(filename + '.txt', np.asarray(list, dtype=int), fmt='%d', delimiter='\t')
 
     def leg_point(self, leg):
-        if leg.text() == "One":
-            if leg.isChecked():
-                self.leg = "one"
-        elif leg.text() == "Two":
-            if leg.isChecked() == True:
-                self.leg = "two"
-        elif leg.text() == "Three":
-            if leg.isChecked() == True:
-                self.leg = "three"
-        elif leg.text() == "Four":
-            if leg.isChecked() == True:
-                self.leg = "four"
-        elif leg.text() == "Five":
-            if leg.isChecked() == True:
-                self.leg = "five"
-        elif leg.text() == "Six":
-            if leg.isChecked() == True:
-                self.leg = "six"
-
+        if leg.isChecked():
+            self.leg = leg.text().lower()
 
 class ColorDialog(QtWidgets.QColorDialog):
+    # Only the hue/saturation square and the luminance bar stay visible
+    _KEEP = frozenset(("QColorPicker", "QColorLuminancePicker"))
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setOptions(self.options() | QtWidgets.QColorDialog.DontUseNativeDialog)
-        for children in self.findChildren(QtWidgets.QWidget):
-            classname = children.metaObject().className()
-            if classname not in ("QColorPicker", "QColorLuminancePicker"):
-                children.hide()
+        for child in self.findChildren(QtWidgets.QWidget):
+            if child.metaObject().className() not in self._KEEP:
+                child.hide()
 class LedWindow(QMainWindow,Ui_led):
+    # Radio button caption -> LED mode command, encoded once
+    _LED_CMDS = {f"Mode {i}": f"{cmd.CMD_LED_MOD}#{i}\n".encode() for i in range(1, 6)}
+    _LED_OFF = f"{cmd.CMD_LED_MOD}#0\n".encode()
+    _LED_FMT = f"{cmd.CMD_LED}#%d#%d#%d\n".encode()
+
     def __init__(self,client):
         super(LedWindow,self).__init__()
         self.setupUi(self)
@@ -1820,11 +1930,11 @@ class LedWindow(QMainWindow,Ui_led):
         self.dial_color.setPageStep(10)
         self.dial_color.setNotchTarget(10)
         self.dial_color.valueChanged.connect(self.dial_value_changed)
-        composite_2f = lambda f, g: lambda t: g(f(t))
-        self.hsl_to_rgb255 = composite_2f(self.hsl_to_rgb01, self.rgb01_to_rgb255)
-        self.hsl_to_rgbhex = composite_2f(self.hsl_to_rgb255, self.rgb255_to_rgbhex)
-        self.rgb255_to_hsl = composite_2f(self.rgb255_to_rgb01, self.rgb01_to_hsl)
-        self.rgbhex_to_hsl = composite_2f(self.rgbhex_to_rgb255, self.rgb255_to_hsl)
+        # Colour edits update the preview at once but send only the last value
+        self._led_timer = QTimer(self)
+        self._led_timer.setSingleShot(True)
+        self._led_timer.setInterval(LED_DEBOUNCE_MS)
+        self._led_timer.timeout.connect(self.mode1_color)
         self.colordialog = ColorDialog()
         self.colordialog.currentColorChanged.connect(self.on_current_color_changed)
         lay = QtWidgets.QVBoxLayout(self.widget)
@@ -1843,43 +1953,25 @@ class LedWindow(QMainWindow,Ui_led):
         self.radioButtonFive.toggled.connect(lambda: self.led_mode(self.radioButtonFive))
 
     def lights_out(self):
-        command = cmd.CMD_LED_MOD + '#' + '0' + '\n'
-        self.client.send_data(command)
+        self.client.send_data(self._LED_OFF)
     def led_mode(self,index):
-        if index.text() == "Mode 1":
-            if index.isChecked() == True:
-                command = cmd.CMD_LED_MOD + '#' + '1' + '\n'
-                self.client.send_data(command)
-        elif index.text() == "Mode 2":
-            if index.isChecked() == True:
-                command = cmd.CMD_LED_MOD + '#' + '2' + '\n'
-                self.client.send_data(command)
-        elif index.text() == "Mode 3":
-            if index.isChecked() == True:
-                command = cmd.CMD_LED_MOD + '#' + '3' + '\n'
-                self.client.send_data(command)
-        elif index.text() == "Mode 4":
-            if index.isChecked() == True:
-                command = cmd.CMD_LED_MOD + '#' + '4' + '\n'
-                self.client.send_data(command)
-        elif index.text() == "Mode 5":
-            if index.isChecked() == True:
-                command = cmd.CMD_LED_MOD + '#' + '5' + '\n'
-                self.client.send_data(command)
+        command = self._LED_CMDS.get(index.text())
+        if command is not None and index.isChecked():
+            self.client.send_data(command)
     def mode1_color(self):
         if (self.radioButtonOne.isChecked() == True) or (self.radioButtonThree.isChecked() == True):
-            command = cmd.CMD_LED + '#' + str(self.rgb[0]) + '#' + str(self.rgb[1]) + '#' + str(self.rgb[2]) + '\n'
+            command = self._LED_FMT % (self.rgb[0], self.rgb[1], self.rgb[2])
             self.client.send_data(command)
     def on_current_color_changed(self, color):
         try:
-            self.rgb = self.rgbhex_to_rgb255(color.name())
+            self.rgb = np.array((color.red(), color.green(), color.blue()))
             self.hsl = self.rgb255_to_hsl(self.rgb)
             self.change_hsl_text()
             self.change_rgb_text()
-            self.mode1_color()
+            self._led_timer.start()
             self.update()
-        except Exception as e:
-            print(e)
+        except Exception:
+            logger.exception("Error in LedWindow.on_current_color_changed")
 
     def paintEvent(self, e):
         try:
@@ -1889,20 +1981,21 @@ class LedWindow(QMainWindow,Ui_led):
             qp.setBrush(brush)
             qp.drawRect(20, 10, 80, 30)
             qp.end()
-        except Exception as e:
-            print(e)
+        except Exception:
+            logger.exception("Error in LedWindow.paintEvent")
 
     def dial_value_changed(self):
         try:
             self.lineEdit_H.setText(str(self.dial_color.value()))
             self.change_hsl()
-            self.hex = self.hsl_to_rgbhex((self.hsl[0], self.hsl[1], self.hsl[2]))
-            self.rgb = self.rgbhex_to_rgb255(self.hex)
+            # Same clamp-and-truncate the hex round trip used to do
+            self.rgb = self.clamp_rgb255(self.hsl_to_rgb255(self.hsl))
+            self.hex = self.rgb255_to_rgbhex(self.rgb)
             self.change_rgb_text()
-            self.mode1_color()
+            self._led_timer.start()
             self.update()
-        except Exception as e:
-            print(e)
+        except Exception:
+            logger.exception("Error in LedWindow.dial_value_changed")
 
     def change_hsl(self):
         self.hsl[0] = float(self.lineEdit_H.text())
@@ -1919,9 +2012,12 @@ class LedWindow(QMainWindow,Ui_led):
         self.lineEdit_G.setText(str(self.rgb[1]))
         self.lineEdit_B.setText(str(self.rgb[2]))
 
+    def clamp_rgb255(self, rgb: np.array) -> np.array:
+        return np.clip(rgb, 0, 255).astype(int)
+
     def rgb255_to_rgbhex(self, rgb:np.array) -> str:
-        f = lambda n: 0 if n < 0 else 255 if n > 255 else int(n)
-        return '#%02x%02x%02x' % (f(rgb[0]), f(rgb[1]), f(rgb[2]))
+        r, g, b = self.clamp_rgb255(rgb)
+        return f"#{r:02x}{g:02x}{b:02x}"
 
     def rgbhex_to_rgb255(self, rgbhex: str) -> np.array:
         if rgbhex[0] == '#':
@@ -1937,20 +2033,37 @@ class LedWindow(QMainWindow,Ui_led):
     def rgb255_to_rgb01(self, rgb: np.array) -> np.array:
         return rgb / 255
 
+    def hsl_to_rgb255(self, hsl: np.array) -> np.array:
+        return self.rgb01_to_rgb255(self.hsl_to_rgb01(hsl))
+
+    def hsl_to_rgbhex(self, hsl: np.array) -> str:
+        return self.rgb255_to_rgbhex(self.hsl_to_rgb255(hsl))
+
+    def rgb255_to_hsl(self, rgb: np.array) -> np.array:
+        return self.rgb01_to_hsl(self.rgb255_to_rgb01(rgb))
+
+    def rgbhex_to_hsl(self, rgbhex: str) -> np.array:
+        return self.rgb255_to_hsl(self.rgbhex_to_rgb255(rgbhex))
+
+    # Hue offset and channel pair (a, b) for the hue term 60 * (a - b) / chroma,
+    # in the order (b, r, g) so argmin breaks ties the way the old if-chain did
+    _HUE_OFFSET = np.array((60, 180, 300))
+    _HUE_TERMS = np.array(((2, 1), (0, 2), (1, 0)))
+    # For each 60-degree hue sector, which of (lmax, mid, lmin) goes to r, g, b
+    _SECTOR_CHANNELS = np.array(((0, 1, 2), (1, 0, 2), (2, 0, 1),
+                                 (2, 1, 0), (1, 2, 0), (0, 2, 1)))
+
     def rgb01_to_hsl(self, rgb: np.array) -> np.array:
         r, g, b = rgb
-        lmin = min(r, g, b)
-        lmax = max(r, g, b)
+        brg = np.array((b, r, g))
+        lmin = brg.min()
+        lmax = brg.max()
         if lmax == lmin:
             h = 0
-        elif lmin == b:
-            h = 60 + 60 * (g - r) / (lmax - lmin)
-        elif lmin == r:
-            h = 180 + 60 * (b - g) / (lmax - lmin)
-        elif lmin == g:
-            h = 300 + 60 * (r - b) / (lmax - lmin)
         else:
-            h = 0
+            i = brg.argmin()
+            a, c = self._HUE_TERMS[i]
+            h = self._HUE_OFFSET[i] + 60 * (brg[a] - brg[c]) / (lmax - lmin)
         s = lmax - lmin
         l = (lmax + lmin) / 2
         hsl = np.array((h, s, l))
@@ -1961,31 +2074,27 @@ class LedWindow(QMainWindow,Ui_led):
         lmin = l - s / 2
         lmax = l + s / 2
         ldif = lmax - lmin
-        if h < 60:
-            r, g, b = lmax, lmin + ldif * (0 + h) / 60, lmin
-        elif h < 120:
-            r, g, b = lmin + ldif * (120 - h) / 60, lmax, lmin
-        elif h < 180:
-            r, g, b = lmin, lmax, lmin + ldif * (h - 120) / 60
-        elif h < 240:
-            r, g, b = lmin, lmin + ldif * (240 - h) / 60, lmax
-        elif h < 300:
-            r, g, b = lmin + ldif * (h - 240) / 60, lmin, lmax
+        sector = min(max(int(h) // 60, 0), 5)
+        # The middle channel ramps up in even sectors and down in odd ones
+        if sector % 2 == 0:
+            mid = lmin + ldif * (h - sector * 60) / 60
         else:
-            r, g, b = lmax, lmin, lmin + ldif * (360 - h) / 60
-        rgb = np.array((r, g, b))
+            mid = lmin + ldif * (sector * 60 + 60 - h) / 60
+        rgb = np.array((lmax, mid, lmin))[self._SECTOR_CHANNELS[sector]]
         return rgb
 
+
 def load_styles(app):
     """Load and apply styles from the external QSS file."""
     try:
         style_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'styles/styles.qss')
         with open(style_file, 'r') as f:
             app.setStyleSheet(f.read())
-    except Exception as e:
-        print(f"Error loading stylesheet: {e}")
+    except Exception:
+        logger.exception("Error loading stylesheet")
 
 if __name__ == '__main__':
+    configure_logging()
     app = QApplication(sys.argv)
     load_styles(app)
     myshow = MyWindow()
@@ -16,6 +16,7 @@ from .utils import (
     validate_range,
     clamp,
     map_value,
+    map_value_array,
     Singleton
 )
 
@@ -69,5 +70,6 @@ __all__ = [
     'validate_range',
     'clamp',
     'map_value',
+    'map_value_array',
     'Singleton',
 ]
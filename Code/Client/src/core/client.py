@@ -5,22 +5,22 @@ This module handles all network communication between the client and server,
 including video streaming and command transmission.
 """
 
-import io
+import contextlib
 import logging
+import os
+import queue
 import socket
-import struct
 import threading
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple, Union
 
 import cv2
-import numpy as np
-from PIL import Image
 
 # Local imports
 from src.core.command import COMMAND as cmd
 from src.models.face import Face
 from src.models.pid import Incremental_PID
 from src.core.thread import *
+from src.utils.jpeg import decode_jpeg
 
 
 class Client:
@@ -34,6 +34,27 @@ class Client:
     DEFAULT_VIDEO_PORT = 8002
     DEFAULT_COMMAND_PORT = 5002
     SOCKET_TIMEOUT = 5.0
+    # Read buffer for the video stream, so a frame header and body
+    # usually come out of one recv
+    VIDEO_READ_BUFFER = 65536
+    # Commands waiting for the sender thread beyond this evict the oldest
+    TX_QUEUE_SIZE = 128
+    # Initial size of the reused JPEG receive buffer; grows on demand
+    JPEG_BUFFER_SIZE = 1 << 20
+    # Largest frame accepted from the robot, as in src.core.video; the
+    # receive buffer never grows past it
+    MAX_FRAME_SIZE = 10 * 1024 * 1024
+    # Absolute-state commands where only the newest pending one matters
+    TX_COALESCE_PREFIXES = tuple(
+        (name + '#').encode()
+        for name in (cmd.CMD_LED, cmd.CMD_MOVE, cmd.CMD_ATTITUDE, cmd.CMD_POSITION)
+    )
+    # Upper bound for OpenCV's worker pool; the GUI and socket threads
+    # need cores too
+    CV_MAX_THREADS = 4
+    # cv::CPU_AVX2; not every cv2 build exports the constant
+    _CV_CPU_AVX2 = 11
+    _cv_configured = False
     
     def __init__(self) -> None:
         """Initialize the client with default settings."""
@@ -47,8 +68,37 @@ class Client:
         self._client_socket = None
         self._command_socket = None
         self._connection = None
+        # Frames are read into this and decoded before the next read
+        self._jpg_buf = bytearray(self.JPEG_BUFFER_SIZE)
         self._lock = threading.Lock()
         self._logger = self._setup_logger()
+        self._configure_opencv()
+        # Outgoing (coalesce key, data) pairs; a daemon thread owns the
+        # blocking sendall so callers on the GUI thread never wait on the network
+        self._tx_queue: "queue.Queue[Tuple[Optional[bytes], Optional[bytes]]]" = queue.Queue(maxsize=self.TX_QUEUE_SIZE)
+        # Newest data for each coalesce key that has an entry in the queue
+        self._tx_latest: Dict[bytes, bytes] = {}
+        self._tx_lock = threading.Lock()
+        self._tx_thread = threading.Thread(target=self._tx_worker, name="client-tx", daemon=True)
+        self._tx_thread.start()
+    
+    def _configure_opencv(self) -> None:
+        """Enable OpenCV's SIMD kernels and size its thread pool, once per process."""
+        if Client._cv_configured:
+            return
+        Client._cv_configured = True
+        cv2.setUseOptimized(True)
+        cv2.setNumThreads(min(self.CV_MAX_THREADS, os.cpu_count() or 1))
+        features = cv2.getCPUFeaturesLine()
+        if self._logger.isEnabledFor(logging.DEBUG):
+            build_info = cv2.getBuildInformation().splitlines()[:40]
+            self._logger.debug("OpenCV build information:\n%s", "\n".join(build_info))
+            self._logger.debug("OpenCV CPU features: %s", features)
+        if cv2.checkHardwareSupport(self._CV_CPU_AVX2) and 'AVX2' not in features:
+            self._logger.warning(
+                "This OpenCV build lacks AVX2 dispatch although the CPU supports it; "
+                "a newer OpenCV build would speed up colour conversion and resizing"
+            )
     
     def turn_on_client(self, ip: str) -> None:
         """Initialize client sockets.
@@ -62,6 +112,8 @@ class Client:
                 self._command_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
                 self._client_socket.settimeout(self.SOCKET_TIMEOUT)
                 self._command_socket.settimeout(self.SOCKET_TIMEOUT)
+                # Commands are small and latency-sensitive; send them unbuffered
+                self._command_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
                 self.tcp_flag = True
                 self._logger.info(f"Connected to server at {ip}")
             except socket.error as e:
@@ -73,15 +125,19 @@ class Client:
         """Safely close all socket connections."""
         with self._lock:
             self.tcp_flag = False
-            for sock in [self._client_socket, self._command_socket, self._connection]:
-                if sock:
-                    try:
+            for sock in (self._client_socket, self._command_socket):
+                if sock is not None:
+                    # shutdown fails on a socket that never connected; close anyway
+                    with contextlib.suppress(OSError):
                         sock.shutdown(socket.SHUT_RDWR)
+                    with contextlib.suppress(OSError):
                         sock.close()
-                    except (OSError, AttributeError) as e:
-                        self._logger.debug(f"Error closing socket: {e}")
-                    finally:
-                        sock = None
+            if self._connection is not None:
+                with contextlib.suppress(OSError):
+                    self._connection.close()
+            self._client_socket = None
+            self._command_socket = None
+            self._connection = None
     
     def receiving_video(self, ip: str) -> None:
         """Handle video streaming from server.
@@ -94,21 +150,29 @@ class Client:
                 self.turn_on_client(ip)
                 
             self._client_socket.connect((ip, self.DEFAULT_VIDEO_PORT))
-            self._connection = self._client_socket.makefile('rb')
+            self._connection = self._client_socket.makefile('rb', buffering=self.VIDEO_READ_BUFFER)
             
             while True:
                 try:
                     stream_bytes = self._connection.read(4)
-                    if not stream_bytes:
+                    if len(stream_bytes) < 4:
                         break
                         
-                    length = struct.unpack('<L', stream_bytes[:4])[0]
-                    jpg = self._connection.read(length)
+                    length = int.from_bytes(stream_bytes, 'little')
+                    if length > self.MAX_FRAME_SIZE:
+                        # The stream can't be resynchronised after a bad header
+                        self._logger.warning(f"Invalid frame length: {length}")
+                        break
+                    if length > len(self._jpg_buf):
+                        self._jpg_buf = bytearray(min(length * 2, self.MAX_FRAME_SIZE))
+                    jpg = memoryview(self._jpg_buf)[:length]
+                    if self._connection.readinto(jpg) < length:
+                        break
                     
                     if self._is_valid_image(jpg) and self.video_flag:
                         self._process_video_frame(jpg)
                         
-                except (struct.error, ConnectionError) as e:
+                except ConnectionError as e:
                     self._logger.error(f"Video stream error: {e}")
                     break
                     
@@ -118,7 +182,7 @@ class Client:
         finally:
             self.turn_off_client()
     
-    def _is_valid_image(self, buf: bytes) -> bool:
+    def _is_valid_image(self, buf: Union[bytes, memoryview]) -> bool:
         """Validate image data.
         
         Args:
@@ -127,40 +191,88 @@ class Client:
         Returns:
             bool: True if valid image, False otherwise
         """
-        if buf[6:10] in (b'JFIF', b'Exif'):
-            return buf.rstrip(b'\0\r\n').endswith(b'\xff\xd9')
-        try:
-            Image.open(io.BytesIO(buf)).verify()
-            return True
-        except Exception:
-            return False
+        # Length-prefixed frames from our own server: checking the JPEG
+        # start/end markers is enough, the decoder rejects anything worse
+        end = len(buf)
+        while end and buf[end - 1] in b'\0\r\n':
+            end -= 1
+        return end >= 4 and buf[:2] == b'\xff\xd8' and buf[end - 2:end] == b'\xff\xd9'
     
-    def _process_video_frame(self, jpg: bytes) -> None:
+    def _process_video_frame(self, jpg: Union[bytes, memoryview]) -> None:
         """Process a single video frame.
         
         Args:
             jpg: JPEG image data
         """
-        self.image = cv2.imdecode(np.frombuffer(jpg, dtype=np.uint8), cv2.IMREAD_COLOR)
+        self.image = decode_jpeg(jpg)
         if not self.face_id and self.face_recognition_flag:
             self.face.face_detect(self.image)
         self.video_flag = False
     
-    def send_data(self, data: str) -> None:
-        """Send data to the server.
+    def send_data(self, data: Union[str, bytes]) -> None:
+        """Queue data for sending to the server.
+        
+        Returns immediately; the sender thread writes it to the socket.
         
         Args:
-            data: Data to send
+            data: Data to send; bytes are sent as-is
         """
         if not self.tcp_flag or not self._command_socket:
             self._logger.warning("Cannot send data: Not connected to server")
             return
-            
-        try:
-            self._command_socket.sendall(data.encode('utf-8'))
-        except (OSError, AttributeError) as e:
-            self._logger.error(f"Failed to send data: {e}")
-            self.tcp_flag = False
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        # Only a single command may be coalesced; a batch holds several
+        key = None
+        if data.count(b'\n') <= 1:
+            key = next((p for p in self.TX_COALESCE_PREFIXES if data.startswith(p)), None)
+        if key is None:
+            self._enqueue(None, data)
+            return
+        with self._tx_lock:
+            pending = key in self._tx_latest
+            self._tx_latest[key] = data
+        if not pending:
+            self._enqueue(key, None)
+    
+    def _enqueue(self, key: Optional[bytes], data: Optional[bytes]) -> None:
+        """Queue an entry, evicting the oldest one if the queue is full.
+        
+        On a stalled link the newest command (often a stop on release)
+        matters more than the stale ones ahead of it.
+        """
+        while True:
+            try:
+                self._tx_queue.put_nowait((key, data))
+                return
+            except queue.Full:
+                pass
+            # Under the lock so send_data can't update a slot being evicted
+            with self._tx_lock:
+                try:
+                    old_key, _ = self._tx_queue.get_nowait()
+                except queue.Empty:
+                    continue
+                if old_key is not None:
+                    self._tx_latest.pop(old_key, None)
+            self._logger.warning("Send queue full, dropping oldest command")
+    
+    def _tx_worker(self) -> None:
+        """Write queued data to the command socket, in order."""
+        while True:
+            key, data = self._tx_queue.get()
+            if key is not None:
+                with self._tx_lock:
+                    data = self._tx_latest.pop(key)
+            sock = self._command_socket
+            if not self.tcp_flag or sock is None:
+                # Dropped while disconnected, like a direct send would be
+                continue
+            try:
+                sock.sendall(data)
+            except (OSError, AttributeError) as e:
+                self._logger.error(f"Failed to send data: {e}")
+                self.tcp_flag = False
     
     def receive_data(self) -> str:
         """Receive data from the server.
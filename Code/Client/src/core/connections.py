@@ -1,9 +1,12 @@
 """Connection implementations for the Hexapod Robot."""
 
+import atexit
 import socket
 import select
+import threading
 import time
-from typing import Optional, Tuple, Union, Any
+from collections import deque
+from typing import Deque, Dict, Iterator, List, Optional, Sequence, Tuple, Union, Any
 
 from .interfaces import IConnection, ConnectionState
 from .exceptions import ConnectionError, TimeoutError
@@ -12,21 +15,38 @@ from .logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Kernel receive buffer requested on connect; large video frames need a
+# bigger TCP window than the default
+SOCKET_RCVBUF_SIZE = 1 << 20
+# Ask the kernel to fill the whole buffer in one recv where supported
+_MSG_WAITALL = getattr(socket, 'MSG_WAITALL', 0)
+
 class SocketConnection(IConnection):
     """Socket-based implementation of IConnection."""
     
+    # Connected sockets handed back by release(), per (host, port), so a
+    # reconnect can skip the TCP handshake
+    _pool: Dict[Tuple[str, int], List[socket.socket]] = {}
+    _pool_lock = threading.Lock()
+    POOL_SIZE = 2
+    
     def __init__(self, sock: Optional[socket.socket] = None):
         """Initialize the socket connection.
         
         Args:
             sock: Optional existing socket to use
         """
+        # Only a socket we created ourselves may be swapped for a pooled one
+        self._poolable = sock is None
         self._sock = sock or socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self._state = ThreadSafeValue(ConnectionState.DISCONNECTED, name="connection_state")
         self._lock = threading.RLock()
         self._host: Optional[str] = None
         self._port: Optional[int] = None
         self._timeout = 5.0
+        # Last timeout applied to the socket; settimeout is a syscall, so
+        # it is skipped when unchanged
+        self._current_timeout = self._sock.gettimeout()
     
     @property
     def state(self) -> ConnectionState:
@@ -62,10 +82,30 @@ class SocketConnection(IConnection):
             self._port = port
             self._timeout = timeout
             
+            pooled = self._take_pooled(host, port) if self._poolable else None
+            if pooled is not None:
+                if self._sock is not None:
+                    self._sock.close()
+                self._sock = pooled
+                self._current_timeout = pooled.gettimeout()
+                self._set_timeout(timeout)
+                self.state = ConnectionState.CONNECTED
+                logger.info(f"Reusing pooled connection to {host}:{port}")
+                return
+            
+            if self._sock is None:
+                # Closed by disconnect() or handed to the pool by release()
+                self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                self._current_timeout = self._sock.gettimeout()
+            
             try:
                 # Set socket options
                 self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-                self._sock.settimeout(timeout)
+                # The protocol writes a small length header before each body;
+                # don't let Nagle hold it back
+                self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_RCVBUF_SIZE)
+                self._set_timeout(timeout)
                 
                 # Connect
                 self._sock.connect((host, port))
@@ -78,19 +118,92 @@ class SocketConnection(IConnection):
                 logger.error(error_msg)
                 raise ConnectionError(error_msg) from e
     
-    def disconnect(self) -> None:
-        """Disconnect from the remote host."""
+    def fileno(self) -> int:
+        """Socket descriptor, so the connection can be registered with a selector."""
+        return self._sock.fileno() if self._sock else -1
+    
+    def release(self) -> None:
+        """Disconnect, keeping the socket open in the pool if it is still usable."""
         with self._lock:
-            if self.state == ConnectionState.DISCONNECTED:
+            if (self.state == ConnectionState.CONNECTED and self._host is not None
+                    and self._put_pooled(self._host, self._port, self._sock)):
+                self._sock = None
+                self.state = ConnectionState.DISCONNECTED
+                logger.info(f"Released connection to {self._host}:{self._port} to the pool")
                 return
-                
-            try:
-                if self._sock:
-                    self._sock.shutdown(socket.SHUT_RDWR)
-            except (OSError, AttributeError):
-                pass  # Socket already closed
-            finally:
-                self.close()
+        self.disconnect()
+    
+    @classmethod
+    def clear_pool(cls) -> None:
+        """Close every pooled socket, ending those sessions with the robot."""
+        with cls._pool_lock:
+            pools, cls._pool = cls._pool, {}
+        for socks in pools.values():
+            for sock in socks:
+                try:
+                    sock.close()
+                except OSError:
+                    pass
+    
+    @staticmethod
+    def _is_idle(sock: socket.socket) -> bool:
+        """Check that a pooled socket is open with nothing pending.
+        
+        Readable means the peer closed or sent data nobody will read;
+        either way the socket can't be handed out.
+        """
+        try:
+            readable, _, _ = select.select([sock], [], [], 0)
+        except (OSError, ValueError):
+            return False
+        return not readable
+    
+    @classmethod
+    def _take_pooled(cls, host: str, port: int) -> Optional[socket.socket]:
+        """Pop an idle pooled socket for host:port, closing stale ones."""
+        with cls._pool_lock:
+            socks = cls._pool.get((host, port), [])
+            while socks:
+                sock = socks.pop()
+                if cls._is_idle(sock):
+                    return sock
+                sock.close()
+        return None
+    
+    @classmethod
+    def _put_pooled(cls, host: str, port: int, sock: socket.socket) -> bool:
+        """Add a socket to the pool; False if it is stale or the pool is full."""
+        if not cls._is_idle(sock):
+            return False
+        with cls._pool_lock:
+            socks = cls._pool.setdefault((host, port), [])
+            if len(socks) >= cls.POOL_SIZE:
+                return False
+            socks.append(sock)
+        return True
+    
+    def _set_timeout(self, timeout: float) -> None:
+        """Apply a socket timeout if it differs from the current one."""
+        if timeout != self._current_timeout:
+            self._sock.settimeout(timeout)
+            self._current_timeout = timeout
+    
+    def disconnect(self) -> None:
+        """Disconnect from the remote host and close the socket."""
+        with self._lock:
+            sock, self._sock = self._sock, None
+            if sock is not None:
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass  # Never connected, or already shut down
+                try:
+                    sock.close()
+                except OSError:
+                    pass  # Socket already closed
+            if self.state != ConnectionState.DISCONNECTED:
+                self.state = ConnectionState.DISCONNECTED
+                logger.info("Connection closed")
     
     def send(self, data: bytes, timeout: Optional[float] = None) -> int:
         """Send data over the connection.
@@ -110,10 +223,64 @@ class SocketConnection(IConnection):
             raise ConnectionError("Not connected")
             
         if timeout is not None:
-            self._sock.settimeout(timeout)
+            self._set_timeout(timeout)
             
         try:
-            return self._sock.sendall(data)
+            # One send() normally writes a whole control message; only loop
+            # on a partial write. (sendall would return None, not the count)
+            view = memoryview(data)
+            total = 0
+            while total < len(view):
+                n = self._sock.send(view[total:])
+                if n == 0:
+                    self.state = ConnectionState.DISCONNECTED
+                    raise ConnectionError("Connection closed by peer")
+                total += n
+            return total
+        except socket.timeout as e:
+            raise TimeoutError("Send operation timed out") from e
+        except (socket.error, OSError) as e:
+            self.state = ConnectionState.DISCONNECTED
+            raise ConnectionError(f"Send failed: {e}") from e
+    
+    def sendv(self, buffers: Sequence[bytes], timeout: Optional[float] = None) -> int:
+        """Send several buffers with one scatter-gather syscall where possible.
+        
+        Args:
+            buffers: The buffers to send, in order
+            timeout: Optional timeout in seconds
+            
+        Returns:
+            int: Number of bytes sent
+            
+        Raises:
+            ConnectionError: If not connected or send fails
+            TimeoutError: If operation times out
+        """
+        if not hasattr(self._sock, 'sendmsg'):
+            # No sendmsg on Windows
+            return self.send(b''.join(buffers), timeout)
+        if self.state != ConnectionState.CONNECTED:
+            raise ConnectionError("Not connected")
+            
+        if timeout is not None:
+            self._set_timeout(timeout)
+            
+        try:
+            views = [memoryview(buf) for buf in buffers if buf]
+            total = 0
+            while views:
+                n = self._sock.sendmsg(views)
+                if n == 0:
+                    self.state = ConnectionState.DISCONNECTED
+                    raise ConnectionError("Connection closed by peer")
+                total += n
+                # Drop what was written and continue after a partial write
+                while views and n >= len(views[0]):
+                    n -= len(views.pop(0))
+                if n:
+                    views[0] = views[0][n:]
+            return total
         except socket.timeout as e:
             raise TimeoutError("Send operation timed out") from e
         except (socket.error, OSError) as e:
@@ -138,7 +305,7 @@ class SocketConnection(IConnection):
             raise ConnectionError("Not connected")
             
         if timeout is not None:
-            self._sock.settimeout(timeout)
+            self._set_timeout(timeout)
             
         try:
             data = self._sock.recv(size)
@@ -152,21 +319,75 @@ class SocketConnection(IConnection):
             self.state = ConnectionState.DISCONNECTED
             raise ConnectionError(f"Receive failed: {e}") from e
     
+    def recv_into(self, buf: memoryview, timeout: Optional[float] = None) -> int:
+        """Receive data directly into a caller-owned buffer.
+        
+        Args:
+            buf: Writable buffer to fill; at most len(buf) bytes are read
+            timeout: Optional timeout in seconds
+            
+        Returns:
+            int: Number of bytes written into buf
+            
+        Raises:
+            ConnectionError: If not connected or receive fails
+            TimeoutError: If operation times out
+        """
+        if self.state != ConnectionState.CONNECTED:
+            raise ConnectionError("Not connected")
+            
+        if timeout is not None:
+            self._set_timeout(timeout)
+            
+        try:
+            n = self._sock.recv_into(buf)
+            if not n:
+                self.state = ConnectionState.DISCONNECTED
+                raise ConnectionError("Connection closed by peer")
+            return n
+        except socket.timeout as e:
+            raise TimeoutError("Receive operation timed out") from e
+        except (socket.error, OSError) as e:
+            self.state = ConnectionState.DISCONNECTED
+            raise ConnectionError(f"Receive failed: {e}") from e
+    
+    def recv_exact(self, buf: memoryview, timeout: Optional[float] = None) -> None:
+        """Fill a caller-owned buffer completely.
+        
+        Uses MSG_WAITALL; the kernel can still return early (signals, or a
+        socket with a timeout, which CPython puts in non-blocking mode), so
+        short reads are continued.
+        
+        Args:
+            buf: Writable buffer to fill
+            timeout: Optional timeout in seconds, per underlying recv
+            
+        Raises:
+            ConnectionError: If not connected or receive fails
+            TimeoutError: If operation times out
+        """
+        if self.state != ConnectionState.CONNECTED:
+            raise ConnectionError("Not connected")
+            
+        if timeout is not None:
+            self._set_timeout(timeout)
+            
+        try:
+            while buf:
+                n = self._sock.recv_into(buf, len(buf), _MSG_WAITALL)
+                if not n:
+                    self.state = ConnectionState.DISCONNECTED
+                    raise ConnectionError("Connection closed by peer")
+                buf = buf[n:]
+        except socket.timeout as e:
+            raise TimeoutError("Receive operation timed out") from e
+        except (socket.error, OSError) as e:
+            self.state = ConnectionState.DISCONNECTED
+            raise ConnectionError(f"Receive failed: {e}") from e
+    
     def close(self) -> None:
         """Close the connection and release resources."""
-        with self._lock:
-            if self.state == ConnectionState.DISCONNECTED:
-                return
-                
-            try:
-                if self._sock:
-                    self._sock.close()
-            except (OSError, AttributeError):
-                pass  # Socket already closed
-            finally:
-                self._sock = None
-                self.state = ConnectionState.DISCONNECTED
-                logger.info("Connection closed")
+        self.disconnect()
     
     def __del__(self):
         """Ensure resources are cleaned up."""
@@ -180,7 +401,9 @@ class DummyConnection(IConnection):
         """Initialize the dummy connection."""
         self._state = ThreadSafeValue(ConnectionState.DISCONNECTED, name="dummy_connection_state")
         self._lock = threading.RLock()
-        self._buffer = bytearray()
+        # Sent chunks, oldest first; _head is the read offset into _chunks[0]
+        self._chunks: Deque[bytes] = deque()
+        self._head = 0
     
     @property
     def state(self) -> ConnectionState:
@@ -202,20 +425,59 @@ class DummyConnection(IConnection):
         if self.state != ConnectionState.CONNECTED:
             raise ConnectionError("Not connected")
         with self._lock:
-            self._buffer.extend(data)
+            self._chunks.append(bytes(data))
             return len(data)
     
+    def sendv(self, buffers: Sequence[bytes], timeout: Optional[float] = None) -> int:
+        """Simulate sending several buffers."""
+        return sum(self.send(buf, timeout) for buf in buffers)
+    
     def receive(self, size: int = 4096, timeout: Optional[float] = None) -> bytes:
         """Simulate receiving data."""
         if self.state != ConnectionState.CONNECTED:
             raise ConnectionError("Not connected")
         with self._lock:
-            result = bytes(self._buffer[:size])
-            self._buffer = self._buffer[size:]
-            return result
+            return b''.join(self._consume(size))
+    
+    def recv_into(self, buf: memoryview, timeout: Optional[float] = None) -> int:
+        """Simulate receiving data into a buffer."""
+        if self.state != ConnectionState.CONNECTED:
+            raise ConnectionError("Not connected")
+        with self._lock:
+            n = 0
+            for piece in self._consume(len(buf)):
+                buf[n:n + len(piece)] = piece
+                n += len(piece)
+            return n
+    
+    def release(self) -> None:
+        """Simulate releasing the connection; nothing is pooled."""
+        self.disconnect()
+    
+    def recv_exact(self, buf: memoryview, timeout: Optional[float] = None) -> None:
+        """Simulate filling a buffer completely."""
+        if self.recv_into(buf, timeout) < len(buf):
+            raise TimeoutError("Receive operation timed out")
+    
+    def _consume(self, size: int) -> Iterator[memoryview]:
+        """Take up to size buffered bytes, as views of the sent chunks."""
+        while size and self._chunks:
+            chunk = self._chunks[0]
+            piece = memoryview(chunk)[self._head:self._head + size]
+            size -= len(piece)
+            self._head += len(piece)
+            if self._head == len(chunk):
+                self._chunks.popleft()
+                self._head = 0
+            yield piece
     
     def close(self) -> None:
         """Clean up resources."""
         with self._lock:
             self._state.value = ConnectionState.DISCONNECTED
-            self._buffer.clear()
+            self._chunks.clear()
+            self._head = 0
+
+
+# Pooled sockets are otherwise only closed by the OS at exit
+atexit.register(SocketConnection.clear_pool)
@@ -1,8 +1,12 @@
 """Enhanced NetworkManager for Hexapod Robot."""
 
-import time
+import functools
+import queue
+import selectors
 import threading
-from typing import Optional, Callable, Any, Dict, Type
+import time
+from concurrent.futures import Future
+from typing import Optional, Callable, Any, Dict, Iterable, Type
 
 from .interfaces import IConnection, ConnectionState
 from .exceptions import ConnectionError, TimeoutError
@@ -14,9 +18,81 @@ from .logging_config import get_logger
 
 logger = get_logger(__name__)
 
+class _DaemonWorkers:
+    """Reusable daemon threads that connect loops are submitted to.
+    
+    ThreadPoolExecutor workers are joined at interpreter exit, so quitting
+    during a connect loop against an unreachable robot would wait for the
+    loop to give up. These threads are daemons instead, and a task never
+    queues behind a busy worker: a thread is started whenever none is idle,
+    and up to max_idle finished ones are kept for reuse.
+    """
+    
+    def __init__(self, max_idle: int = 4, name: str = "Worker") -> None:
+        """Initialize the workers.
+        
+        Args:
+            max_idle: Number of idle threads kept for reuse
+            name: Prefix for thread names
+        """
+        self._tasks: "queue.SimpleQueue[tuple]" = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._idle = 0
+        self._started = 0
+        self._max_idle = max_idle
+        self._name = name
+    
+    def submit(self, fn: Callable[[], Any]) -> Future:
+        """Run fn on an idle worker, or on a new one if all are busy.
+        
+        Args:
+            fn: Callable to run
+            
+        Returns:
+            Future: Resolves to fn's result; cancel() works until it starts
+        """
+        future: Future = Future()
+        with self._lock:
+            spawn = self._idle == 0
+            if spawn:
+                self._started += 1
+                index = self._started
+            else:
+                self._idle -= 1
+        self._tasks.put((future, fn))
+        if spawn:
+            threading.Thread(target=self._work, name=f"{self._name}_{index}", daemon=True).start()
+        return future
+    
+    def _work(self) -> None:
+        """Run tasks until more than max_idle workers would be idle."""
+        while True:
+            future, fn = self._tasks.get()
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(fn())
+                except BaseException as e:
+                    future.set_exception(e)
+            with self._lock:
+                if self._idle >= self._max_idle:
+                    return
+                self._idle += 1
+
 class NetworkManager:
     """Manages network connections and communication with the Hexapod Robot."""
     
+    # Connect loops of all managers run on these shared daemon workers
+    # instead of a new thread per connect()
+    _executor = _DaemonWorkers(max_idle=4, name="NetworkManagerConnect")
+    
+    # One I/O thread multiplexes the video sockets of all managers instead
+    # of a blocking reader thread per stream. Keys carry a zero-argument
+    # handler; _io_buf is only touched by that thread
+    _selector = selectors.DefaultSelector()
+    _selector_lock = threading.Lock()
+    _io_thread: Optional[threading.Thread] = None
+    _io_buf = memoryview(bytearray(65536))
+    
     def __init__(
         self,
         connection_class: Type[IConnection] = SocketConnection,
@@ -50,7 +126,7 @@ class NetworkManager:
         self._video_port: int = 8002
         
         # Thread management
-        self._reconnect_thread: Optional[threading.Thread] = None
+        self._reconnect_future: Optional[Future] = None
         self._stop_event = threading.Event()
     
     @property
@@ -104,19 +180,14 @@ class NetworkManager:
             
             # Stop any existing connections
             self._stop_reconnect_thread()
-            self._disconnect()
+            self._disconnect(keep_alive=True)
             
             # Start connection process
             self.state = ConnectionState.CONNECTING
             self._stop_event.clear()
             
-            # Start connection in a separate thread to avoid blocking
-            self._reconnect_thread = threading.Thread(
-                target=self._connect_loop,
-                name="NetworkManagerReconnectThread",
-                daemon=True
-            )
-            self._reconnect_thread.start()
+            # Run the connection loop on a pool worker to avoid blocking
+            self._reconnect_future = self._executor.submit(self._connect_loop)
     
     def _connect_loop(self) -> None:
         """Main connection loop with retries."""
@@ -139,9 +210,14 @@ class NetworkManager:
                 command_processor = CommandProcessor(control_conn)
                 video_stream = VideoStream(video_conn)
                 
-                # Start components
+                # Start components; connections with a descriptor are read
+                # by the shared I/O loop
                 command_processor.start()
-                video_stream.start()
+                if hasattr(video_conn, 'fileno'):
+                    video_stream.start(threaded=False)
+                    self._register(video_conn, functools.partial(self._on_video_readable, video_conn, video_stream))
+                else:
+                    video_stream.start()
                 
                 # Update state
                 with self._lock:
@@ -167,7 +243,8 @@ class NetworkManager:
                     break
                     
                 # Wait before retrying
-                time.sleep(self._reconnect_delay * (2 ** (attempt - 1)))  # Exponential backoff
+                # Exponential backoff; returns early if disconnect() is called
+                self._stop_event.wait(self._reconnect_delay * (2 ** (attempt - 1)))
                 
             except Exception as e:
                 logger.critical(f"Unexpected error during connection: {e}", exc_info=True)
@@ -175,20 +252,77 @@ class NetworkManager:
                 self._cleanup_connections()
                 break
     
+    @classmethod
+    def _register(cls, conn: IConnection, handler: Callable[[], None]) -> None:
+        """Watch a connection for incoming data, starting the I/O loop if needed."""
+        with cls._selector_lock:
+            cls._selector.register(conn, selectors.EVENT_READ, handler)
+            if cls._io_thread is None:
+                cls._io_thread = threading.Thread(
+                    target=cls._io_loop,
+                    name="NetworkManagerIOThread",
+                    daemon=True
+                )
+                cls._io_thread.start()
+    
+    @classmethod
+    def _unregister(cls, conn: IConnection) -> None:
+        """Stop watching a connection; no-op if it isn't registered."""
+        with cls._selector_lock:
+            try:
+                cls._selector.unregister(conn)
+            except (KeyError, ValueError):
+                pass
+    
+    @classmethod
+    def _io_loop(cls) -> None:
+        """Dispatch readable connections to their handlers."""
+        while True:
+            try:
+                events = cls._selector.select(timeout=0.5)
+            except OSError:
+                # select() on Windows rejects an empty set
+                time.sleep(0.5)
+                continue
+            for key, _ in events:
+                try:
+                    key.data()
+                except Exception as e:
+                    logger.error(f"Error in I/O handler: {e}", exc_info=True)
+    
+    def _on_video_readable(self, conn: IConnection, stream: VideoStream) -> None:
+        """Read what the video connection has and feed it to the stream."""
+        try:
+            n = conn.recv_into(self._io_buf)
+        except (ConnectionError, TimeoutError) as e:
+            logger.error(f"Connection error in video stream: {e}")
+            self._unregister(conn)
+            stream.stop()
+            return
+        stream.feed(self._io_buf[:n])
+    
     def disconnect(self) -> None:
         """Disconnect from the robot."""
         with self._lock:
             self._stop_reconnect_thread()
             self._disconnect()
     
-    def _disconnect(self) -> None:
-        """Internal disconnect implementation."""
+    def _disconnect(self, keep_alive: bool = False) -> None:
+        """Internal disconnect implementation.
+        
+        Args:
+            keep_alive: Hand usable sockets to the connection pool for the
+                reconnect that follows instead of closing them. A user
+                disconnect closes them so the robot sees the session end
+        """
         if self.state == ConnectionState.DISCONNECTED:
             return
             
         self.state = ConnectionState.DISCONNECTING
         
         # Stop video stream
+        if self._video_conn:
+            self._unregister(self._video_conn)
         if self._video_stream:
             try:
                 self._video_stream.stop()
@@ -204,11 +338,12 @@ class NetworkManager:
                 logger.error(f"Error stopping command processor: {e}")
             self._command_processor = None
         
-        # Close connections
+        # On a reconnect, idle sockets are kept for the next connect
         for conn in [self._control_conn, self._video_conn]:
             if conn:
                 try:
-                    conn.disconnect()
+                    if keep_alive:
+                        conn.release()
                     conn.close()
                 except Exception as e:
                     logger.error(f"Error closing connection: {e}")
@@ -221,6 +356,8 @@ class NetworkManager:
     def _cleanup_connections(self) -> None:
         """Clean up any existing connections."""
         with self._lock:
+            if self._video_conn:
+                self._unregister(self._video_conn)
             if self._video_stream:
                 try:
                     self._video_stream.stop()
@@ -247,13 +384,16 @@ class NetworkManager:
             self._video_conn = None
     
     def _stop_reconnect_thread(self) -> None:
-        """Stop the reconnection thread if it's running."""
-        if self._reconnect_thread and self._reconnect_thread.is_alive():
+        """Stop the connection loop if it's queued or running."""
+        future = self._reconnect_future
+        if future and not future.done():
             self._stop_event.set()
-            self._reconnect_thread.join(timeout=2.0)
-            if self._reconnect_thread.is_alive():
-                logger.warning("Reconnection thread did not stop gracefully")
-        self._reconnect_thread = None
+            if not future.cancel():
+                try:
+                    future.result(timeout=2.0)
+                except Exception:
+                    logger.warning("Reconnection loop did not stop gracefully")
+        self._reconnect_future = None
     
     def send_command(self, command: str, timeout: Optional[float] = None) -> Any:
         """Send a command to the robot.
@@ -275,6 +415,26 @@ class NetworkManager:
             
         return self._command_processor.send_command(command, timeout)
     
+    def send_commands(self, commands: Iterable[str], timeout: Optional[float] = None) -> int:
+        """Send several commands to the robot in one write, without waiting for responses.
+        
+        Args:
+            commands: Newline-terminated command strings
+            timeout: Optional timeout in seconds
+            
+        Returns:
+            int: Number of bytes sent
+            
+        Raises:
+            ConnectionError: If not connected
+            TimeoutError: If the operation times out
+        """
+        conn = self._control_conn
+        if not self.is_connected or not conn:
+            raise ConnectionError("Not connected to robot")
+            
+        return conn.sendv([command.encode('utf-8') for command in commands], timeout)
+    
     def get_video_frame(self, timeout: Optional[float] = None) -> Optional[bytes]:
         """Get the next video frame.
         
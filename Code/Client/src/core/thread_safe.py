@@ -1,6 +1,7 @@
 """Thread-safe data structures for concurrent access."""
-from typing import Any, Generic, TypeVar, Optional
+from typing import Any, Callable, Dict, Generic, Optional, Tuple, TypeVar, Union
 import threading
+import weakref
 
 T = TypeVar('T')
 
@@ -20,14 +21,22 @@ class ThreadSafeValue(Generic[T]):
         """
         self._value = initial_value
         self._name = name
-        self._lock = threading.RLock()
-        self._callbacks = []
+        self._lock = threading.Lock()
+        # Registered callbacks, in insertion order; bound methods are held as
+        # WeakMethods so a registration doesn't keep its object alive
+        self._callbacks: Dict[Union[Callable, weakref.WeakMethod], None] = {}
+        # Immutable copy of the keys, republished on every change, so
+        # notifying needs neither the lock nor a copy
+        self._cb_snapshot: Tuple[Union[Callable, weakref.WeakMethod], ...] = ()
     
     @property
     def value(self) -> Optional[T]:
-        """Get the current value."""
-        with self._lock:
-            return self._value
+        """Get the current value.
+        
+        Reads don't lock: loading one attribute is atomic under the GIL, and
+        the lock only serialises the compare-and-set in the setter.
+        """
+        return self._value
     
     @value.setter
     def value(self, new_value: T) -> None:
@@ -37,10 +46,12 @@ class ThreadSafeValue(Generic[T]):
             new_value: The new value to set
         """
         with self._lock:
-            if self._value != new_value:
-                old_value = self._value
-                self._value = new_value
-                self._notify_observers(old_value, new_value)
+            if self._value == new_value:
+                return
+            old_value = self._value
+            self._value = new_value
+        # Callbacks run outside the lock so they can read or set this value
+        self._notify_observers(old_value, new_value)
     
     def set_value_if(self, condition: bool, true_value: T, false_value: T) -> None:
         """Set value based on a condition.
@@ -55,12 +66,15 @@ class ThreadSafeValue(Generic[T]):
     def add_callback(self, callback: callable) -> None:
         """Add a callback to be called when the value changes.
         
+        Bound methods are referenced weakly and dropped once their object
+        is garbage collected.
+        
         Args:
             callback: Function with signature (old_value, new_value)
         """
         with self._lock:
-            if callback not in self._callbacks:
-                self._callbacks.append(callback)
+            self._callbacks[self._callback_key(callback)] = None
+            self._publish_callbacks()
     
     def remove_callback(self, callback: callable) -> None:
         """Remove a previously registered callback.
@@ -68,9 +82,24 @@ class ThreadSafeValue(Generic[T]):
         Args:
             callback: Callback to remove
         """
+        key = self._callback_key(callback)
         with self._lock:
-            if callback in self._callbacks:
-                self._callbacks.remove(callback)
+            if key in self._callbacks:
+                del self._callbacks[key]
+                self._publish_callbacks()
+    
+    @staticmethod
+    def _callback_key(callback: Callable) -> Union[Callable, weakref.WeakMethod]:
+        """Registry key for a callback: a WeakMethod for bound methods."""
+        if hasattr(callback, '__self__') and hasattr(callback, '__func__'):
+            return weakref.WeakMethod(callback)
+        return callback
+    
+    def _publish_callbacks(self) -> None:
+        """Prune dead weak callbacks and republish the snapshot. Call with the lock held."""
+        for key in [k for k in self._callbacks if isinstance(k, weakref.WeakMethod) and k() is None]:
+            del self._callbacks[key]
+        self._cb_snapshot = tuple(self._callbacks)
     
     def _notify_observers(self, old_value: T, new_value: T) -> None:
         """Notify all registered callbacks of a value change.
@@ -79,13 +108,16 @@ class ThreadSafeValue(Generic[T]):
             old_value: Previous value
             new_value: New value
         """
-        with self._lock:
-            for callback in self._callbacks[:]:  # Create a copy to allow modification during iteration
-                try:
-                    callback(old_value, new_value)
-                except Exception as e:
-                    import logging
-                    logging.error(f"Error in callback for {self._name or 'unnamed value'}: {e}", exc_info=True)
+        for callback in self._cb_snapshot:
+            if isinstance(callback, weakref.WeakMethod):
+                callback = callback()
+                if callback is None:
+                    continue
+            try:
+                callback(old_value, new_value)
+            except Exception as e:
+                import logging
+                logging.error(f"Error in callback for {self._name or 'unnamed value'}: {e}", exc_info=True)
     
     def __str__(self) -> str:
         return f"ThreadSafeValue({self._name or ''}): {self._value}"
@@ -106,7 +138,7 @@ class ThreadSafeCounter:
         """
         self._value = initial_value
         self._name = name
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()
     
     def increment(self, amount: int = 1) -> int:
         """Increment the counter and return the new value.
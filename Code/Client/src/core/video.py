@@ -1,42 +1,78 @@
 """Video streaming implementation for Hexapod Robot."""
 
+import queue
 import struct
 import threading
 import time
-from typing import Optional, Callable, Any
+from typing import Optional, Callable, Any, Union
 
-from .interfaces import IVideoStream, IConnection
+from .interfaces import IVideoStream, IConnection, ConnectionState
 from .exceptions import VideoError, ConnectionError
 from .thread_safe import ThreadSafeValue
 from .logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Largest frame accepted from the robot
+MAX_FRAME_SIZE = 10 * 1024 * 1024
+# Size of the receive buffer that headers and frame tails are read through
+RECV_CHUNK_SIZE = 65536
+# Little-endian frame length prefix, compiled once
+_HEADER = struct.Struct('<L')
+
 class VideoStream(IVideoStream):
     """Handles video streaming from the robot."""
     
-    def __init__(self, connection: IConnection, frame_callback: Optional[Callable[[bytes], None]] = None):
+    def __init__(self, connection: IConnection, frame_callback: Optional[Callable[[memoryview], None]] = None):
         """Initialize the video stream.
         
         Args:
             connection: The connection to use for video streaming
-            frame_callback: Optional callback for processing frames
+            frame_callback: Optional callback for processing frames. It gets a
+                view of the internal frame buffer that is only valid until it
+                returns; copy it (bytes(view)) to keep the frame
         """
         self._conn = connection
         self._frame_callback = frame_callback
         self._running = ThreadSafeValue(False, name="video_running")
         self._thread: Optional[threading.Thread] = None
         self._lock = threading.RLock()
-        self._current_frame = ThreadSafeValue(None, name="current_frame")
-        self._frame_ready = threading.Event()
+        # Holds at most the newest frame; the producer drains before putting.
+        # None is put on stop to wake waiting readers
+        self._frame_q: "queue.SimpleQueue[Optional[bytes]]" = queue.SimpleQueue()
+        # Frames are copied out for the queue only once get_frame() has been
+        # used, so callback-only consumers never pay for the copy
+        self._queue_frames = False
+        # Frame bodies are received straight into this buffer; bytes are only
+        # materialised for a complete frame. It grows to the largest frame
+        # seen (see _reserve) rather than being sized for MAX_FRAME_SIZE
+        self._frame_buf = bytearray()
+        self._mv = memoryview(self._frame_buf)
+        # Userspace receive buffer: one recv_into picks up a header together
+        # with the body bytes that follow it. Valid data is _rxbuf[_rxpos:_rxlen]
+        self._rxbuf = bytearray(RECV_CHUNK_SIZE)
+        self._rxmv = memoryview(self._rxbuf)
+        self._rxlen = 0
+        self._rxpos = 0
+        # Parser state for feed(): header bytes so far, then the body length
+        # (None while reading a header) and how much of it has arrived
+        self._feed_hdr = bytearray(_HEADER.size)
+        self._feed_hdr_len = 0
+        self._feed_length: Optional[int] = None
+        self._feed_received = 0
     
     @property
     def is_running(self) -> bool:
         """Check if the video stream is running."""
         return self._running.value
     
-    def start(self) -> None:
-        """Start the video stream."""
+    def start(self, threaded: bool = True) -> None:
+        """Start the video stream.
+        
+        Args:
+            threaded: Read the connection on a dedicated thread. Pass False
+                when an external I/O loop reads the connection and calls feed()
+        """
         with self._lock:
             if self._running.value:
                 logger.warning("Video stream is already running")
@@ -46,7 +82,12 @@ class VideoStream(IVideoStream):
                 raise ConnectionError("Not connected to video source")
                 
             self._running.value = True
-            self._frame_ready.clear()
+            self._drain_frames()
+            self._feed_hdr_len = 0
+            self._feed_length = None
+            if not threaded:
+                logger.info("Video stream started (externally driven)")
+                return
             self._thread = threading.Thread(
                 target=self._stream_loop,
                 name="VideoStreamThread",
@@ -62,7 +103,7 @@ class VideoStream(IVideoStream):
                 return
                 
             self._running.value = False
-            self._frame_ready.set()  # Unblock any waiting gets
+            self._frame_q.put_nowait(None)  # Unblock any waiting gets
             
             if self._thread and self._thread.is_alive():
                 self._thread.join(timeout=2.0)
@@ -75,6 +116,9 @@ class VideoStream(IVideoStream):
     def get_frame(self, timeout: Optional[float] = None) -> Optional[bytes]:
         """Get the next video frame.
         
+        Frames are only queued from the first call on, so a frame that
+        arrived before then is not returned.
+        
         Args:
             timeout: Maximum time to wait for a frame in seconds
             
@@ -84,55 +128,45 @@ class VideoStream(IVideoStream):
         if not self._running.value:
             return None
             
-        if self._frame_ready.wait(timeout=timeout):
-            return self._current_frame.value
-        return None
+        self._queue_frames = True
+        try:
+            return self._frame_q.get(timeout=timeout)
+        except queue.Empty:
+            return None
+    
+    def _drain_frames(self) -> None:
+        """Discard any frame that has not been read yet."""
+        try:
+            while True:
+                self._frame_q.get_nowait()
+        except queue.Empty:
+            pass
     
     def _stream_loop(self) -> None:
         """Main streaming loop."""
-        buffer = bytearray()
-        
         try:
             while self._running.value:
                 try:
                     # Read frame header (4 bytes for length)
-                    header = self._conn.receive(4, timeout=1.0)
-                    if len(header) != 4:
-                        logger.warning("Invalid frame header received")
-                        continue
+                    if not self._ensure(4):
+                        break
                     
                     # Get frame length from header
-                    frame_length = struct.unpack('<L', header)[0]
-                    if frame_length == 0 or frame_length > 10 * 1024 * 1024:  # 10MB max
+                    frame_length = _HEADER.unpack_from(self._rxbuf, self._rxpos)[0]
+                    self._rxpos += 4
+                    if not 0 < frame_length <= MAX_FRAME_SIZE:
                         logger.warning(f"Invalid frame length: {frame_length}")
                         continue
                     
                     # Read frame data
-                    frame_data = bytearray()
-                    remaining = frame_length
+                    self._reserve(frame_length)
+                    received = self._read_body(frame_length)
                     
-                    while remaining > 0 and self._running.value:
-                        chunk = self._conn.receive(min(4096, remaining), timeout=1.0)
-                        if not chunk:
-                            break
-                        frame_data.extend(chunk)
-                        remaining -= len(chunk)
-                    
-                    if len(frame_data) != frame_length:
-                        logger.warning(f"Incomplete frame received: {len(frame_data)}/{frame_length} bytes")
+                    if received != frame_length:
+                        logger.warning(f"Incomplete frame received: {received}/{frame_length} bytes")
                         continue
                     
-                    # Update current frame
-                    frame_bytes = bytes(frame_data)
-                    self._current_frame.value = frame_bytes
-                    self._frame_ready.set()
-                    
-                    # Notify callback if provided
-                    if self._frame_callback:
-                        try:
-                            self._frame_callback(frame_bytes)
-                        except Exception as e:
-                            logger.error(f"Error in frame callback: {e}", exc_info=True)
+                    self._publish(frame_length)
                     
                 except ConnectionError as e:
                     logger.error(f"Connection error in video stream: {e}")
@@ -151,6 +185,128 @@ class VideoStream(IVideoStream):
             self._running.value = False
             logger.info("Video stream loop ended")
     
+    def feed(self, data: Union[bytes, memoryview]) -> None:
+        """Parse received bytes from an external I/O loop.
+        
+        Data may split headers and bodies anywhere; complete frames are
+        published as they are reassembled.
+        
+        Args:
+            data: Bytes read from the video connection
+        """
+        view = memoryview(data)
+        pos = 0
+        while pos < len(view) and self._running.value:
+            if self._feed_length is None:
+                take = min(_HEADER.size - self._feed_hdr_len, len(view) - pos)
+                self._feed_hdr[self._feed_hdr_len:self._feed_hdr_len + take] = view[pos:pos + take]
+                self._feed_hdr_len += take
+                pos += take
+                if self._feed_hdr_len < _HEADER.size:
+                    break
+                self._feed_hdr_len = 0
+                frame_length = _HEADER.unpack_from(self._feed_hdr)[0]
+                if not 0 < frame_length <= MAX_FRAME_SIZE:
+                    logger.warning(f"Invalid frame length: {frame_length}")
+                    continue
+                self._reserve(frame_length)
+                self._feed_length = frame_length
+                self._feed_received = 0
+            else:
+                take = min(self._feed_length - self._feed_received, len(view) - pos)
+                self._mv[self._feed_received:self._feed_received + take] = view[pos:pos + take]
+                self._feed_received += take
+                pos += take
+                if self._feed_received == self._feed_length:
+                    self._feed_length = None
+                    self._publish(self._feed_received)
+    
+    def _reserve(self, frame_length: int) -> None:
+        """Grow the frame buffer to hold frame_length bytes.
+        
+        Grows at least twofold so a slowly rising frame size doesn't
+        reallocate every frame, but never past MAX_FRAME_SIZE.
+        
+        Args:
+            frame_length: Length of the next frame, at most MAX_FRAME_SIZE
+        """
+        if frame_length > len(self._frame_buf):
+            size = min(max(frame_length, 2 * len(self._frame_buf)), MAX_FRAME_SIZE)
+            self._frame_buf = bytearray(size)
+            self._mv = memoryview(self._frame_buf)
+    
+    def _publish(self, frame_length: int) -> None:
+        """Hand a complete frame in the frame buffer to readers and the callback."""
+        if self._queue_frames:
+            self._drain_frames()
+            self._frame_q.put_nowait(bytes(self._mv[:frame_length]))
+        
+        # Notify callback if provided; the view is reused for the next frame
+        if self._frame_callback:
+            try:
+                self._frame_callback(self._mv[:frame_length])
+            except Exception as e:
+                logger.error(f"Error in frame callback: {e}", exc_info=True)
+    
+    def _compact(self) -> None:
+        """Move unread bytes to the front of the receive buffer."""
+        pending = self._rxlen - self._rxpos
+        self._rxbuf[:pending] = self._rxmv[self._rxpos:self._rxlen]
+        self._rxpos, self._rxlen = 0, pending
+    
+    def _fill(self) -> None:
+        """Receive once into the free tail of the receive buffer."""
+        if self._rxlen == len(self._rxbuf) or self._rxpos == self._rxlen:
+            self._compact()
+        self._rxlen += self._conn.recv_into(self._rxmv[self._rxlen:], timeout=1.0)
+    
+    def _ensure(self, n: int) -> bool:
+        """Buffer at least n unread bytes.
+        
+        Args:
+            n: Number of bytes needed, at most RECV_CHUNK_SIZE
+            
+        Returns:
+            bool: False if the stream was stopped first
+        """
+        while self._rxlen - self._rxpos < n:
+            if not self._running.value:
+                return False
+            if len(self._rxbuf) - self._rxpos < n:
+                self._compact()
+            self._fill()
+        return True
+    
+    def _read_body(self, length: int) -> int:
+        """Read a frame body into the frame buffer.
+        
+        Bytes already buffered are copied first. A large remainder is then
+        received directly into the frame buffer with one recv_exact; a small
+        one goes through the receive buffer so the same recv also picks up
+        the next header.
+        
+        Args:
+            length: Frame length in bytes
+            
+        Returns:
+            int: Number of bytes read, less than length if the stream was stopped
+        """
+        received = min(length, self._rxlen - self._rxpos)
+        self._mv[:received] = self._rxmv[self._rxpos:self._rxpos + received]
+        self._rxpos += received
+        
+        if length - received >= RECV_CHUNK_SIZE:
+            self._conn.recv_exact(self._mv[received:length], timeout=1.0)
+            return length
+        
+        while received < length and self._running.value:
+            self._fill()
+            n = min(length - received, self._rxlen - self._rxpos)
+            self._mv[received:received + n] = self._rxmv[self._rxpos:self._rxpos + n]
+            self._rxpos += n
+            received += n
+        return received
+    
     def __enter__(self):
         """Context manager entry."""
         self.start()
@@ -4,6 +4,7 @@
 Hexapod Robot Control - Main Entry Point
 """
 
+import functools
 import os
 import sys
 from pathlib import Path
@@ -16,10 +17,10 @@ def main():
     try:
         from PyQt5.QtWidgets import QApplication
         from src.ui.main_window import MainWindow
-        from src.utils.logging_config import setup_logging
+        from src.utils.logging_config import configure_logging
         
         # Set up logging
-        setup_logging()
+        configure_logging()
         
         # Create application
         app = QApplication(sys.argv)
@@ -40,15 +41,21 @@ def main():
         print("pip install -r requirements.txt")
         sys.exit(1)
 
+@functools.lru_cache(maxsize=1)
+def _load_stylesheet():
+    """Read the stylesheet once per process; None if there isn't one."""
+    style_file = Path(__file__).parent / 'config' / 'styles' / 'styles.qss'
+    try:
+        return style_file.read_bytes().decode('utf-8')
+    except FileNotFoundError:
+        return None
+
 def apply_styles(app):
     """Apply styles to the application."""
     try:
-        styles_dir = Path(__file__).parent / 'config' / 'styles'
-        style_file = styles_dir / 'styles.qss'
-        
-        if style_file.exists():
-            with open(style_file, 'r') as f:
-                app.setStyleSheet(f.read())
+        stylesheet = _load_stylesheet()
+        if stylesheet is not None:
+            app.setStyleSheet(stylesheet)
     except Exception as e:
         print(f"Warning: Could not load styles: {e}")
 
@@ -8,6 +8,8 @@ class  Face:
         self.recognizer.read('Face/face.yml')
         self.detector = cv2.CascadeClassifier("Face/haarcascade_frontalface_default.xml")
         self.name = self.Read_from_txt('Face/name')
+        # Grayscale buffer reused by face_detect; reallocated on a size change
+        self._gray = None
     def Read_from_txt(self, filename):
         file1 = open(filename + ".txt", "r")
         list_row = file1.readlines()
@@ -49,10 +51,15 @@ class  Face:
         self.recognizer.write('Face/face.yml')
         self.recognizer.read('Face/face.yml')
         print("\n  {0} faces trained.".format(len(np.unique(labels))))
+    def _to_gray(self, img):
+        gray = self._gray
+        if gray is None or gray.shape != img.shape[:2]:
+            gray = self._gray = np.empty(img.shape[:2], np.uint8)
+        return cv2.cvtColor(img, cv2.COLOR_BGR2GRAY, gray)
     def face_detect(self,img):
         try:
             if sys.platform.startswith('win') or sys.platform.startswith('darwin') or sys.platform.startswith('linux'):
-                gray = cv2.cvtColor(img,cv2.COLOR_BGR2GRAY)
+                gray = self._to_gray(img)
                 faces = self.detector.detectMultiScale(gray,1.2,5)
                 if len(faces)>0 :
                     for (x,y,w,h) in faces:
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""JPEG decoding and encoding.
+
+Uses libjpeg-turbo through PyTurboJPEG when it is installed, and falls back
+to OpenCV's codec otherwise.
+"""
+from __future__ import annotations
+
+from typing import Optional
+
+import cv2
+import numpy as np
+
+from src.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGR
+    # Raises if the libturbojpeg shared library itself can't be found
+    _turbo: Optional[TurboJPEG] = TurboJPEG()
+except (ImportError, OSError, RuntimeError) as e:
+    logger.debug(f"PyTurboJPEG unavailable, using cv2.imdecode: {e}")
+    _turbo = None
+
+
+def decode_jpeg(data: bytes) -> Optional[np.ndarray]:
+    """Decode a JPEG into a BGR image.
+
+    Args:
+        data: Encoded JPEG bytes
+
+    Returns:
+        The HxWx3 uint8 image, or None if the data could not be decoded
+    """
+    if not data:
+        return None
+    if _turbo is not None:
+        try:
+            return _turbo.decode(data, pixel_format=TJPF_BGR)
+        except OSError:
+            return None
+    try:
+        return cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR)
+    except cv2.error:
+        return None
+
+
+def encode_jpeg(image: np.ndarray, quality: int = 95) -> bytes:
+    """Encode a BGR image as JPEG.
+
+    Args:
+        image: HxWx3 uint8 image
+        quality: JPEG quality; 95 matches cv2.imwrite's default
+
+    Returns:
+        The encoded JPEG bytes
+    """
+    if _turbo is not None:
+        return _turbo.encode(image, quality=quality, pixel_format=TJPF_BGR)
+    ok, buf = cv2.imencode('.jpg', image, (cv2.IMWRITE_JPEG_QUALITY, quality))
+    if not ok:
+        raise ValueError("Failed to encode JPEG")
+    return buf.tobytes()
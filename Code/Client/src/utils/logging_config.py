@@ -1,7 +1,12 @@
 """Logging configuration for the Hexapod Robot application."""
+import atexit
+import functools
+import io
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Optional, Dict, Any
 
 # Log directory and file settings
@@ -9,28 +14,126 @@ LOG_DIR = 'logs'
 LOG_FILE = os.path.join(LOG_DIR, 'hexapod_robot.log')
 MAX_BYTES = 5 * 1024 * 1024  # 5 MB
 BACKUP_COUNT = 3
+# Log file writes are batched in a buffer of this size and flushed at this
+# interval (seconds), on rollover and on shutdown
+LOG_BUFFER_SIZE = 64 * 1024
+LOG_FLUSH_INTERVAL = 0.2
 
 # Log format
 LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
 
+# Suppress overly verbose logs from libraries
+THIRD_PARTY_LOG_LEVELS: Dict[str, int] = {
+    'urllib3': logging.WARNING,
+    'matplotlib': logging.WARNING,
+    'PIL': logging.WARNING,
+    'asyncio': logging.WARNING,
+    'PyQt5': logging.WARNING,
+}
+
 # Default log level (can be overridden by environment variable)
 DEFAULT_LOG_LEVEL = 'INFO'
+# LOG_LEVEL from the environment, read once at import
+_ENV_LOG_LEVEL = os.environ.get('LOG_LEVEL', DEFAULT_LOG_LEVEL).upper()
+
+# Background listener that performs the actual console/file I/O
+_listener: Optional[QueueListener] = None
+# Set once configure_logging has installed the handlers
+_CONFIGURED: bool = False
+
 
+class _LocalQueueHandler(QueueHandler):
+    """QueueHandler for a listener in this process.
+    
+    The stock prepare() formats every record on the logging thread so it can
+    be pickled; records here never leave the process, so only the message
+    arguments are resolved and timestamps/tracebacks are formatted by the
+    listener.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Arguments may be mutated before the listener gets to the record
+        record.msg = record.getMessage()
+        record.args = None
+        return record
 
-def configure_logging(log_level: Optional[str] = None) -> None:
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that batches writes instead of flushing each record.
+    
+    StreamHandler flushes after every record, which is one write() per log
+    line; here records collect in a LOG_BUFFER_SIZE buffer that a background
+    thread flushes every LOG_FLUSH_INTERVAL seconds. The file size used for
+    rollover is tracked in memory, since asking the stream would flush it.
+    """
+    
+    def __init__(self, filename: str, *args: Any,
+                 buffer_size: int = LOG_BUFFER_SIZE,
+                 flush_interval: float = LOG_FLUSH_INTERVAL, **kwargs: Any) -> None:
+        self._buffer_size = buffer_size
+        self._size = 0
+        super().__init__(filename, *args, **kwargs)
+        self._stop_flushing = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_loop, args=(flush_interval,), name="log-flush", daemon=True
+        )
+        self._flusher.start()
+    
+    def _open(self) -> io.TextIOWrapper:
+        raw = io.FileIO(self.baseFilename, self.mode)
+        self._size = raw.seek(0, os.SEEK_END)
+        return io.TextIOWrapper(
+            io.BufferedWriter(raw, buffer_size=self._buffer_size),
+            encoding=self.encoding, errors=self.errors
+        )
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            # maxBytes is in bytes, so count the encoded length, not characters
+            size = len(msg.encode(self.stream.encoding, self.stream.errors))
+            if self.maxBytes > 0 and self._size + size >= self.maxBytes:
+                # Closing the old stream flushes what is still buffered
+                self.doRollover()
+            self.stream.write(msg)
+            self._size += size
+        except Exception:
+            self.handleError(record)
+    
+    def _flush_loop(self, interval: float) -> None:
+        while not self._stop_flushing.wait(interval):
+            self.flush()
+    
+    def close(self) -> None:
+        self._stop_flushing.set()
+        super().close()
+
+
+def configure_logging(log_level: Optional[str] = None, force: bool = False) -> None:
     """Configure logging for the application.
     
+    Only the first call installs handlers; later calls return immediately
+    unless force is set.
+    
     Args:
         log_level: Logging level as a string (e.g., 'DEBUG', 'INFO').
-                  If None, uses the value from the environment variable 'LOG_LEVEL',
+                  If None, uses the environment variable 'LOG_LEVEL' as it was at import,
                   or falls back to DEFAULT_LOG_LEVEL.
+        force: Reconfigure even if logging was already configured.
     """
+    global _CONFIGURED
+    if _CONFIGURED and not force:
+        return
+    _CONFIGURED = True
+    
     # Ensure log directory exists
     os.makedirs(LOG_DIR, exist_ok=True)
     
     # Get log level from parameter, environment, or default
-    level_str = (log_level or os.getenv('LOG_LEVEL', DEFAULT_LOG_LEVEL)).upper()
+    level_str = log_level.upper() if log_level else _ENV_LOG_LEVEL
     level = getattr(logging, level_str, logging.INFO)
     
     # Configure root logger
@@ -38,6 +141,7 @@ def configure_logging(log_level: Optional[str] = None) -> None:
     root_logger.setLevel(level)
     
     # Clear any existing handlers
+    _stop_listener()
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
     
@@ -46,7 +150,7 @@ def configure_logging(log_level: Optional[str] = None) -> None:
     console_handler.setLevel(level)
     
     # Create file handler with rotation
-    file_handler = RotatingFileHandler(
+    file_handler = BufferedRotatingFileHandler(
         LOG_FILE,
         maxBytes=MAX_BYTES,
         backupCount=BACKUP_COUNT,
@@ -59,9 +163,13 @@ def configure_logging(log_level: Optional[str] = None) -> None:
     console_handler.setFormatter(formatter)
     file_handler.setFormatter(formatter)
     
-    # Add handlers to the root logger
-    root_logger.addHandler(console_handler)
-    root_logger.addHandler(file_handler)
+    # Loggers only enqueue records; a listener thread writes them out so
+    # callers on the GUI thread never block on console or disk I/O
+    global _listener
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root_logger.addHandler(_LocalQueueHandler(log_queue))
+    _listener = QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+    _listener.start()
     
     # Set up third-party loggers
     _configure_third_party_loggers(level)
@@ -69,24 +177,29 @@ def configure_logging(log_level: Optional[str] = None) -> None:
     logging.info(f"Logging configured with level: {logging.getLevelName(level)}")
 
 
+def _stop_listener() -> None:
+    """Flush and stop the background log listener, if one is running."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        # Writes out anything still buffered by the file handler
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
 def _configure_third_party_loggers(level: int) -> None:
     """Configure log levels for third-party libraries."""
-    # Suppress overly verbose logs from libraries
-    third_party_loggers: Dict[str, int] = {
-        'urllib3': logging.WARNING,
-        'matplotlib': logging.WARNING,
-        'PIL': logging.WARNING,
-        'asyncio': logging.WARNING,
-        'PyQt5': logging.WARNING,
-    }
-    
-    for name, lvl in third_party_loggers.items():
+    for name, lvl in THIRD_PARTY_LOG_LEVELS.items():
         logging.getLogger(name).setLevel(lvl)
 
 
+@functools.lru_cache(maxsize=256)
 def get_logger(name: Optional[str] = None) -> logging.Logger:
     """Get a logger with the given name.
     
+    Results are cached, so repeated calls skip the logging manager lock.
+    
     Args:
         name: Logger name. If None, returns the root logger.
         
@@ -96,5 +209,4 @@ def get_logger(name: Optional[str] = None) -> logging.Logger:
     return logging.getLogger(name)
 
 
-# Configure logging when this module is imported
-configure_logging()
+atexit.register(_stop_listener)
@@ -1,9 +1,10 @@
 """Utility functions and classes for the Hexapod Robot application."""
-import functools
 import logging
+import threading
 import time
-import traceback
-from typing import Any, Callable, Optional, Type, TypeVar, cast
+from typing import Any, Callable, NoReturn, Optional, Type, TypeVar, cast
+
+import numpy as np
 
 from src.utils.exceptions import RobotError
 from src.utils.logging_config import get_logger
@@ -13,11 +14,28 @@ F = TypeVar('F', bound=Callable[..., Any])
 
 logger = get_logger(__name__)
 
+
+def _light_wraps(func: Callable[..., Any], wrapper: Callable[..., Any]) -> Callable[..., Any]:
+    """Copy the identifying attributes of func onto wrapper.
+    
+    A trimmed functools.wraps: keeps the name, qualname, module, docstring
+    and __wrapped__, but skips copying annotations and merging __dict__.
+    """
+    wrapper.__module__ = func.__module__
+    wrapper.__name__ = func.__name__
+    wrapper.__qualname__ = func.__qualname__
+    wrapper.__doc__ = func.__doc__
+    wrapper.__wrapped__ = func
+    return wrapper
+
+
 def retry(
     max_attempts: int = 3,
     delay: float = 1.0,
     backoff: float = 2.0,
     exceptions: tuple[Type[Exception], ...] = (Exception,),
+    cancel_event: Optional[threading.Event] = None,
+    wrap_final: bool = False,
 ):
     """Decorator that retries a function upon failure.
     
@@ -26,37 +44,56 @@ def retry(
         delay: Initial delay between attempts in seconds.
         backoff: Multiplier applied to delay between attempts.
         exceptions: Tuple of exceptions to catch and retry on.
+        cancel_event: Optional event that, once set, stops the retries
+            (including a wait in progress) with a RobotError.
+        wrap_final: Raise a RobotError from the last failure instead of
+            re-raising the last exception itself.
     
     Returns:
         Decorated function with retry logic.
+        
+    Raises:
+        ValueError: If max_attempts is less than 1.
     """
+    if max_attempts < 1:
+        raise ValueError(f"max_attempts must be at least 1, got {max_attempts}")
+    
     def decorator(func: F) -> F:
-        @functools.wraps(func)
+        # Backoff schedule, computed once per decorated function
+        delays = tuple(delay * backoff ** i for i in range(max_attempts - 1))
+        warn = logger.warning
+        
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            current_delay = delay
             last_exception = None
             
-            for attempt in range(1, max_attempts + 1):
+            for attempt in range(max_attempts):
                 try:
                     return func(*args, **kwargs)
                 except exceptions as e:
                     last_exception = e
-                    if attempt == max_attempts:
+                    if attempt == len(delays):
                         break
                         
-                    logger.warning(
-                        f"Attempt {attempt}/{max_attempts} failed: {e}. "
-                        f"Retrying in {current_delay:.2f}s..."
+                    current_delay = delays[attempt]
+                    warn(
+                        "Attempt %d/%d failed: %s. Retrying in %.2fs...",
+                        attempt + 1, max_attempts, e, current_delay
                     )
-                    time.sleep(current_delay)
-                    current_delay *= backoff
+                    if cancel_event is None:
+                        time.sleep(current_delay)
+                    elif cancel_event.wait(current_delay):
+                        raise RobotError(
+                            f"Cancelled after {attempt + 1} attempts: {e}"
+                        ) from e
             
             # If we get here, all attempts failed
-            raise RobotError(
-                f"Failed after {max_attempts} attempts: {last_exception}"
-            ) from last_exception
+            if wrap_final:
+                raise RobotError(
+                    f"Failed after {max_attempts} attempts: {last_exception}"
+                ) from last_exception
+            raise last_exception
             
-        return cast(F, wrapper)
+        return cast(F, _light_wraps(func, wrapper))
     return decorator
 
 
@@ -67,18 +104,24 @@ def log_duration(level: int = logging.DEBUG):
         level: Logging level to use for the duration message.
     """
     def decorator(func: F) -> F:
-        @functools.wraps(func)
+        # Bound once here rather than looked up on every call
+        enabled, log, now = logger.isEnabledFor, logger.log, time.monotonic
+        name = func.__qualname__
+        
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            start_time = time.monotonic()
+            # Skip the timing entirely when the message would be filtered
+            if not enabled(level):
+                return func(*args, **kwargs)
+            start_time = now()
             try:
                 return func(*args, **kwargs)
             finally:
-                duration = time.monotonic() - start_time
-                logger.log(
+                log(
                     level,
-                    f"Function {func.__qualname__} executed in {duration:.3f} seconds"
+                    "Function %s executed in %.3f seconds",
+                    name, now() - start_time
                 )
-        return cast(F, wrapper)
+        return cast(F, _light_wraps(func, wrapper))
     return decorator
 
 
@@ -97,20 +140,23 @@ def handle_errors(
         exceptions: Tuple of exceptions to catch.
     """
     def decorator(func: F) -> F:
-        @functools.wraps(func)
+        log = logger.log
+        
         def wrapper(*args: Any, **kwargs: Any) -> Any:
             try:
                 return func(*args, **kwargs)
             except exceptions as e:
-                logger.log(
+                # The traceback is formatted by the handlers, only if enabled
+                log(
                     log_level,
-                    f"Error in {func.__qualname__}: {e}\n"
-                    f"{traceback.format_exc()}"
+                    "Error in %s: %s",
+                    func.__qualname__, e,
+                    exc_info=True
                 )
                 if reraise:
                     raise
                 return default_return
-        return cast(F, wrapper)
+        return cast(F, _light_wraps(func, wrapper))
     return decorator
 
 
@@ -134,11 +180,16 @@ def validate_range(
     Raises:
         ValueError: If the value is outside the valid range.
     """
-    if not (min_val <= value <= max_val):
-        raise ValueError(
-            f"{name} must be between {min_val} and {max_val}, got {value}"
-        )
-    return value
+    if min_val <= value <= max_val:
+        return value
+    _raise_out_of_range(name, min_val, max_val, value)
+
+
+def _raise_out_of_range(name: str, min_val: float, max_val: float, value: float) -> NoReturn:
+    """Raise the ValueError for validate_range; kept out of its fast path."""
+    raise ValueError(
+        f"{name} must be between {min_val} and {max_val}, got {value}"
+    )
 
 
 def clamp(value: float, min_val: float, max_val: float) -> float:
@@ -186,11 +237,62 @@ def map_value(
     return result
 
 
+def map_value_array(
+    values: "np.typing.ArrayLike",
+    in_min: float,
+    in_max: float,
+    out_min: float,
+    out_max: float,
+    clamp_output: bool = False
+) -> np.ndarray:
+    """Map an array of values from one range to another.
+    
+    Vectorised map_value for batches (e.g. calibration sweeps): one NumPy
+    pass instead of a Python call per element.
+    
+    Args:
+        values: The values to map.
+        in_min: Minimum value of input range.
+        in_max: Maximum value of input range.
+        out_min: Minimum value of output range.
+        out_max: Maximum value of output range.
+        clamp_output: Whether to clamp the output to the output range.
+        
+    Returns:
+        The mapped values as a float array.
+    """
+    values = np.asarray(values, dtype=float)
+    if in_min == in_max:
+        return np.full_like(values, (out_min + out_max) / 2)
+        
+    result = (values - in_min) * (out_max - out_min) / (in_max - in_min) + out_min
+    
+    if clamp_output:
+        np.clip(result, min(out_min, out_max), max(out_min, out_max), out=result)
+    return result
+
+
+# Serialises first construction of Singleton classes; reentrant so one
+# singleton's __init__ can construct another
+_singleton_lock = threading.RLock()
+
+
 class Singleton(type):
-    """A metaclass that creates a Singleton base class when called."""
-    _instances: dict[type, object] = {}
+    """A metaclass that creates a Singleton base class when called.
+    
+    The instance is cached on the class itself, so after the first call
+    getting it is one dict lookup with no lock; construction is
+    double-checked under a lock so racing threads still get one instance.
+    """
 
     def __call__(cls, *args: Any, **kwargs: Any) -> Any:
-        if cls not in cls._instances:
-            cls._instances[cls] = super().__call__(*args, **kwargs)
-        return cls._instances[cls]
+        # cls.__dict__ rather than getattr: a subclass must not reuse its
+        # parent's instance
+        instance = cls.__dict__.get('__singleton_instance__')
+        if instance is None:
+            with _singleton_lock:
+                instance = cls.__dict__.get('__singleton_instance__')
+                if instance is None:
+                    instance = super().__call__(*args, **kwargs)
+                    cls.__singleton_instance__ = instance
+        return instance
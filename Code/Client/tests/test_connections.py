@@ -0,0 +1,64 @@
+"""Unit tests for DummyConnection's buffered reads."""
+
+import os
+import sys
+import unittest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.connections import DummyConnection
+from src.core.exceptions import ConnectionError, TimeoutError
+
+
+class TestDummyConnection(unittest.TestCase):
+    """Test cases for DummyConnection."""
+
+    def setUp(self):
+        self.conn = DummyConnection()
+        self.conn.connect('localhost', 5002)
+
+    def test_receive_spans_chunks(self):
+        """Reads return sent bytes in order, across and within chunks."""
+        self.conn.send(b'hello ')
+        self.conn.sendv([b'wor', b'ld'])
+        self.assertEqual(self.conn.receive(3), b'hel')
+        self.assertEqual(self.conn.receive(6), b'lo wor')
+        self.assertEqual(self.conn.receive(100), b'ld')
+        self.assertEqual(self.conn.receive(100), b'')
+
+    def test_recv_into(self):
+        """recv_into fills as much of the buffer as is buffered."""
+        self.conn.send(b'abc')
+        self.conn.send(b'defgh')
+        buf = bytearray(5)
+        self.assertEqual(self.conn.recv_into(memoryview(buf)), 5)
+        self.assertEqual(buf, b'abcde')
+        self.assertEqual(self.conn.recv_into(memoryview(buf)), 3)
+        self.assertEqual(buf[:3], b'fgh')
+
+    def test_recv_exact_short(self):
+        """recv_exact raises if fewer bytes are buffered than requested."""
+        self.conn.send(b'ab')
+        with self.assertRaises(TimeoutError):
+            self.conn.recv_exact(memoryview(bytearray(3)))
+
+    def test_close_discards_data(self):
+        """close() drops unread data and disconnects."""
+        self.conn.send(b'unread')
+        self.conn.receive(2)
+        self.conn.close()
+        self.conn.connect('localhost', 5002)
+        self.assertEqual(self.conn.receive(100), b'')
+
+    def test_not_connected(self):
+        """Sending or receiving while disconnected raises ConnectionError."""
+        self.conn.disconnect()
+        with self.assertRaises(ConnectionError):
+            self.conn.send(b'x')
+        with self.assertRaises(ConnectionError):
+            self.conn.receive()
+
+
+if __name__ == '__main__':
+    unittest.main()
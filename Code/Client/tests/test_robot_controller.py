@@ -0,0 +1,46 @@
+"""Unit tests for RobotController command mapping."""
+
+import math
+import os
+import sys
+import unittest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Main import RobotController
+
+
+def _legacy_turn_angle(x, y):
+    """The original branchy remap from RobotController.move."""
+    if x == 0 and y == 0:
+        return 0
+    angle = math.degrees(math.atan2(x, y))
+    if angle < -90 and angle >= -180:
+        angle = angle + 360
+    if angle >= -90 and angle <= 90:
+        return (10 - -10) * (angle - -90) / (90 - -90) + -10
+    return (-10 - 10) * (angle - 270) / (90 - 270) + 10
+
+
+class TestTurnAngle(unittest.TestCase):
+    """Test cases for RobotController.turn_angle."""
+
+    def test_quadrant_boundaries(self):
+        """Axis directions map to the same values as before."""
+        cases = {(0, 35): 0, (35, 0): 10, (-35, 0): -10, (0, -35): 0, (0, 0): 0}
+        for (x, y), expected in cases.items():
+            with self.subTest(x=x, y=y):
+                self.assertAlmostEqual(RobotController.turn_angle(x, y), expected)
+
+    def test_matches_legacy_mapping(self):
+        """Every pad direction rounds to the same command as the old remap."""
+        for x in range(-35, 36, 5):
+            for y in range(-35, 36, 5):
+                with self.subTest(x=x, y=y):
+                    self.assertEqual(round(RobotController.turn_angle(x, y)),
+                                     round(_legacy_turn_angle(x, y)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+"""Unit tests for the retry decorator."""
+
+import os
+import sys
+import threading
+import unittest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.exceptions import RobotError
+from src.utils.utils import retry
+
+
+class TestRetry(unittest.TestCase):
+    """Test cases for retry."""
+
+    def _failing(self, failures, **kwargs):
+        """A retried function that raises KeyError for its first failures calls."""
+        calls = []
+
+        @retry(delay=0, exceptions=(KeyError,), **kwargs)
+        def func():
+            calls.append(1)
+            if len(calls) <= failures:
+                raise KeyError(len(calls))
+            return 'ok'
+        return func, calls
+
+    def test_succeeds_after_failures(self):
+        """A call that fails fewer than max_attempts times returns normally."""
+        func, calls = self._failing(2, max_attempts=3)
+        with self.assertLogs('src.utils.utils', level='WARNING'):
+            self.assertEqual(func(), 'ok')
+        self.assertEqual(len(calls), 3)
+
+    def test_reraises_last_exception(self):
+        """After the last attempt the original exception propagates."""
+        func, calls = self._failing(5, max_attempts=2)
+        with self.assertLogs('src.utils.utils', level='WARNING'):
+            with self.assertRaises(KeyError) as ctx:
+                func()
+        self.assertEqual(ctx.exception.args, (2,))
+        self.assertEqual(len(calls), 2)
+
+    def test_wrap_final(self):
+        """wrap_final raises a RobotError chained to the last exception."""
+        func, _ = self._failing(5, max_attempts=2, wrap_final=True)
+        with self.assertLogs('src.utils.utils', level='WARNING'):
+            with self.assertRaises(RobotError) as ctx:
+                func()
+        self.assertIsInstance(ctx.exception.__cause__, KeyError)
+
+    def test_cancel_event(self):
+        """A set cancel_event stops the retries with a RobotError."""
+        cancel = threading.Event()
+        cancel.set()
+        func, calls = self._failing(5, max_attempts=3, cancel_event=cancel)
+        with self.assertLogs('src.utils.utils', level='WARNING'):
+            with self.assertRaises(RobotError):
+                func()
+        self.assertEqual(len(calls), 1)
+
+    def test_unexpected_exception_not_retried(self):
+        """Exceptions outside the retried types propagate at once."""
+        calls = []
+
+        @retry(max_attempts=3, delay=0, exceptions=(KeyError,))
+        def func():
+            calls.append(1)
+            raise ValueError('boom')
+        with self.assertRaises(ValueError):
+            func()
+        self.assertEqual(len(calls), 1)
+
+    def test_rejects_no_attempts(self):
+        """max_attempts below 1 is rejected when the decorator is applied."""
+        with self.assertRaises(ValueError):
+            retry(max_attempts=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+"""Unit tests for VideoStream's incremental frame parser."""
+
+import os
+import random
+import struct
+import sys
+import unittest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.connections import DummyConnection
+from src.core.video import MAX_FRAME_SIZE, RECV_CHUNK_SIZE, VideoStream
+
+
+def _encode(frames):
+    """Length-prefix each frame the way the robot sends them."""
+    return b''.join(struct.pack('<L', len(f)) + f for f in frames)
+
+
+class TestVideoStreamFeed(unittest.TestCase):
+    """Test cases for VideoStream.feed."""
+
+    def setUp(self):
+        self.conn = DummyConnection()
+        self.conn.connect('localhost', 8002)
+        self.frames = []
+        self.stream = VideoStream(self.conn, lambda view: self.frames.append(bytes(view)))
+        self.stream.start(threaded=False)
+
+    def tearDown(self):
+        self.stream.stop()
+
+    def _feed_through_connection(self, data, rng):
+        """Send data over the dummy connection and feed it back in random pieces."""
+        self.conn.send(data)
+        while True:
+            piece = self.conn.receive(rng.choice([1, 2, 3, 4, 5, 100, 5000, RECV_CHUNK_SIZE]))
+            if not piece:
+                break
+            self.stream.feed(piece)
+
+    def test_random_splits(self):
+        """Frames are reassembled however headers and bodies are split."""
+        rng = random.Random(0)
+        frames = [bytes(rng.getrandbits(8) for _ in range(n))
+                  for n in (1, 3, 4, 5, 1000, RECV_CHUNK_SIZE + 7, 2)]
+        for seed in range(5):
+            with self.subTest(seed=seed):
+                self.frames.clear()
+                self._feed_through_connection(_encode(frames), random.Random(seed))
+                self.assertEqual(self.frames, frames)
+
+    def test_invalid_length_is_skipped(self):
+        """A zero or oversized length header is dropped and parsing carries on."""
+        frame = b'\xff\xd8frame\xff\xd9'
+        data = (struct.pack('<L', MAX_FRAME_SIZE + 1) + struct.pack('<L', 0)
+                + _encode([frame]))
+        with self.assertLogs('src.core.video', level='WARNING'):
+            self._feed_through_connection(data, random.Random(1))
+        self.assertEqual(self.frames, [frame])
+
+    def test_get_frame_returns_newest(self):
+        """Once get_frame has been used, only the newest frame is queued."""
+        self.assertIsNone(self.stream.get_frame(timeout=0))
+        self.stream.feed(_encode([b'old', b'new']))
+        self.assertEqual(self.stream.get_frame(timeout=0), b'new')
+        self.assertIsNone(self.stream.get_frame(timeout=0))
+
+    def test_not_parsed_after_stop(self):
+        """Data fed after stop() is ignored."""
+        self.stream.stop()
+        self.stream.feed(_encode([b'late']))
+        self.assertEqual(self.frames, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,3 @@
-import setup
 from setup import GameController
 
 if __name__ == "__main__":
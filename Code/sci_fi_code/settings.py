@@ -1,11 +1,13 @@
-import utils
-from utils import DiagnosticTool, EnergyCrystal
+import sys
 
 '''
-This file contains the Location class and the DamagedMaintenanceDroid class.
+This file contains the Location class, the DamagedMaintenanceDroid class and the Player class.
 '''
 
 class Location:
+    # droid is only set on locations that have one (see GameController)
+    __slots__ = ("name", "description", "exits", "has_tool", "has_crystal", "droid_present", "droid", "_exits_str")
+
     def __init__(self, name, description, exits, has_tool, has_crystal, droid_present):
         self.name = name
         self.description = description
@@ -13,19 +15,23 @@ class Location:
         self.has_tool = has_tool
         self.has_crystal = has_crystal
         self.droid_present = droid_present
+        self._exits_str = ", ".join(exits) # cached for describe, refreshed by add_exit
 
     def add_exit(self, direction, other_location):
-        self.exits[direction] = other_location
+        self.exits[sys.intern(direction)] = other_location # interned, like the parsed direction in process_input
+        self._exits_str = ", ".join(self.exits)
 
     def describe(self):
-        print(self.name + "\n" + self.description + "\n")
+        # Built up and written in one go rather than one print per line
+        parts = [self.name, self.description + "\n"]
         if self.has_tool:
-            print(f"You see a diagnostic tool here. \n")
+            parts.append("You see a diagnostic tool here. \n")
         if self.has_crystal:
-            print("You see an energy crystal here. \n")
+            parts.append("You see an energy crystal here. \n")
         if self.droid_present:
-            print("A maintenance droid blocks the way! \n")
-        print(f"Exits: {', '.join(self.exits.keys())}.")
+            parts.append("A maintenance droid blocks the way! \n")
+        parts.append(f"Exits: {self._exits_str}.")
+        sys.stdout.write("\n".join(parts) + "\n")
 
     def remove_tool(self):
         if self.has_tool:
@@ -45,8 +51,10 @@ class Location:
         self.droid_present = present
 
 class DamagedMaintenanceDroid:
-    def __init__(self, blocking):
-        self.blocking  = True
+    __slots__ = ("blocking",)
+
+    def __init__(self, blocking=True):
+        self.blocking = blocking
 
     def repair(self):
         self.blocking = False
@@ -58,4 +66,63 @@ class DamagedMaintenanceDroid:
             return True
         else:
             print("The droid is no longer blocking the way. \n")
-            return False
\ No newline at end of file
+            return False
+
+class Player:
+    __slots__ = ("name", "current_location", "has_tool", "has_crystal", "score", "hazard_count")
+
+    def __init__(self, name, current_location):
+        # A new player always starts empty-handed with no score or hazards
+        self.name = name
+        self.current_location = current_location
+        self.has_tool = False
+        self.has_crystal = False
+        self.score = 0
+        self.hazard_count = 0
+
+    def move(self, direction):
+        # Check if the direction exists in the current location's exits
+        if direction not in self.current_location.exits:
+            return False  # No tangible exit exists
+        # Check if a droid is present and blocking
+        if self.current_location.droid_present:
+            self.hazard_count += 1
+            return False  # Droid is blocking
+        # Move to the new location
+        self.current_location = self.current_location.exits[direction]
+        return True
+        
+    def pick_up_tool(self):
+        if self.current_location.has_tool:
+            self.current_location.has_tool = False
+            self.has_tool = True
+            self.score += 10
+            print(f"You pick up the diagnostic tool. (Score: {self.score} | Hazards: {self.hazard_count})")
+            return True
+        else:
+            print("There is no tool to pick up. \n")
+            return False
+            
+    def use_tool_on_droid(self):
+        if self.has_tool and self.current_location.droid_present:
+            self.current_location.droid.repair()
+            self.current_location.droid_present = False
+            self.score += 20
+            print(f"You use the tool to repair the droid. It moves aside! (Score: {self.score} | Hazards: {self.hazard_count})")
+            return True
+        else:
+            return False
+
+    def pick_up_crystal(self):
+        if self.current_location.has_crystal:
+            self.current_location.has_crystal = False
+            self.has_crystal = True
+            self.score += 50
+            print(f"You pick up the energy crystal. (Score: {self.score} | Hazards: {self.hazard_count})")
+            return True
+        else:
+            print("There is no crystal to pick up. \n")
+            return False
+        
+    def get_status(self):
+        return f"You have {self.score} points, {self.hazard_count} hazards, and are in the {self.current_location.name}."
\ No newline at end of file
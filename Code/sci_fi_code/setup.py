@@ -1,5 +1,5 @@
-import settings, utils
-from settings import Location, DamagedMaintenanceDroid
+import sys
+from settings import Location, DamagedMaintenanceDroid, Player
 from utils import DiagnosticTool, EnergyCrystal
 
 '''
@@ -39,7 +39,7 @@ class GameController:
         diagnostic_tool = DiagnosticTool("Diagnostic Tool", "A device for interfacing with droids.")
         energy_crystal = EnergyCrystal("Energy Crystal", "A glowing, unstable power source.")
         # Instantiate player
-        player = Player(name=input("Enter your name: "), current_location=maint_tunnels, has_tool=False, has_crystal=False, score=0, hazard_count=0)
+        player = Player(name=input("Enter your name: "), current_location=maint_tunnels)
         # Store references
         self.maintanence_tunnels = maint_tunnels
         self.docking_bay = docking_bay
@@ -47,6 +47,17 @@ class GameController:
         self.diagnostic_tool = diagnostic_tool
         self.energy_crystal = energy_crystal
         self.player = player
+        self.last_command = ""
+        # Command map for exact matches, built once; keys are interned so lookups hit the identity fast path
+        self._dispatch = {
+            sys.intern(name): handler for name, handler in (
+                ("pick up tool", self._handle_pick_up_tool),
+                ("use tool", self._handle_use_tool),
+                ("pick up crystal", self._handle_pick_up_crystal),
+                ("status", self._handle_status),
+                ("win", lambda: None),
+            )
+        }
 
     def start_game(self):
         print(f"Welcome to the Sci-Fi Adventure, {self.player.name}!")
@@ -76,22 +87,15 @@ class GameController:
                 break
 
     def process_input(self, command):
-        self.last_command = command
         cmd = command.strip().lower()
+        self.last_command = cmd
         # Handle 'move <direction>' separately
-        if cmd.startswith("move "):
-            direction = cmd[5:].strip()
-            self._handle_move(direction)
+        head, sep, tail = cmd.partition(" ")
+        if head == "move" and sep:
+            # cmd is already stripped, so only extra inner spaces are left to drop
+            self._handle_move(sys.intern(tail.lstrip()))
             return
-        # Command map for exact matches
-        command_map = {
-            "pick up tool": self._handle_pick_up_tool,
-            "use tool": self._handle_use_tool,
-            "pick up crystal": self._handle_pick_up_crystal,
-            "status": self._handle_status,
-            "win": lambda: None
-        }
-        handler = command_map.get(cmd, self._handle_invalid)
+        handler = self._dispatch.get(cmd, self._handle_invalid)
         handler()
 
     def _handle_move(self, direction):
@@ -135,66 +139,10 @@ class GameController:
         if (
             self.player.current_location == self.docking_bay and
             self.player.has_crystal and
-            getattr(self, 'last_command', '').strip().lower() == 'win'
+            self.last_command == "win"
         ):
             self.player.score += 30
             print(f"You escaped the Sci-Fi Station! \n")
             print(f"Mission complete! (Final Score: {self.player.score} | Total Hazards: {self.player.hazard_count})")
             return True
         return False
-    
-class Player:
-    def __init__(self, name, current_location, has_tool, has_crystal, score, hazard_count):
-        self.name = name
-        self.current_location = current_location
-        self.has_tool = False
-        self.has_crystal = False
-        self.score = 0
-        self.hazard_count = 0
-
-    def move(self, direction):
-        # Check if the direction exists in the current location's exits
-        if direction not in self.current_location.exits:
-            return False  # No tangible exit exists
-        # Check if a droid is present and blocking
-        if self.current_location.droid_present:
-            self.hazard_count += 1
-            return False  # Droid is blocking
-        # Move to the new location
-        self.current_location = self.current_location.exits[direction]
-        return True
-        
-    def pick_up_tool(self):
-        if self.current_location.has_tool:
-            self.current_location.has_tool = False
-            self.has_tool = True
-            self.score += 10
-            print(f"You pick up the diagnostic tool. (Score: {self.score} | Hazards: {self.hazard_count})")
-            return True
-        else:
-            print("There is no tool to pick up. \n")
-            return False
-            
-    def use_tool_on_droid(self):
-        if self.has_tool and self.current_location.droid_present:
-            self.current_location.droid.repair()
-            self.current_location.droid_present = False
-            self.score += 20
-            print(f"You use the tool to repair the droid. It moves aside! (Score: {self.score} | Hazards: {self.hazard_count})")
-            return True
-        else:
-            return False
-
-    def pick_up_crystal(self):
-        if self.current_location.has_crystal:
-            self.current_location.has_crystal = False
-            self.has_crystal = True
-            self.score += 50
-            print(f"You pick up the energy crystal. (Score: {self.score} | Hazards: {self.hazard_count})")
-            return True
-        else:
-            print("There is no crystal to pick up. \n")
-            return False
-        
-    def get_status(self):
-        return f"You have {self.score} points, {self.hazard_count} hazards, and are in the {self.current_location.name}."
\ No newline at end of file
@@ -3,6 +3,8 @@ This file contains the StationItem class and its subclasses.
 '''
 
 class StationItem: 
+    __slots__ = ("_name", "_description") # fixed attribute set, no per-instance __dict__
+
     def __init__(self, name, description):
         self._name = name
         self._description = description # protected attributes
@@ -12,6 +14,8 @@ class StationItem:
         # Returns a text description specific to the item. Both subclasses override this.
 
 class DiagnosticTool(StationItem):
+    __slots__ = ()
+
     def __init__(self, name, description):
         super().__init__(name, description) # inherits from StationItem name and description protected attributes
 
@@ -19,6 +23,8 @@ class DiagnosticTool(StationItem):
         print("This diagnostic tool seems designed to interface with maintenance droids. \n")
 
 class EnergyCrystal(StationItem):
+    __slots__ = ()
+
     def __init__(self, name, description):
         super().__init__(name, description)    
 